@@ -5,21 +5,33 @@
 #
 
 import sys
+from pathlib import Path
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.reader import blocks, tokens
 
-def day1_1(file):
-    with open(file, 'r') as f:
-        print(max([sum(map(lambda x: int(x if x else 0), line.split("\n")))
-                   for line in f.read().split("\n\n") if line]))
 
+def parse_mapped(data):
+    # Return the total calories carried by each elf, the calories of an elf are a block of lines
+    # int() doesn't take a memoryview, each token is converted to bytes first
+    return [sum(int(bytes(token)) for token in tokens(block)) for block in blocks(data)]
 
-def day1_2(file):
-    with open(file, 'r') as f:
-        print(sum(sorted([sum(map(lambda x: int(x if x else 0), line.split("\n")))
-                      for line in f.read().split("\n\n") if line])[-3:]))
 
+def parse(text):
+    return parse_mapped(text.encode())
+
+
+def part1(calories):
+    return max(calories)
 
-if __name__ == '__main__':
-    day1_1(sys.argv[1])
-    day1_2(sys.argv[1])
 
+def part2(calories):
+    return sum(sorted(calories)[-3:])
+
+
+if __name__ == '__main__':
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
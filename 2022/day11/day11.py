@@ -4,8 +4,14 @@
 # https://adventofcode.com/2022/day/11
 #
 
+import io
 import sys
 from functools import reduce
+from pathlib import Path
+
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.snapshot import Snapshot
 
 
 class Item:
@@ -52,9 +58,11 @@ class Monkey:
         self.items.clear()
 
 
-def parse_monkeys(file, with_boring=True):
+def parse(text):
+    # Return the description of the monkeys as (monkey_id, starting worry levels, operation, worry_test,
+    # throw_worry_if_true, throw_worry_if_false), the Monkey objects are built by each part since they are modified
     monkeys = []
-    with open(file) as f:
+    with io.StringIO(text) as f:
         while line := f.readline():
             line = line.strip()
             if line.startswith("Monkey "):
@@ -65,7 +73,7 @@ def parse_monkeys(file, with_boring=True):
                     line = line.strip()
                     if line.startswith("Starting items: "):
                         for item in line[16:].split(","):
-                            starting_items.append(Item(int(item.strip())))
+                            starting_items.append(int(item.strip()))
                     elif line.startswith("Operation: new = "):
                         operation = line[17:].replace("old", "{item}")
                     elif line.startswith("Test: divisible by "):
@@ -74,11 +82,20 @@ def parse_monkeys(file, with_boring=True):
                         throw_worry_if_true = int(line[25:])
                     elif line.startswith("If false: throw to monkey "):
                         throw_worry_if_false = int(line[26:])
-                        monkeys.append(Monkey(monkey_id, starting_items, operation, worry_test,
-                                              throw_worry_if_true, throw_worry_if_false, with_boring))
+                        monkeys.append((monkey_id, starting_items, operation, worry_test,
+                                        throw_worry_if_true, throw_worry_if_false))
                     else:
                         break
 
+    return monkeys
+
+
+def build_monkeys(descriptions, with_boring=True):
+    monkeys = []
+    for monkey_id, starting_items, operation, worry_test, throw_worry_if_true, throw_worry_if_false in descriptions:
+        monkeys.append(Monkey(monkey_id, [Item(worry_level) for worry_level in starting_items], operation, worry_test,
+                              throw_worry_if_true, throw_worry_if_false, with_boring))
+
     for monkey in monkeys:
         monkey.monkey_throw_worry_if_true =\
             [m for m in monkeys if m.monkey_id == monkey.throw_worry_if_true][0]
@@ -88,31 +105,59 @@ def parse_monkeys(file, with_boring=True):
     return monkeys
 
 
-def day11_1(file):
-    monkeys = parse_monkeys(file, with_boring=True)
+def save_monkeys(snapshot, monkeys, next_round):
+    # The worry levels are saved modulo fix_worry, the next inspection would apply it first anyway
+    snapshot.save(next_round=next_round, inspected=[m.inspected for m in monkeys],
+                  nb_items=[len(m.items) for m in monkeys],
+                  worry_levels=[item.worry_level % m.fix_worry for m in monkeys for item in m.items])
+
+
+def restore_monkeys(monkeys, state):
+    # Return the round to start from
+    worry_levels = iter(state["worry_levels"].tolist())
+    for monkey, inspected, nb_items in zip(monkeys, state["inspected"].tolist(), state["nb_items"].tolist()):
+        monkey.inspected = inspected
+        monkey.items = [Item(next(worry_levels)) for _ in range(nb_items)]
+
+    return int(state["next_round"])
+
+
+def part1(descriptions):
+    monkeys = build_monkeys(descriptions, with_boring=True)
 
     for _ in range(20):
         for monkey in monkeys:
             monkey.inspect()
 
-    print(reduce((lambda x, y: x * y), sorted([m.inspected for m in monkeys], reverse=True)[:2]))
+    return reduce((lambda x, y: x * y), sorted([m.inspected for m in monkeys], reverse=True)[:2])
 
 
-def day11_2(file):
-    monkeys = parse_monkeys(file, with_boring=False)
+def part2(descriptions):
+    monkeys = build_monkeys(descriptions, with_boring=False)
 
     fix_worry = reduce((lambda x, y: x * y), [m.worry_test for m in monkeys])
     for monkey in monkeys:
         monkey.fix_worry = fix_worry
 
-    for _ in range(10000):
+    # The worry levels are below fix_worry in the snapshots, they must fit in 64-bit integers
+    snapshot = Snapshot("rounds", enabled=fix_worry < 2**63)
+    first_round = 0
+    if (state := snapshot.restore()) is not None:
+        first_round = restore_monkeys(monkeys, state)
+
+    for n in range(first_round, 10000):
         for monkey in monkeys:
             monkey.inspect()
+        if snapshot.due():
+            save_monkeys(snapshot, monkeys, n + 1)
+    snapshot.discard()
 
-    print(reduce((lambda x, y: x * y), sorted([m.inspected for m in monkeys], reverse=True)[:2]))
+    return reduce((lambda x, y: x * y), sorted([m.inspected for m in monkeys], reverse=True)[:2])
 
 
 if __name__ == '__main__':
-    day11_1(sys.argv[1])
-    day11_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
@@ -27,11 +27,23 @@ a vertex for every position that has a height at least one lower than the curren
 We run the Dijkstra's algorithm with this graph from the end position, and return the shortest distance found from
 all positions which has a height a (or 1 numerically).
 
+The reference Dijkstra's algorithm looks for the closest node by scanning all the remaining ones, the heap engine keeps
+the candidates in a priority queue instead (python -m aoc run 2022 12 --engine heap).
+
 """
 
+import heapq
+import string
 import sys
+from pathlib import Path
+
 import numpy as np
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.engines import dispatch
+from aoc.grid import parse_grid, translation_table
+
 
 def chr2level(ch):
     # Convert each height letter to a numerical value, like mentioned above.
@@ -43,6 +55,7 @@ def chr2level(ch):
         return ord(ch) - ord('a') + 1
 
 
+@dispatch
 def dijkstra(graph, start):
     # The Dijkstra's algorithm
 
@@ -64,6 +77,31 @@ def dijkstra(graph, start):
     return dist
 
 
+@dijkstra.engine("heap")
+def dijkstra_heap(graph, start):
+    # The Dijkstra's algorithm with a priority queue, the closest node is popped from the heap instead of being searched
+    # among all the remaining nodes. A node may be pushed several times, only its first pop (the shortest distance) is
+    # processed
+    dist = {node: float('infinity') for node in graph}
+    dist[start] = 0
+    queue = [(0, start)]
+    visited = set()
+
+    while queue:
+        d, u = heapq.heappop(queue)
+        if u in visited:
+            continue
+        visited.add(u)
+
+        # Update distances of neighbour nodes
+        for v in graph[u]:
+            if dist[v] > d + 1:
+                dist[v] = d + 1
+                heapq.heappush(queue, (d + 1, v))
+
+    return dist
+
+
 def find_best_distance_to_end(grid, start, end):
     # Initialize a dict graph
     graph = {}
@@ -108,35 +146,20 @@ def get_best_distance_from_a(grid, end):
     return min([dist[d] for d in dist if d[2] == chr2level('a')])
 
 
-def parse_heightmap(file):
-    # First parse to find the size of the heightmap
-    with open(file) as f:
-        size_x, size_y = 0, 0
-
-        for line in f:
-            size_x = max(size_x, len(line.rstrip()))
-            size_y += 1
-
-    # Initialize the array
-    grid = np.ndarray((size_x, size_y), dtype=int)
-    start_coord = None
-    end_coord = None
+def parse(text):
+    # Load the heightmap in a single pass, the characters are converted to their numerical value like mentioned above
+    # We use signed values, because we will subtract 1 from the heights in part 2
+    chars = parse_grid(text)
+    levels = translation_table({ch: chr2level(ch) for ch in "SE" + string.ascii_lowercase}, dtype=np.int8)
 
-    # Second parse to fill the array
-    with open(file) as f:
-        y = 0
-        for line in f:
-            line = line.rstrip()
-            grid[:, y] = [chr2level(x) for x in line]
+    # The grid is indexed by (x, y)
+    grid = levels[chars].T
 
-            # Note the current and end position
-            if line.find("S") >= 0:
-                start_coord = (line.find('S'), y)
-            if line.find("E") >= 0:
-                end_coord = (line.find('E'), y)
-            y += 1
+    # Note the current and end position
+    start_y, start_x = np.argwhere(chars == ord('S'))[0]
+    end_y, end_x = np.argwhere(chars == ord('E'))[0]
 
-    return grid, start_coord, end_coord
+    return grid, (int(start_x), int(start_y)), (int(end_x), int(end_y))
 
 
 def display_heightmap(grid):
@@ -145,19 +168,21 @@ def display_heightmap(grid):
         print(" ".join([f"{grid[x, y]:02}" for x in range(grid.shape[0])]))
 
 
-def day12_1(file):
-    grid, start_coord, end_coord = parse_heightmap(file)
-    print(find_best_distance_to_end(grid, start_coord, end_coord))
+def part1(heightmap):
+    grid, start_coord, end_coord = heightmap
+    return find_best_distance_to_end(grid, start_coord, end_coord)
 
 
-def day12_2(file):
-    grid, start_coord, end_coord = parse_heightmap(file)
+def part2(heightmap):
+    grid, start_coord, end_coord = heightmap
     # We keep track of the height on the nodes
     end_coord = (end_coord[0], end_coord[1], chr2level('E'))
-    print(get_best_distance_from_a(grid, end_coord))
+    return get_best_distance_from_a(grid, end_coord)
 
 
 if __name__ == '__main__':
-    day12_1(sys.argv[1])
-    day12_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
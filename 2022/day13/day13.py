@@ -28,34 +28,21 @@ def compare(value1, value2):
     return 0
 
 
-def day13_1(file):
-    with open(file) as f:
-        sum_indexes = 0
-        index = 1
-        packet1 = packet2 = None
-
-        for line in f:
-            if not line.strip():
-                continue
-            if packet1 is None:
-                packet1 = eval(line)
-            elif packet2 is None:
-                packet2 = eval(line)
-                if compare(packet1, packet2) == -1:
-                    sum_indexes += index
-
-                packet1 = packet2 = None
-                index += 1
-
-    print(sum_indexes)
-
-
-def day13_2(file):
-    with open(file) as f:
-        packets = []
-        for line in f:
-            if line.strip():
-                packets.append(eval(line.strip()))
+def parse(text):
+    # Return the list of packets, the blank lines between the pairs are ignored
+    return [eval(line.strip()) for line in text.splitlines() if line.strip()]
+
+
+def part1(packets):
+    sum_indexes = 0
+    for index in range(1, len(packets) // 2 + 1):
+        if compare(packets[2 * index - 2], packets[2 * index - 1]) == -1:
+            sum_indexes += index
+
+    return sum_indexes
+
+
+def part2(packets):
     packets = sorted(packets, key=functools.cmp_to_key(compare))
 
     divisors = [[[2]], [[6]]]
@@ -70,9 +57,11 @@ def day13_2(file):
         if offset_divisor >= len(divisors):
             break
 
-    print(decoder_key)
+    return decoder_key
 
 
 if __name__ == '__main__':
-    day13_1(sys.argv[1])
-    day13_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
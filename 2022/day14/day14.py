@@ -5,8 +5,15 @@
 #
 
 import sys
+from pathlib import Path
+
 import numpy as np
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import counters, jit
+from aoc.engines import dispatch
+
 CELL_AIR = 0
 CELL_WALL = 1
 CELL_SAND = 2
@@ -22,7 +29,7 @@ def symbol(cell):
 
 def display_grid(grid, offset_x=0, offset_y=0):
     for y in range(offset_y, grid.shape[1]):
-        print(''.join([symbol(grid[x][y]) for x in range(offset_x, grid.shape[0])]))
+        print(''.join([symbol(grid[x, y]) for x in range(offset_x, grid.shape[0])]))
 
 
 def xrange(start, end):
@@ -33,34 +40,39 @@ def xrange(start, end):
         return range(start, end + 1)
 
 
-def parse_paths(file, add_floor=False):
-    with open(file) as f:
-        line_paths = []
-        for line in f:
-            line_paths.append([tuple([int(y) for y in x.split(",")]) for x in line.strip().split(" -> ")])
+def parse(text):
+    # Return the grid of the cave without its floor, an empty row is kept at its bottom for the floor
+    line_paths = []
+    for line in text.splitlines():
+        line_paths.append([tuple([int(y) for y in x.split(",")]) for x in line.strip().split(" -> ")])
 
     max_x = max([y[0] for x in line_paths for y in x])
     max_y = max([y[1] for x in line_paths for y in x])
-    grid = np.zeros((max_x + max_y + 2, max_y + 3), dtype=int)
+    # The grid is indexed by (x, y) in C order: the sand falls along the y-axis, so the cells below a grain of sand
+    # are contiguous in memory
+    grid = np.zeros((max_x + max_y + 2, max_y + 3), dtype=np.uint8)
 
     for path in line_paths:
         for x in range(len(path) - 1):
             if path[x][0] == path[x + 1][0]:
                 for i in xrange(path[x][1], path[x + 1][1]):
-                    grid[path[x][0]][i] = CELL_WALL
+                    grid[path[x][0], i] = CELL_WALL
             elif path[x][1] == path[x + 1][1]:
                 for i in xrange(path[x][0], path[x + 1][0]):
-                    grid[i][path[x][1]] = CELL_WALL
+                    grid[i, path[x][1]] = CELL_WALL
 
-    grid[POUR_X][0] = CELL_POUR
-
-    if add_floor:
-        for x in range(grid.shape[0]):
-            grid[x][max_y + 2] = CELL_WALL
+    grid[POUR_X, 0] = CELL_POUR
 
     return grid
 
 
+def add_floor(grid):
+    # The floor is the bottom row of the grid
+    for x in range(grid.shape[0]):
+        grid[x, grid.shape[1] - 1] = CELL_WALL
+
+
+@dispatch
 def pour_sand(grid, return_blocked=False):
     sand_offset_x, sand_offset_y = POUR_X, POUR_Y
     in_void = False
@@ -71,17 +83,17 @@ def pour_sand(grid, return_blocked=False):
             in_void = True
             break
 
-        if grid[sand_offset_x][sand_offset_y + 1] == CELL_AIR:
+        if grid[sand_offset_x, sand_offset_y + 1] == CELL_AIR:
             sand_offset_y += 1
         else:
-            if grid[sand_offset_x - 1][sand_offset_y + 1] == CELL_AIR:
+            if grid[sand_offset_x - 1, sand_offset_y + 1] == CELL_AIR:
                 sand_offset_x -= 1
                 sand_offset_y += 1
-            elif grid[sand_offset_x + 1][sand_offset_y + 1] == CELL_AIR:
+            elif grid[sand_offset_x + 1, sand_offset_y + 1] == CELL_AIR:
                 sand_offset_x += 1
                 sand_offset_y += 1
             else:
-                grid[sand_offset_x][sand_offset_y] = CELL_SAND
+                grid[sand_offset_x, sand_offset_y] = CELL_SAND
                 if sand_offset_x == POUR_X and sand_offset_y == POUR_Y:
                     blocked = True
                 break
@@ -92,29 +104,40 @@ def pour_sand(grid, return_blocked=False):
         return in_void
 
 
-def day14_1(file):
-    grid = parse_paths(file)
+# pour_sand() only uses integers and an array, numba compiles it as it is
+jit.compile_reference(pour_sand)
+
+
+def part1(cave):
+    # The sand is poured in a copy of the cave, so that the parsed one remains unchanged
+    grid = np.copy(cave)
 
     pours = 0
     while not pour_sand(grid):
         pours += 1
+    # The last grain poured fell into the void
+    counters.add("grains poured", pours + 1)
 
     #display_grid(grid, offsetx=440)
-    print(pours)
+    return pours
 
 
-def day14_2(file):
-    grid = parse_paths(file, add_floor=True)
+def part2(cave):
+    grid = np.copy(cave)
+    add_floor(grid)
 
     pours = 0
     while not pour_sand(grid, return_blocked=True):
         pours += 1
+    counters.add("grains poured", pours + 1)
 
     #display_grid(grid, offsetx=460)
-    print(pours + 1)
+    return pours + 1
 
 
 if __name__ == '__main__':
-    day14_1(sys.argv[1])
-    day14_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
@@ -5,19 +5,25 @@
 #
 
 import sys
-import re
+from pathlib import Path
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.intervals import IntervalSet
+from aoc.log import get_logger
+from aoc.numbers import parse_ints
 
-def read_sensors(file):
-    # REad all sensors information and insert into in a list
-    sensors = []
-    with open(file) as f:
-        for line in f:
-            if m := re.match(r'Sensor at x=([-\d]+), y=([-\d]+): closest beacon is at x=([-\d]+), y=([-\d]+)',
-                             line.strip()):
-                sensors.append(tuple([int(x) for x in list(m.groups())]))
+log = get_logger(__name__)
 
-    return sensors
+# Row scanned by part 1: the row of the puzzle, or the row of its example
+LINE_NO = 2_000_000
+EXAMPLE_LINE_NO = 10
+
+
+def parse(text):
+    # Read all sensors information into a list of (sensor x, sensor y, beacon x, beacon y), each line gives the 4
+    # integers of a sensor
+    return [tuple(sensor) for sensor in parse_ints(text).reshape(-1, 4).tolist()]
 
 
 def get_manhattan_distance(s):
@@ -110,32 +116,46 @@ def crop_area(points, boundary):
         points))
 
 
-def day15_1(file, line_no=10):
-    sensors = read_sensors(file)
+def scanned_line_no(sensors):
+    # The example is told apart from the puzzle inputs by its sensors, which all lie in its search area (0 to 20)
+    if all(0 <= s[0] <= 20 and 0 <= s[1] <= 20 for s in sensors):
+        return EXAMPLE_LINE_NO
+    return LINE_NO
+
+
+def part1(sensors, line_no=None):
+    if line_no is None:
+        line_no = scanned_line_no(sensors)
+
     # Find the boundaries of all sensors including their area. With this information we have a range
     # of coordinates to work with
     boundary = get_sensors_boundary(sensors, with_md=True)
-    print("Sensors boundary with manhattan distance:", boundary)
+    log.info("Sensors boundary with manhattan distance: %s", boundary)
 
     # Get the beacon coordinates to delete them because beacons do not count on the result
     beacons = list(set([(s[2], s[3]) for s in sensors]))
-    print("Unique beacon:", len(beacons))
+    log.info("Unique beacon: %d", len(beacons))
     # Find the number of beacon located on the considered line
     beacons_line_no = len(list(filter(lambda b: b[1] == line_no, beacons)))
-    print(f"Unique beacon at line {line_no}:", beacons_line_no)
+    log.info("Unique beacon at line %d: %d", line_no, beacons_line_no)
 
-    # Get the number of points covered by all sensors
-    cell_covered = len(list(filter(lambda x: is_covered((x, line_no), sensors),
-                                   list(range(boundary[0], boundary[1] + 1)))))
+    # Get the number of points covered by all sensors: the area of a sensor crosses the line on the cells
+    # at a distance up to its Manhattan distance minus the distance to the line, the union of these ranges is the
+    # part of the line covered
+    covered = IntervalSet()
+    for s in sensors:
+        reach = get_manhattan_distance(s) - abs(s[1] - line_no)
+        if reach >= 0:
+            covered |= IntervalSet([s[0] - reach], [s[0] + reach + 1])
+    cell_covered = covered.length
 
     # Returns this number without the number of beacon found previously
-    print(cell_covered - beacons_line_no)
+    return cell_covered - beacons_line_no
 
 
-def day15_2(file):
-    sensors = read_sensors(file)
+def part2(sensors):
     boundary = get_sensors_boundary(sensors)
-    print("Sensors boundary:", boundary)
+    log.info("Sensors boundary: %s", boundary)
 
     # The part2 is trickier, we need to find a single point not covered by any sensor.
     # The problem is that the grid is far too big, we cannot work with a numpy array because it would require
@@ -152,23 +172,23 @@ def day15_2(file):
     points = []
     for i in range(len(sensors)):
         s = sensors[i]
-        print("Processing sensor:", s, "manhattan distance: ", get_manhattan_distance(s),
-              f"(+{(get_manhattan_distance(s) + 1) * 4})")
+        log.debug("Processing sensor: %s manhattan distance: %d", s, get_manhattan_distance(s))
         points.extend(add_sensor_edges(s))
-        print("Points nb:", len(points))
-        print("")
+        log.debug("Points nb: %d", len(points))
 
     pe = len(points)
     points = clean_edges(points, sensors[:i + 1])
-    print("Cleaned Points nb:", len(points), f"({len(points) - pe})")
+    log.info("Cleaned Points nb: %d (%d)", len(points), len(points) - pe)
     points = crop_area(points, boundary)
-    print("Cropped Points nb:", len(points), len(set(points)))
+    log.info("Cropped Points nb: %d %d", len(points), len(set(points)))
 
     tuning_freq = list(set(points))[0][0] * 4_000_000 + list(set(points))[0][1]
-    print(tuning_freq)
+    return tuning_freq
 
 
 if __name__ == '__main__':
-    day15_1(sys.argv[1], line_no=2_000_000)
-    day15_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
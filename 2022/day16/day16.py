@@ -6,9 +6,16 @@
 
 import sys
 import re
-import numpy as np
+from pathlib import Path
 from queue import Queue
 
+import numpy as np
+
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import counters
+from aoc.cache import cached_array
+
 
 class Valve:
     def __init__(self, name, flow_rate=0):
@@ -86,18 +93,17 @@ class Bot:
             return self.released_pressure, []
 
 
-def parse_valves(file):
-    # Parse values from input file
+def parse_valves(text):
+    # Parse values from input text
     valves = {}
     valves_index = []
-    with open(file) as f:
-        for line in f:
-            if m := re.match(r'^Valve (\w+) has flow rate=(\d+); tunnels? leads? to valves? (.+)$',
-                             line.strip()):
-                # (flow_rate, open_status, [connected vales ...])
-                valves[m.group(1)] = Valve(m.group(1), int(m.group(2)))
-                valves[m.group(1)].target_valve_names = [x.strip() for x in m.group(3).split(",")]
-                valves_index.append(m.group(1))
+    for line in text.splitlines():
+        if m := re.match(r'^Valve (\w+) has flow rate=(\d+); tunnels? leads? to valves? (.+)$',
+                         line.strip()):
+            # (flow_rate, open_status, [connected vales ...])
+            valves[m.group(1)] = Valve(m.group(1), int(m.group(2)))
+            valves[m.group(1)].target_valve_names = [x.strip() for x in m.group(3).split(",")]
+            valves_index.append(m.group(1))
 
     return valves, valves_index
 
@@ -123,9 +129,8 @@ def graph_to_matrix(valves, valves_index):
     return matrix
 
 
-def floyd_warshall(valves, valves_index):
+def floyd_warshall(matrix):
     # Implement the Floyd-Warshall algorithm to get all shortest distance between two nodes
-    matrix = graph_to_matrix(valves, valves_index)
     size = len(matrix)
 
     # Create the distances matrix and fill it with "infinity" value
@@ -153,12 +158,20 @@ def floyd_warshall(valves, valves_index):
     return distances
 
 
-def run(file, part2=False):
-    # Get the valve dict from input file and index for converting valve name to index number and vice versa
+def parse(text):
+    # Get the valve dict from input text and index for converting valve name to index number and vice versa
     # (will be useful for the distance matrix after)
-    valves, valves_index = parse_valves(file)
-    # Get the distance matrix
-    distances = floyd_warshall(valves, valves_index)
+    valves, valves_index = parse_valves(text)
+    # Get the distance matrix, it depends only on the graph of the tunnels, so both parts share it and it can be kept
+    # in the derived arrays cache
+    matrix = graph_to_matrix(valves, valves_index)
+    distances = cached_array("floyd_warshall", lambda: floyd_warshall(matrix), matrix)
+
+    return valves, valves_index, distances
+
+
+def run(network, part2=False):
+    valves, valves_index, distances = network
 
     queue = Queue()
     # Create an initial bot that starts at the "AA" valve and put it into a queue
@@ -173,9 +186,11 @@ def run(file, part2=False):
     queue.put(starting_bot)
 
     final_results = []
+    nb_bots = 0
     while not queue.empty():
         # Get a bot
         bot = queue.get()
+        nb_bots += 1
         # Run a bot from the queue and get its returns
         released_pressure, other_bots = bot.go_through()
 
@@ -191,6 +206,8 @@ def run(file, part2=False):
         for b in other_bots:
             queue.put(b)
 
+    counters.add("bots run", nb_bots)
+
     if part2:
         # For the part2, I considered there is no need to complicate the bot algorithm to simulate the elephant.
         # I assumed that you and the elephant have no influence to each others during your travelling and follow
@@ -199,6 +216,7 @@ def run(file, part2=False):
         # all couples of paths that don't have any valve in common in them. These couples are not necessarily the
         # solution but mean that the best released pressure are among them.
         final_results2 = []
+        counters.add("path pairs compared", len(final_results) ** 2)
         for fr1 in final_results:
             for fr2 in final_results:
                 # Compare the valves of the 2 lists, their intersection must be an empty set
@@ -206,22 +224,24 @@ def run(file, part2=False):
                     # When found, add the 2 released pressures and store the result
                     final_results2.append(fr1[1] + fr2[1])
 
-        # Print the best released pressure
-        print(max(final_results2))
+        # Return the best released pressure
+        return max(final_results2)
 
     else:
-        # Print the best released pressure
-        print(max(final_results))
+        # Return the best released pressure
+        return max(final_results)
 
 
-def day16_1(file):
-    run(file)
+def part1(network):
+    return run(network)
 
 
-def day16_2(file):
-    run(file, part2=True)
+def part2(network):
+    return run(network, part2=True)
 
 
 if __name__ == '__main__':
-    day16_1(sys.argv[1])
-    day16_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
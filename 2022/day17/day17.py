@@ -5,13 +5,49 @@
 #
 
 import sys
+from pathlib import Path
+
 import numpy as np
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import jit
+from aoc.engines import dispatch
+from aoc.snapshot import Snapshot
+
 
 class Rock:
     def __init__(self, cells):
         self.cells = cells
         self.shape = (max([c[0] for c in cells]) + 1, max([c[1] for c in cells]) + 1)
+        # The cells as an array, for the compiled kernels
+        self.cell_array = np.array(cells, dtype=np.int64)
+
+
+@jit.kernel
+def blow_and_fall(grid, cells, x, y, direction, frozen):
+    # Kernel of Chamber.blow_and_fall_rock() for numba, the rock is at (x, y) and direction is -1 or 1
+    # Return the new position of the rock and whether it could fall
+    can_move = True
+    for i in range(cells.shape[0]):
+        new_x = x + cells[i, 0] + direction
+        if new_x < 0 or new_x >= grid.shape[0] or grid[new_x, y + cells[i, 1]] == frozen:
+            can_move = False
+            break
+
+    if can_move:
+        x += direction
+
+    can_fall = True
+    for i in range(cells.shape[0]):
+        if grid[x + cells[i, 0], y + cells[i, 1] - 1] == frozen:
+            can_fall = False
+            break
+
+    if can_fall:
+        y -= 1
+
+    return x, y, can_fall
 
 
 class Chamber:
@@ -37,19 +73,20 @@ class Chamber:
 
     def _init_grid(self):
         # Init grid and fill it with void
-        self.grid = np.ndarray((7, 50000), dtype=int)
-        self.grid.fill(self.CELL_VOID)
+        # The grid is indexed by (x, y) in Fortran order, so the 7 cells of a row are contiguous in memory
+        self.grid = np.full((7, 50000), self.CELL_VOID, dtype=np.uint8, order='F')
 
         # Fill the ground (at y=0) with a bedrock of frozen rock to help the falling algorithm
         # This explains why the max height is set to 1
         for x in range(self.grid.shape[0]):
-            self.grid[x][0] = self.CELL_FROZEN_ROCK
+            self.grid[x, 0] = self.CELL_FROZEN_ROCK
 
     def add_rock(self, rock):
         # Add new rock and set its coordinates two units away from the left and three units above the highest rock
         self.rock = rock
         self.rock_coords = [2, self.max_height + 3]
 
+    @dispatch
     def blow_and_fall_rock(self, direction):
         # Move the rock according to jet and try to fall it down
         # Convert the jet direction symbol (< or >) to "vector" direction
@@ -61,7 +98,7 @@ class Chamber:
             new_x = self.rock_coords[0] + c[0] + direction
             # The rock cannot move through the walls, floor, or a frozen rock
             if new_x < 0 or new_x >= self.grid.shape[0]\
-                    or self.grid[new_x][self.rock_coords[1] + c[1]] == self.CELL_FROZEN_ROCK:
+                    or self.grid[new_x, self.rock_coords[1] + c[1]] == self.CELL_FROZEN_ROCK:
                 can_move = False
                 break
 
@@ -73,7 +110,7 @@ class Chamber:
         can_fall = True
         for c in self.rock.cells:
             # Space behind the rock must be void
-            if self.grid[self.rock_coords[0] + c[0]][self.rock_coords[1] + c[1] - 1]\
+            if self.grid[self.rock_coords[0] + c[0], self.rock_coords[1] + c[1] - 1]\
                     == self.CELL_FROZEN_ROCK:
                 can_fall = False
                 break
@@ -84,12 +121,21 @@ class Chamber:
 
         return can_fall
 
+    @jit.engine(blow_and_fall_rock)
+    def blow_and_fall_rock_jit(self, direction):
+        # Same moves, on the arrays of the grid and of the rock
+        self.rock_coords[0], self.rock_coords[1], can_fall = blow_and_fall(
+            self.grid, self.rock.cell_array, self.rock_coords[0], self.rock_coords[1], -1 if direction == "<" else 1,
+            self.CELL_FROZEN_ROCK)
+
+        return can_fall
+
     def freeze_rock(self):
         # Freeze a falling rock when it cannot move downward
         for c in self.rock.cells:
             new_x = self.rock_coords[0] + c[0]
             new_y = self.rock_coords[1] + c[1]
-            self.grid[new_x][new_y] = self.CELL_FROZEN_ROCK
+            self.grid[new_x, new_y] = self.CELL_FROZEN_ROCK
 
         # Update the max height depending on where the rock has fallen
         if self.rock_coords[1] > self.max_height:
@@ -103,21 +149,25 @@ class Chamber:
 
     def display_chamber(self, lines=25):
         # Display grid (for debugging purpose only)
-        display_grid = self.grid.copy()
+        display_grid = np.copy(self.grid)
 
         if self.rock:
             for c in self.rock.cells:
-                display_grid[self.rock_coords[0] + c[0]][self.rock_coords[1] + c[1]]\
+                display_grid[self.rock_coords[0] + c[0], self.rock_coords[1] + c[1]]\
                     = self.CELL_FALLING_ROCK
 
         for y in range(min(self.max_height + 2, display_grid.shape[1]),
                        max(-1, self.max_height - lines + 2), -1):
-            print("|" + "".join([self.CHAMBER_SYMBOLS[display_grid[x][y]]
+            print("|" + "".join([self.CHAMBER_SYMBOLS[display_grid[x, y]]
                                  for x in range(display_grid.shape[0])]) + "| " + str(y))
 
         print("max height:", self.max_height - 1)
         print("")
 
+    def frozen_rows(self):
+        # Rows of the grid up to the highest frozen rock, the ones above are void
+        return self.grid[:, :np.flatnonzero(self.grid.any(axis=0))[-1] + 1]
+
     def run(self, part2=False):
         # Incrementation index to rotate over rocks and jet patterns
         rock_index = 0
@@ -130,6 +180,14 @@ class Chamber:
         initial_height = 0
         initial_rock = 0
 
+        # Resume from the last snapshot of an interrupted run, if any
+        snapshot = Snapshot("rocks")
+        if (state := snapshot.restore()) is not None:
+            (rock_index, jet_patterns_index, self.max_height, max_height, record_pattern, initial_height,
+             initial_rock) = state["counters"].tolist()
+            max_heights_pattern = state["max_heights_pattern"].tolist()
+            self.grid[:, :state["grid"].shape[1]] = state["grid"]
+
         while rock_index < self.max_rocks or part2:
             # We add new rock
             self.add_rock(self.rocks[rock_index % len(self.rocks)])
@@ -180,6 +238,12 @@ class Chamber:
             rock_index += 1
             jet_patterns_index += 1
 
+            if snapshot.due():
+                snapshot.save(counters=[rock_index, jet_patterns_index, self.max_height, max_height, record_pattern,
+                                        initial_height, initial_rock],
+                              max_heights_pattern=max_heights_pattern, grid=self.frozen_rows())
+        snapshot.discard()
+
         # In both case, returns the height minus 1 because we added a bedrock layer
         if part2:
             # Calculate the quotient which we be the number of total cycles
@@ -204,27 +268,28 @@ def init_rocks():
     ]
 
 
-def day17_1(file):
-    with open(file) as f:
-        jet_patterns = list(f.readline().strip())
+def parse(text):
+    # The jet patterns are given on the first line
+    return list(text.split("\n", 1)[0].strip())
 
+
+def part1(jet_patterns):
     rocks = init_rocks()
     chamber = Chamber(rocks, jet_patterns, 2022)
 
-    print(chamber.run())
+    return chamber.run()
     #chamber.display_chamber(lines=25)
 
 
-def day17_2(file):
-    with open(file) as f:
-        jet_patterns = list(f.readline().strip())
-
+def part2(jet_patterns):
     rocks = init_rocks()
     chamber = Chamber(rocks, jet_patterns, 1_000_000_000_000)
 
-    print(chamber.run(part2=True))
+    return chamber.run(part2=True)
 
 
 if __name__ == '__main__':
-    day17_1(sys.argv[1])
-    day17_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
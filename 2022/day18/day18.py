@@ -5,8 +5,13 @@
 #
 
 import sys
+from pathlib import Path
+
 import numpy as np
-from queue import Queue
+
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.bfs import flood_fill, to_mask
 
 CELL_AIR = 0
 CELL_LAVA = 1
@@ -23,62 +28,35 @@ def display_slice(grid):
 
 def fill_exterior(grid):
     # Only for part2, mark cell filled by air and mark them as exterior air (CELL_EXT_AIR value)
-    queue = Queue()
-
-    # We process each cell recursively, but we use the queue method to avoid a stack overflow
-    # Start at cell [0, 0, 0] which won't be a lava cell (thanks the air "shell" added)
-    queue.put((0, 0, 0))
-
-    # Get a cell until the queue is exhausted
-    while not queue.empty():
-        coord = queue.get()
-
-        # If this cell is an air cell, mark it as exterior air
-        if grid[coord[0]][coord[1]][coord[2]] == CELL_AIR:
-            grid[coord[0]][coord[1]][coord[2]] = CELL_EXT_AIR
-
-            # Add all neighbor cells to the queue in all 3 axis (up, down, front, back, left, right)
-            if coord[0] + 1 < grid.shape[0]:
-                queue.put((coord[0] + 1, coord[1], coord[2]))
-            if coord[0] - 1 < grid.shape[0]:
-                queue.put((coord[0] - 1, coord[1], coord[2]))
-
-            if coord[1] + 1 < grid.shape[1]:
-                queue.put((coord[0], coord[1] + 1, coord[2]))
-            if coord[1] - 1 < grid.shape[1]:
-                queue.put((coord[0], coord[1] - 1, coord[2]))
-
-            if coord[2] + 1 < grid.shape[2]:
-                queue.put((coord[0], coord[1], coord[2] + 1))
-            if coord[2] - 1 < grid.shape[2]:
-                queue.put((coord[0], coord[1], coord[2] - 1))
-
-
-def parse_coords(file):
-    # Parse cubes coordinates from file and insert in a list of tuples
-    with open(file) as f:
-        coords = []
-        for line in f:
-            coord_x, coord_y, coord_z = [int(x) for x in line.strip().split(',')]
-            coords.append((coord_x, coord_y, coord_z))
-
-        # Prepare a grid from this list, but before, find the max values (there are no negative values) for the 3
-        # dimensions and add 4 in order to enclose the lava droplet into an air "shell". This simplifies the surface
-        # area algorithm by avoid special cases related to the border and index in the grid. This "shell" also
-        # ensure that the cell at [0, 0, 0] won't be a lava cell which will be important for fill algorithm used
-        # in part2.
-        max_x, max_y, max_z = max([c[0] for c in coords]) + 4, \
-                               max([c[1] for c in coords]) + 4, \
-                               max([c[2] for c in coords]) + 4
+    # The exterior air is all the air reachable from the cell [0, 0, 0] which won't be a lava cell (thanks the air
+    # "shell" added)
+    grid[flood_fill(to_mask(grid.shape, [(0, 0, 0)]), grid == CELL_AIR)] = CELL_EXT_AIR
+
+
+def parse(text):
+    # Parse cubes coordinates from the input and insert in a list of tuples
+    coords = []
+    for line in text.splitlines():
+        coord_x, coord_y, coord_z = [int(x) for x in line.strip().split(',')]
+        coords.append((coord_x, coord_y, coord_z))
+
+    # Prepare a grid from this list, but before, find the max values (there are no negative values) for the 3
+    # dimensions and add 4 in order to enclose the lava droplet into an air "shell". This simplifies the surface
+    # area algorithm by avoid special cases related to the border and index in the grid. This "shell" also
+    # ensure that the cell at [0, 0, 0] won't be a lava cell which will be important for fill algorithm used
+    # in part2.
+    max_x, max_y, max_z = max([c[0] for c in coords]) + 4, \
+                           max([c[1] for c in coords]) + 4, \
+                           max([c[2] for c in coords]) + 4
 
     # Create the grid and fill it with air
-    grid = np.ndarray((max_x, max_y, max_z), dtype=int)
-    grid.fill(CELL_AIR)
+    # We use signed values, because the surface area is computed from the differences between the cells
+    grid = np.full((max_x, max_y, max_z), CELL_AIR, dtype=np.int8)
 
     # Insert the droplet coordinates
     for coord in coords:
         # We add 2 to the coordinates for the air "shell"
-        grid[coord[0] + 2][coord[1] + 2][coord[2] + 2] = CELL_LAVA
+        grid[coord[0] + 2, coord[1] + 2, coord[2] + 2] = CELL_LAVA
 
     return grid
 
@@ -105,17 +83,19 @@ def find_surface_area(grid, value):
     return surface
 
 
-def day18_1(file):
-    lava_grid = parse_coords(file)
-    print(find_surface_area(lava_grid, abs(CELL_AIR - CELL_LAVA)))
+def part1(lava_grid):
+    return find_surface_area(lava_grid, abs(CELL_AIR - CELL_LAVA))
 
 
-def day18_2(file):
-    lava_grid = parse_coords(file)
+def part2(lava_grid):
+    # The exterior is filled in a copy of the grid, so that the parsed one remains unchanged
+    lava_grid = np.copy(lava_grid)
     fill_exterior(lava_grid)
-    print(find_surface_area(lava_grid, abs(CELL_EXT_AIR - CELL_LAVA)))
+    return find_surface_area(lava_grid, abs(CELL_EXT_AIR - CELL_LAVA))
 
 
 if __name__ == '__main__':
-    day18_1(sys.argv[1])
-    day18_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
@@ -83,11 +83,17 @@ previous step. For example, for ore robots:
 
 import sys
 import re
-from cvxopt.glpk import ilp
-from cvxopt import matrix
-
+from pathlib import Path
 from typing import List
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import counters
+from aoc.log import get_logger
+from aoc.reader import tokens
+
+log = get_logger(__name__)
+
 
 class ResourceSet(list):
     """
@@ -186,31 +192,41 @@ class Blueprint:
         return f"Blueprint#{self.id}(robots:{self.robots})"
 
 
-def parse_blueprints(file):
+def parse_blueprint(bp_line):
+    """
+    Build a Blueprint instance set with its ID and its robots characteristics from its text following "Blueprint"
+    """
+    robots = list([None] * 4)
+    bp_id = int(bp_line[:bp_line.find(":")])
+    if m1 := re.findall(r'Each (.*?) robot costs (.*?)\.', bp_line):
+        for robot_entry in m1:
+            costs = ResourceSet()
+            for resource in robot_entry[1].split(" and "):
+                if m2 := re.search(r'^(\d+) (.+)$', resource):
+                    setattr(costs, m2.group(2), m2.group(1))
+            robot = Robot(robot_entry[0], costs)
+            robots[robot.type_id] = robot
+
+    return Blueprint(bp_id, robots)
+
+
+def parse_mapped(data):
     """
-    Build and return a list of Blueprint instances set with their ID and their robots characteristics
+    Build and return a list of Blueprint instances, one for each "Blueprint" record of the input
+    A blueprint may span several lines, only its own record is decoded and joined into a single line.
     """
-    blueprints = []
-    with open(file) as f:
-        content = f.read().replace("\n", " ")
-        for bp_line in content.split("Blueprint "):
-            robots = list([None] * 4)
-            if bp_line:
-                bp_id = int(bp_line[:bp_line.find(":")])
-                if m1 := re.findall(r'Each (.*?) robot costs (.*?)\.', bp_line):
-                    for robot_entry in m1:
-                        costs = ResourceSet()
-                        for resource in robot_entry[1].split(" and "):
-                            if m2 := re.search(r'^(\d+) (.+)$', resource):
-                                setattr(costs, m2.group(2), m2.group(1))
-                        robot = Robot(robot_entry[0], costs)
-                        robots[robot.type_id] = robot
-                blueprints.append(Blueprint(bp_id, robots))
-
-    return blueprints
+    return [parse_blueprint(" ".join(bytes(record).decode().split())) for record in tokens(data, b"Blueprint")]
+
+
+def parse(text):
+    return parse_mapped(text.encode())
 
 
 def process_blueprint(blueprint, max_minutes=24):
+    # cvxopt is slow to import, so it is only imported when a blueprint is actually solved
+    from cvxopt.glpk import ilp
+    from cvxopt import matrix
+
     lhs_ineq = []
     rhs_ineq = []
     lhs_eq = []
@@ -232,7 +248,7 @@ def process_blueprint(blueprint, max_minutes=24):
     for robot in blueprint.robots:
         for cost_id in range(len(robot.cost)):
             if robot.cost[cost_id] > 0:
-                print(robot, robot.cost[cost_id])
+                log.debug("%s %s", robot, robot.cost[cost_id])
                 for i in range(1, max_minutes):
                     rm = RobotMatrix(max_minutes)
                     # Set: 2*Rgeo_i
@@ -300,6 +316,9 @@ def process_blueprint(blueprint, max_minutes=24):
         ore_id = ResourceSet.RESOURCES.index("ore")
         rhs_eq.append((1 if robot.type_id == ore_id else 0))
 
+    counters.add("ILP solved")
+    counters.add("ILP constraints", len(lhs_ineq) + len(lhs_eq))
+
     # Find optimum
     (_, x) = ilp(c=matrix(minimize.as_list(), tc='d'),
                  G=matrix(lhs_ineq, tc='d').T,
@@ -314,8 +333,7 @@ def process_blueprint(blueprint, max_minutes=24):
     return int(sum(x[(3 * max_minutes):(4 * max_minutes)]))
 
 
-def day19_1(file):
-    blueprints = parse_blueprints(file)
+def part1(blueprints):
     quality_level = 0
 
     for blueprint in blueprints:
@@ -323,20 +341,21 @@ def day19_1(file):
         # blueprint ID
         quality_level += process_blueprint(blueprint, max_minutes=24) * blueprint.id
 
-    print(quality_level)
+    return quality_level
 
 
-def day19_2(file):
-    blueprints = parse_blueprints(file)
+def part2(blueprints):
     quality_level = 1
 
     for blueprint in blueprints[:3]:
         # Iterate over the 3 first blueprints and multiply their maximum geode
         quality_level *= process_blueprint(blueprint, max_minutes=32)
 
-    print(quality_level)
+    return quality_level
 
 
 if __name__ == '__main__':
-    day19_1(sys.argv[1])
-    day19_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
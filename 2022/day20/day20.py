@@ -5,13 +5,22 @@
 #
 
 import sys
+from pathlib import Path
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.engines import dispatch
+from aoc.reader import lines
+from aoc.snapshot import Snapshot
 
-def read_sequence(file):
-    with open(file) as f:
-        sequence = list(enumerate([int(line.strip()) for line in f.readlines()]))
 
-    return sequence
+def parse_mapped(data):
+    # A number by line, the lines are read from the mapped input without decoding it
+    return list(enumerate(int(bytes(line)) for line in lines(data)))
+
+
+def parse(text):
+    return parse_mapped(text.encode())
 
 
 def move_in_list(sequence, index):
@@ -29,6 +38,58 @@ def move_in_list(sequence, index):
     sequence.insert(new_index, sequence.pop(old_index))
 
 
+def save_mix(snapshot, sequence, round_, move):
+    # The state of the mixing is the order of the original indexes, the values are known from the parsed sequence
+    snapshot.save(round=round_, move=move, order=[index for index, _ in sequence])
+
+
+def restore_mix(snapshot, sequence):
+    # Reorder the sequence as it was saved, return the round and the move to start from: (0, 0) without a snapshot
+    if (state := snapshot.restore()) is None:
+        return 0, 0
+
+    values = dict(sequence)
+    sequence[:] = [(index, values[index]) for index in state["order"].tolist()]
+
+    return int(state["round"]), int(state["move"])
+
+
+@dispatch
+def mix(sequence, rounds=1):
+    # Move each number of the sequence in place, in their original order, rounds times
+    snapshot = Snapshot("mix")
+    first_round, first_move = restore_mix(snapshot, sequence)
+
+    for round_ in range(first_round, rounds):
+        for index in range(first_move if round_ == first_round else 0, len(sequence)):
+            move_in_list(sequence, index)
+            if snapshot.due():
+                save_mix(snapshot, sequence, round_, index + 1)
+    snapshot.discard()
+
+
+@mix.engine("lookup")
+def mix_lookup(sequence, rounds=1):
+    # Same moves as move_in_list(), but a number is found with list.index() on its (original index, value) tuple, which
+    # are all distinct, instead of building the list of the original indexes before each move
+    # Both engines save the same snapshots, either one can resume from the other's
+    snapshot = Snapshot("mix")
+    first_round, first_move = restore_mix(snapshot, sequence)
+    numbers = sorted(sequence)
+
+    for round_ in range(first_round, rounds):
+        for move in range(first_move if round_ == first_round else 0, len(numbers)):
+            number = numbers[move]
+            old_index = sequence.index(number)
+            new_index = (old_index + number[1]) % (len(sequence) - 1)
+            if new_index == 0:
+                new_index = len(sequence) - 1
+            sequence.insert(new_index, sequence.pop(old_index))
+            if snapshot.due():
+                save_mix(snapshot, sequence, round_, move + 1)
+    snapshot.discard()
+
+
 def get_grove_coordinates(sequence):
     index_zero = [x[1] for x in sequence].index(0)
     result = 0
@@ -37,26 +98,24 @@ def get_grove_coordinates(sequence):
 
     return result
 
-def day20_1(file):
-    sequence = read_sequence(file)
 
-    for index in range(len(sequence)):
-        move_in_list(sequence, index)
+def part1(sequence):
+    # The numbers are moved in a copy of the sequence, so that the parsed one remains unchanged
+    sequence = list(sequence)
+    mix(sequence)
 
-    print(get_grove_coordinates(sequence))
+    return get_grove_coordinates(sequence)
 
 
-def day20_2(file):
-    sequence = read_sequence(file)
+def part2(sequence):
     sequence = list(map(lambda x: (x[0], x[1] * 811589153), sequence))
+    mix(sequence, rounds=10)
 
-    for x in range(10):
-        for index in range(len(sequence)):
-            move_in_list(sequence, index)
-
-    print(get_grove_coordinates(sequence))
+    return get_grove_coordinates(sequence)
 
 
 if __name__ == '__main__':
-    day20_1(sys.argv[1])
-    day20_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
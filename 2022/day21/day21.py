@@ -35,20 +35,19 @@ method.
 import sys
 
 
-def read_monkeys(file):
+def parse(text):
     monkeys = {}
-    with open(file) as f:
-        for line in f:
-            line = line.strip()
-            name = line[:line.find(":")]
-            job = line[line.find(":"):].replace(': ', '')
-            # If the right side is an integer, it's a yell monkey
-            if job.isdigit():
-                # We set an int with the number it yells
-                monkeys[name] = int(job)
-            else:
-                # We set a tuple with the 3 values
-                monkeys[name] = tuple(job.split(" "))
+    for line in text.splitlines():
+        line = line.strip()
+        name = line[:line.find(":")]
+        job = line[line.find(":"):].replace(': ', '')
+        # If the right side is an integer, it's a yell monkey
+        if job.isdigit():
+            # We set an int with the number it yells
+            monkeys[name] = int(job)
+        else:
+            # We set a tuple with the 3 values
+            monkeys[name] = tuple(job.split(" "))
 
     return monkeys
 
@@ -133,16 +132,17 @@ def display_monkeys(monkeys):
     print("---")
 
 
-def day21_1(file):
-    monkeys = read_monkeys(file)
-    print(process_monkeys(monkeys))
+def part1(monkeys):
+    return process_monkeys(monkeys)
 
 
-def day21_2(file):
-    monkeys = read_monkeys(file)
-    print(find_humn_by_bisection(monkeys))
+def part2(monkeys):
+    # The operation of the "root" monkey is changed, so we work on a copy
+    return find_humn_by_bisection(monkeys.copy())
 
 
 if __name__ == '__main__':
-    day21_1(sys.argv[1])
-    day21_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
@@ -119,10 +119,20 @@ but taking into account the direction change thanks the vector directions of the
 
 import sys
 import re
+import math
 from copy import copy
+from pathlib import Path
 
 import numpy as np
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.cache import cached_array
+from aoc.coords import Vector3
+from aoc.log import DEBUG, get_logger
+
+log = get_logger(__name__)
+
 
 def find_boundaries(array):
     """
@@ -145,42 +155,25 @@ def find_boundaries(array):
     return left, right
 
 
-class Vector(np.ndarray):
+class Vector(Vector3):
     """
-    Vector subclass the numpy ndarray class to benefit directly from the numpy features.
-    Implement a simple 3x1 array matrix with an ability to do 90° rotations in all 3 axis centered at origin (0, 0, 0).
+    Vector is a 3D vector (see aoc.coords) with an ability to do 90° rotations in all 3 axis centered at origin
+    (0, 0, 0). Like all the coordinates, a vector is immutable: a rotation returns a new vector.
     """
-    x_rotate_matrix = np.array([[1, 0, 0], [0, 0, -1], [0, 1, 0]])
-    y_rotate_matrix = np.array([[0, 0, 1], [0, 1, 0], [-1, 0, 0]])
-    z_rotate_matrix = np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]])
-
-    def __new__(cls, *args, **kwargs):
-        return super().__new__(cls, (3,), dtype=int)
-
-    def __init__(self, x=0, y=0, z=0):
-        self[:] = [x, y, z]
-
-    def __getattr__(self, item):
-        # For convenience, we can access the 3 values by they name (.x, .y or .z) to avoid to use of unclear indexes
-        # like [0], [1] or [2]
-        try:
-            if item in ['x', 'y', 'z']:
-                return self[['x', 'y', 'z'].index(item)]
-        except ValueError:
-            raise AttributeError(f"No such attribute: {item}") from None
+    __slots__ = ()
 
     def rotate(self, rotate_x_axis=0, rotate_y_axis=0, rotate_z_axis=0):
         # Rotate 90° from all 3 axis. This rotation all 3 at the same, and has many as we want
         # Handy for rotating counterclockwise on a specific axis, we just need to set 3 rotations for that axis
-        if rotate_x_axis > 0:
-            for _ in range(rotate_x_axis):
-                self[:] = np.dot(self.x_rotate_matrix, self)
-        if rotate_y_axis > 0:
-            for _ in range(rotate_y_axis):
-                self[:] = np.dot(self.y_rotate_matrix, self)
-        if rotate_z_axis > 0:
-            for _ in range(rotate_z_axis):
-                self[:] = np.dot(self.z_rotate_matrix, self)
+        vector = self
+        for _ in range(rotate_x_axis):
+            vector = vector.rotate_x()
+        for _ in range(rotate_y_axis):
+            vector = vector.rotate_y()
+        for _ in range(rotate_z_axis):
+            vector = vector.rotate_z()
+
+        return vector
 
 
 class Point(Vector):
@@ -188,7 +181,7 @@ class Point(Vector):
     Point subclass the Vector class with nothing else because technically the needed methods and attributes are the same
     Using a class named Point for the points helps the code to be more readable
     """
-    pass
+    __slots__ = ()
 
 
 class Direction:
@@ -229,27 +222,27 @@ class Edge:
         return f"Edge(<{self.id}> {self.point}-{self.vector})"
 
     def __eq__(self, other):
-        return self.point.x == other.point.x and self.point.y == other.point.y and self.point.z == other.point.z \
-               and self.vector.x == other.vector.x and self.vector.y == other.vector.y and self.vector.z == other.vector.z
+        return self.point == other.point and self.vector == other.vector
 
     def __copy__(self):
-        return Edge(self.id, self.point.copy(), self.vector.copy())
+        # The point and the vector are immutable, they can be shared by the copies
+        return Edge(self.id, self.point, self.vector)
 
     def rotate(self, direction):
         # Rotate the edge according to a direction (looking from the top)
         # We rotate 3 times to do a 90° rotation counterclockwise.
         if direction == Direction.DIRECTION_UP:
-            self.point.rotate(rotate_x_axis=1)
-            self.vector.rotate(rotate_x_axis=1)
+            self.point = self.point.rotate(rotate_x_axis=1)
+            self.vector = self.vector.rotate(rotate_x_axis=1)
         elif direction == Direction.DIRECTION_DOWN:
-            self.point.rotate(rotate_x_axis=3)
-            self.vector.rotate(rotate_x_axis=3)
+            self.point = self.point.rotate(rotate_x_axis=3)
+            self.vector = self.vector.rotate(rotate_x_axis=3)
         elif direction == Direction.DIRECTION_RIGHT:
-            self.point.rotate(rotate_y_axis=3)
-            self.vector.rotate(rotate_y_axis=3)
+            self.point = self.point.rotate(rotate_y_axis=3)
+            self.vector = self.vector.rotate(rotate_y_axis=3)
         elif direction == Direction.DIRECTION_LEFT:
-            self.point.rotate(rotate_y_axis=1)
-            self.vector.rotate(rotate_y_axis=1)
+            self.point = self.point.rotate(rotate_y_axis=1)
+            self.vector = self.vector.rotate(rotate_y_axis=1)
 
 
 class Cube:
@@ -392,7 +385,7 @@ class Tiles:
     TILE_FACING_LEFT = 0x0302
     TILE_WALL = 0x10
 
-    # For reading input file only and display the tiles map
+    # For parsing the input and display the tiles map
     TILES = {
         TILE_EMPTY: ' ',
         TILE_OPEN: '.',
@@ -403,12 +396,12 @@ class Tiles:
         TILE_WALL: '#'
     }
 
-    def __init__(self, file):
-        self.file = file
-        self.tiles = None
+    def __init__(self, tiles, directions):
+        # The tiles map is modified while travelling (see travel_tiles), so we work on a copy of the parsed one
+        self.tiles = tiles.copy(order='F')
         self.face_size = 0
         self.faces = {}
-        self.directions = None
+        self.directions = directions
         self.cube = Cube()
         self.jumps = {}
 
@@ -418,33 +411,6 @@ class Tiles:
     def _is_wall(self, tile):
         return tile & 0x0F03 == 0
 
-    def read_tiles(self):
-        with open(self.file) as f:
-            size_x, size_y = 0, 0
-            for line in f:
-                line = line.rstrip()
-                if not line:
-                    break
-
-                size_x = max(len(line), size_x)
-                size_y += 1
-
-            self.directions = [(int(n), d) for n, d in re.findall(r'(\d+)([RL]?)', f.readline().strip())]
-
-        self.tiles = np.ndarray((size_x, size_y), dtype=int)
-        self.tiles.fill(0)
-
-        tiles_reverse = {v: k for k, v in self.TILES.items()}
-
-        with open(self.file) as f:
-            y = 0
-            for line in f:
-                line = line.rstrip()
-                if not line:
-                    break
-                self.tiles[:, y] = [tiles_reverse[c] for c in line] + [0] * (size_x - len(line))
-                y += 1
-
     def set_jumps_as_plane(self):
         # For part 1 only
         # Start with rows, get the left coordinate to the right coordinate, and the second one from the right to the
@@ -466,6 +432,14 @@ class Tiles:
 
     def set_jumps_as_cube(self):
         # For part 2 only
+        # The jumps only depend on the tiles map, so they can be kept in the derived arrays cache as an array of
+        # (x, y, direction, x2, y2, facing delta) rows
+        jumps = cached_array("cube_jumps", self.build_cube_jumps, self.tiles)
+        self.jumps = {(x, y, direction): (x2, y2, delta) for x, y, direction, x2, y2, delta in jumps.tolist()}
+        # We start at the top left corner of the first face, which is the leftmost tile of the top row
+        self.position = (int(np.flatnonzero(self.tiles[:, 0])[0]), 0)
+
+    def build_cube_jumps(self):
         # Analyse the faces and get the cube net mapping
         self.analyse_faces()
 
@@ -491,7 +465,7 @@ class Tiles:
                                           face2.get_coords_from_edge(edge_direction2)):
                     # To optimize a little bit, we try to avoid creating jumps for faces which are adjacent
                     # because they path are continuous in the tiles map
-                    if not ((v1 == v2).all() and face1.is_adjacent(face2)):
+                    if not (v1 == v2 and face1.is_adjacent(face2)):
                         coord1 = (face1.size * face1.coord[0] + coord1[0],
                                   face1.size * face1.coord[1] + coord1[1])
                         coord2 = (face2.size * face2.coord[0] + coord2[0],
@@ -508,9 +482,11 @@ class Tiles:
                         self.jumps[(coord2[0], coord2[1], edge_direction2)] = \
                             (coord1[0], coord1[1], (edge_direction1 - 2) % 4 - edge_direction2)
 
+        return np.array([key + value for key, value in self.jumps.items()], dtype=np.int32).reshape(-1, 6)
+
     def analyse_faces(self):
         # Find the face size, by computing the GCD of the with and height of the tiles map
-        self.face_size = np.gcd(self.tiles.shape[0], self.tiles.shape[1])
+        self.face_size = math.gcd(self.tiles.shape[0], self.tiles.shape[1])
 
         starting_face = None
 
@@ -621,30 +597,53 @@ class Tiles:
         return 1000 * (self.position[1] + 1) + 4 * (self.position[0] + 1) + (self.facing.direction - 1) % 4
 
     def display_tiles(self):
-        for y in range(self.tiles.shape[1]):
-            print(''.join([self.TILES[self.tiles[x][y]] for x in range(self.tiles.shape[0])]))
+        # Rendering the tiles map is costly, it's only done when the debug logs are enabled
+        if not log.isEnabledFor(DEBUG):
+            return
+
+        log.debug("%s", "\n".join([''.join([self.TILES[self.tiles[x][y]] for x in range(self.tiles.shape[0])])
+                                    for y in range(self.tiles.shape[1])]))
+
+
+def parse(text):
+    # Return the tiles map and the list of directions as (steps, turn)
+    map_text, _, directions_text = text.partition("\n\n")
+    lines = [line.rstrip() for line in map_text.splitlines()]
+    size_x, size_y = max(len(line) for line in lines), len(lines)
+
+    # The tiles are indexed by (x, y) in Fortran order, so the cells of a row are contiguous in memory
+    # The facing tiles need 16 bits (see TILE_FACING_*)
+    tiles = np.zeros((size_x, size_y), dtype=np.uint16, order='F')
+
+    tiles_reverse = {v: k for k, v in Tiles.TILES.items()}
+    for y, line in enumerate(lines):
+        tiles[:, y] = [tiles_reverse[c] for c in line] + [0] * (size_x - len(line))
+
+    directions = [(int(n), d) for n, d in re.findall(r'(\d+)([RL]?)', directions_text.split("\n", 1)[0].strip())]
+
+    return tiles, directions
 
 
-def day22_1(file):
-    tiles = Tiles(file)
-    tiles.read_tiles()
+def part1(notes):
+    tiles = Tiles(*notes)
     tiles.set_jumps_as_plane()
 
     final_password = tiles.travel_tiles()
     tiles.display_tiles()
-    print(final_password)
+    return final_password
 
 
-def day22_2(file):
-    tiles = Tiles(file)
-    tiles.read_tiles()
+def part2(notes):
+    tiles = Tiles(*notes)
     tiles.set_jumps_as_cube()
 
     final_password = tiles.travel_tiles()
     tiles.display_tiles()
-    print(final_password)
+    return final_password
 
 
 if __name__ == '__main__':
-    day22_1(sys.argv[1])
-    day22_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
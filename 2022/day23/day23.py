@@ -28,8 +28,16 @@ and avoid creating a new grid at each turn.
 """
 
 import sys
+from pathlib import Path
+
 import numpy as np
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import counters
+from aoc.coords import Vector
+from aoc.grid import parse_grid, translation_table
+
 
 class Grove:
     """
@@ -46,8 +54,8 @@ class Grove:
         TILE_ELF: '#',
     }
 
-    def __init__(self, file):
-        self.file = file
+    def __init__(self, tiles):
+        self.tiles = tiles   # The tiles parsed from the input, indexed by (y, x)
         self.grid = None     # The active grid
         self.inactive_grid = None
         self.elves = []
@@ -58,44 +66,37 @@ class Grove:
         # left, right and bottom, making the grid 5x larger
         extra_shape = 10
 
-        # First parse the input file to get the original size
-        with open(self.file) as f:
-            size_x, size_y = 0, 0
-
-            for line in f:
-                size_x = max(size_x, len(line.rstrip()))
-                size_y += 1
-
-        # Build the grid with extra room
-        self.grid = np.ndarray((size_x * (2 * extra_shape + 1), size_y * (2 * extra_shape + 1)), dtype=int)
-        self.inactive_grid = self.grid.copy()
-        tiles_reverse = {v: k for k, v in self.TILES.items()}
-
-        # Parse the input file again and place the elves directly from the line read
-        with open(self.file) as f:
-            y = 2 * extra_shape
-            for line in f:
-                line = line.rstrip()
-                self.grid[:, y] = [self.TILE_GROUND] * (size_x * extra_shape) + [tiles_reverse[x] for x in line] +\
-                                  [self.TILE_GROUND] * (size_x * extra_shape)
-                y += 1
-
-        # Parse the grid, lookup where the elves are located and build a list of these elves.
-        for y in range(self.grid.shape[1]):
-            for x in range(self.grid.shape[0]):
-                if self.grid[x, y] == self.TILE_ELF:
-                    self.elves.append(Elf(self, Position(x, y)))
+        tiles = self.tiles
+        size_y, size_x = tiles.shape
+
+        # Build the grids with extra room, they are indexed by (x, y) in Fortran order, so the cells of a row are
+        # contiguous in memory
+        shape = (size_x * (2 * extra_shape + 1), size_y * (2 * extra_shape + 1))
+        self.grid = np.zeros(shape, dtype=np.uint8, order='F')
+        self.inactive_grid = np.zeros(shape, dtype=np.uint8, order='F')
+
+        # Place the elves, the grid is indexed by (x, y)
+        self.grid[size_x * extra_shape:size_x * (extra_shape + 1), 2 * extra_shape:2 * extra_shape + size_y] = tiles.T
+
+        # Lookup where the elves are located (ordered by y then x) and build a list of these elves.
+        for y, x in np.argwhere(self.grid.T == self.TILE_ELF):
+            self.elves.append(Elf(self, Vector(int(x), int(y))))
 
     def run(self, max_round=None):
         # Execute the rounds, the max_round parameter set the maximum number of rounds to perform (useful for part 1)
         nb_round = 0
+        nb_total_moves = 0
         while True:
             nb_round += 1
             nb_moves = self.do_round()
+            nb_total_moves += nb_moves
             if nb_moves == 0 or (max_round is not None and nb_round >= max_round):
                 break
             #print(nb_round, nb_moves)
 
+        counters.add("rounds", nb_round)
+        counters.add("elf moves", nb_total_moves)
+
         return nb_round
 
     def do_round(self):
@@ -111,7 +112,7 @@ class Grove:
         # Insert the elves as the value within a list. This method helps identify when 2 elf propose the same
         # coordinates.
         for elf in self.elves:
-            proposed_move = tuple(elf.proposed_coord)
+            proposed_move = elf.proposed_coord
             if proposed_move not in proposed_moves:
                 proposed_moves[proposed_move] = [elf]
             else:
@@ -125,12 +126,12 @@ class Grove:
                 # We have more than 1 elf the list, we have a coordinate collision.
                 # So the elves will not move, and we place the elves in their current coordinate in the inactive grid
                 for elf in elves:
-                    self.inactive_grid[tuple(elf.coord)] = self.TILE_ELF
+                    self.inactive_grid[elf.coord.x, elf.coord.y] = self.TILE_ELF
             else:
                 # If we have only 1 elf, that's ok. We place it in the inactive grid according to its proposed
                 # new coordinate
-                self.inactive_grid[tuple(elves[0].proposed_coord)] = self.TILE_ELF
-                if elves[0].coord.x != elves[0].proposed_coord.x or elves[0].coord.y != elves[0].proposed_coord.y:
+                self.inactive_grid[coord.x, coord.y] = self.TILE_ELF
+                if elves[0].coord != coord:
                     nb_moves += 1
 
                 # We let the elf move to its proposed coordinate
@@ -169,32 +170,6 @@ class Grove:
             print(''.join([self.TILES[grid[x, y]] for x in range(grid.shape[0])]))
 
 
-class Position(np.ndarray):
-    """
-    Position represent a coordinate on the grid
-    """
-    def __new__(cls, *args, **kwargs):
-        return super().__new__(cls, (2,), dtype=int)
-
-    def __init__(self, x=0, y=0):
-        self[:] = [x, y]
-
-    def set(self, x=0, y=0):
-        self[:] = [x, y]
-
-    def move(self, dx=0, dy=0):
-        self[:] += [dx, dy]
-
-    def __getattr__(self, item):
-        # For convenience, we can access the 3 values by they name (.x, .y) to avoid to use of unclear indexes
-        # like [0] or [1]
-        try:
-            if item in ['x', 'y']:
-                return self[['x', 'y'].index(item)]
-        except ValueError:
-            raise AttributeError(f"No such attribute: {item}") from None
-
-
 class Elf:
     """
     Elf represent an elf :
@@ -205,22 +180,28 @@ class Elf:
         the following order: north, then south, then west and then east. An index of 1, will start by looking at
         south, and so on and so forth, until looping to north
     """
+    __slots__ = ("grove", "coord", "proposed_coord", "direction_index")
+
     DIRECTION_NORTH = 0
     DIRECTION_SOUTH = 1
     DIRECTION_WEST = 2
     DIRECTION_EAST = 3
 
+    # The move in each direction, indexed by the direction
+    DIRECTION_VECTORS = [Vector(0, -1), Vector(0, 1), Vector(-1, 0), Vector(1, 0)]
+
     def __init__(self, grove, coord):
         self.grove = grove
+        # The coordinates are immutable vectors, moving an elf replaces them
         self.coord = coord
-        self.proposed_coord = coord.copy()
+        self.proposed_coord = coord
         self.direction_index = -1
 
     def __repr__(self):
         return f"Elf({self.coord}#{self.proposed_coord}/{self.direction_index})"
 
     def move(self):
-        self.coord[:] = self.proposed_coord
+        self.coord = self.proposed_coord
 
     def get_neighour(self, x, y):
         # Get a neighour cell on the grid according the x and y coordinate delta and returns its value
@@ -242,7 +223,7 @@ class Elf:
 
     def propose_move(self):
         self.direction_index += 1
-        self.proposed_coord[:] = self.coord
+        self.proposed_coord = self.coord
 
         if not self.can_move():
             return
@@ -255,44 +236,51 @@ class Elf:
                 if self.get_neighour(-1, -1) == Grove.TILE_GROUND \
                         and self.get_neighour(0, -1) == Grove.TILE_GROUND \
                         and self.get_neighour(1, -1) == Grove.TILE_GROUND:
-                    self.proposed_coord.move(0, -1)
+                    self.proposed_coord = self.coord + self.DIRECTION_VECTORS[self.DIRECTION_NORTH]
                     break
 
             if direction % 4 == self.DIRECTION_SOUTH:
                 if self.get_neighour(-1, 1) == Grove.TILE_GROUND \
                         and self.get_neighour(0, 1) == Grove.TILE_GROUND \
                         and self.get_neighour(1, 1) == Grove.TILE_GROUND:
-                    self.proposed_coord.move(0, 1)
+                    self.proposed_coord = self.coord + self.DIRECTION_VECTORS[self.DIRECTION_SOUTH]
                     break
 
             if direction % 4 == self.DIRECTION_WEST:
                 if self.get_neighour(-1, -1) == Grove.TILE_GROUND \
                         and self.get_neighour(-1, 0) == Grove.TILE_GROUND \
                         and self.get_neighour(-1, 1) == Grove.TILE_GROUND:
-                    self.proposed_coord.move(-1, 0)
+                    self.proposed_coord = self.coord + self.DIRECTION_VECTORS[self.DIRECTION_WEST]
                     break
 
             if direction % 4 == self.DIRECTION_EAST:
                 if self.get_neighour(1, -1) == Grove.TILE_GROUND \
                         and self.get_neighour(1, 0) == Grove.TILE_GROUND \
                         and self.get_neighour(1, 1) == Grove.TILE_GROUND:
-                    self.proposed_coord.move(1, 0)
+                    self.proposed_coord = self.coord + self.DIRECTION_VECTORS[self.DIRECTION_EAST]
                     break
 
 
-def day23_1(file):
-    grove = Grove(file)
+def parse(text):
+    # Read the input in a single pass, the tiles are indexed by (y, x)
+    return parse_grid(text, translation_table({v: k for k, v in Grove.TILES.items()}))
+
+
+def part1(tiles):
+    grove = Grove(tiles)
     grove.parse_grove()
     grove.run(max_round=10)
-    print(grove.get_empty_ground_tiles())
+    return grove.get_empty_ground_tiles()
 
 
-def day23_2(file):
-    grove = Grove(file)
+def part2(tiles):
+    grove = Grove(tiles)
     grove.parse_grove()
-    print(grove.run())
+    return grove.run()
 
 
 if __name__ == '__main__':
-    day23_1(sys.argv[1])
-    day23_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
@@ -51,7 +51,10 @@ On the given example, the 4 grids will look like this:
 The valley grid is built each minute from the 4 blizzard grids according to the blizzard progression.
 
 To simulate the blizzard progression, it is not necessary to modify the grid. You just have to read each grid from an
-index incremented every minute modulo the size of the grid.
+index incremented every minute modulo the size of the grid. So the blizzards come back to their initial positions
+every lcm(width, height) minutes. The inner valleys of this period are built (by rolling the 4 grids) by chunks of
+consecutive minutes, as the travel reaches them, then the valley grid of a minute is only a copy of one of them. The
+period may be thousands of minutes on large valleys while the travel ends much sooner, only its chunks are built.
 
 The distance matrix is filled with -1, except for the starting point which is initially with the current minute (0 at
 the beginning, but may different in part 2). The distance matrix is updated each minute.
@@ -121,24 +124,17 @@ And repeat the same iteration.
 """
 
 import sys
-import numpy as np
-
-
-class Vector(tuple):
-    """
-    Vector subclass tuple with 2 values x and y
-    It adds .x and .y property for more code clarity
-    """
-    def __new__ (cls, x=0, y=0):
-        return super(Vector, cls).__new__(cls, tuple((x, y)))
+import math
+from pathlib import Path
 
-    @property
-    def x(self):
-        return self[0]
+import numpy as np
 
-    @property
-    def y(self):
-        return self[1]
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.bfs import spread
+from aoc.cache import cached_array
+from aoc.coords import Vector
+from aoc.grid import parse_grid, translation_table
 
 
 class Valley:
@@ -179,104 +175,86 @@ class Valley:
         Vector(1, 0),
     ]
 
-    def __init__(self, file):
-        self.file = file
+    # Number of minutes of the blizzards period built at once (see build_blizzards)
+    BZ_CHUNK_MINUTES = 256
+
+    def __init__(self, grid):
         self.minute = 0
 
-        # Grid of the valley
-        self.grid = None
+        # Grid of the valley, it is updated every minute (see build_valley), so we work on a copy of the parsed one
+        self.grid = np.copy(grid, order='K')
 
         # Grids for blizzard (will contain 4 grids for the 4 directions)
         self.bz_grid = []
+        # Period of the blizzards, and inner valleys of the chunk of minutes of this period starting at valleys_start
+        # (see build_blizzards)
+        self.period = None
+        self.valleys = None
+        self.valleys_start = None
 
         # Distances matrix to compute the optimum path
         self.distances = None
-        # The new distances matrix that will be built for the current minute
-        # We do this because the detection algorithm will be affected while updating the matrix, so we need to
-        # work on a new copy
-        self.new_distances = None
 
         # Start and end position on the grid of the valley
         self.start_coord = None
         self.end_coord = None
 
     def parse_input(self):
-        # First parse the input file to get the original size
-        with open(self.file) as f:
-            size_x, size_y = 0, 0
-
-            for line in f:
-                size_x = max(size_x, len(line.rstrip()))
-                size_y += 1
-
-        # Build the grid with extra room
-        self.grid = np.ndarray((size_x, size_y), dtype=int)
-
-        for i in range(4):
-            bz_grid = np.ndarray((size_x - 2, size_y - 2), dtype=int)
-            bz_grid.fill(self.BZ_TILE_EMPTY)
-            self.bz_grid.append(bz_grid)
-
-        tiles_reverse = {v: k for k, v in self.TILES.items()}
-
-        # Parse the input file again and place the elves directly from the line read
-        with open(self.file) as f:
-            y = 0
-            for line in f:
-                for x in range(len(line.rstrip())):
-                    self.grid[x, y] = tiles_reverse[line[x]]
-                    if 0 < tiles_reverse[line[x]] < self.TILE_WALL:
-                        index = self.BZ_GRID_TILES_ID.index(tiles_reverse[line[x]])
-                        self.bz_grid[index][x - 1, y - 1] = self.BZ_TILE_WIND
-                if y == 0:
-                    # Find where we have a ground cell (TILE_GROUND) on the first line, this is where the start
-                    # position is
-                    self.start_coord = (int(np.where(self.grid[:, 0] == self.TILE_GROUND)[0]), 0)
-                y += 1
-
-            # In the same way as start position, find where we have a ground cell (TILE_GROUND) on the last
-            # line, this is where the end position is
-            self.end_coord = (int(np.where(self.grid[:, y - 1] == self.TILE_GROUND)[0]), y - 1)
+        size_x, size_y = self.grid.shape
+
+        # Build the 4 blizzard grids from the inner part of the valley (without the walls)
+        for tile_id in self.BZ_GRID_TILES_ID:
+            self.bz_grid.append((self.grid[1:-1, 1:-1] == tile_id).astype(np.uint8))
+
+        # Find where we have a ground cell (TILE_GROUND) on the first line, this is where the start position is
+        self.start_coord = (int(np.where(self.grid[:, 0] == self.TILE_GROUND)[0][0]), 0)
+
+        # In the same way as start position, find where we have a ground cell (TILE_GROUND) on the last line, this is
+        # where the end position is
+        self.end_coord = (int(np.where(self.grid[:, size_y - 1] == self.TILE_GROUND)[0][0]), size_y - 1)
 
         # Build the distance and initialize it
-        self.distances = np.ndarray((size_x, size_y), dtype=int)
+        self.distances = np.zeros((size_x, size_y), dtype=np.int32, order='F')
         self.init_distances()
 
+        self.period = math.lcm(size_x - 2, size_y - 2)
         self.build_valley()
 
+    def build_blizzards(self, start):
+        # Build the inner valley of the minutes of the blizzards period from start from the 4 blizzard grids, a chunk of
+        # BZ_CHUNK_MINUTES minutes at most
+        width, height = self.bz_grid[0].shape
+        valleys = np.zeros((min(self.BZ_CHUNK_MINUTES, self.period - start), width, height), dtype=self.grid.dtype)
+
+        for offset, minute in enumerate(range(start, start + len(valleys))):
+            for i in range(len(self.BZ_GRID_TILES_ID)):
+                # We simulate the blizzard progression by rolling the blizzard grid by the distance travelled
+                # Depending on blizzard motion, the grid will be rolled on x-axis for left and right blizzard while it
+                # will be rolled on y-axis for up and down
+                # The value is a binary value, each bit represents a blizzard direction and is set to 1 if the
+                # blizzard is present
+                shift = (self.BZ_GRID_VECTORS[i].x * minute, self.BZ_GRID_VECTORS[i].y * minute)
+                valleys[offset] |= np.roll(self.bz_grid[i], shift, axis=(0, 1)) << i
+
+        return valleys
+
     def build_valley(self):
-        # Build the grid valley grid from the 4 blizzard grids
-        for y in range(self.grid.shape[1] - 2):
-            for x in range(self.grid.shape[0] - 2):
-                value = 0
-                for i in range(len(self.BZ_GRID_TILES_ID)):
-                    # We simulate the blizzard progression by reading the blizzard with incremented index
-                    # Depending on blizzard motion, the index on x-axis will be incremented for left and right blizzard
-                    # while the index on y-axis will be incremented for up and down
-                    bz_grid_x = (x - self.BZ_GRID_VECTORS[i].x * self.minute) % (self.bz_grid[i].shape[0])
-                    bz_grid_y = (y - self.BZ_GRID_VECTORS[i].y * self.minute) % (self.bz_grid[i].shape[1])
-                    if self.bz_grid[i][bz_grid_x, bz_grid_y]:
-                        # The value is a binary value, each bit represents a blizzard direction and is set to 1
-                        # if the blizzard is present
-                        value |= 1 << i
-                self.grid[x + 1, y + 1] = value
+        # Build the grid valley grid of the current minute from the chunk of the blizzards period containing it
+        minute = self.minute % self.period
+        start = minute - minute % self.BZ_CHUNK_MINUTES
+        if start != self.valleys_start:
+            # The blizzards only depend on the 4 initial blizzard grids, so they can be kept in the derived arrays cache
+            self.valleys = cached_array(f"blizzards{start}", lambda: self.build_blizzards(start), *self.bz_grid)
+            self.valleys_start = start
+
+        self.grid[1:-1, 1:-1] = self.valleys[minute - start]
 
     def update_distances(self):
-        for y in range(self.grid.shape[1]):
-            for x in range(self.grid.shape[0]):
-                if self.grid[x, y] == self.TILE_GROUND:
-                    # We found a clear ground with no blizzard
-                    for direction in [Vector(0, 0), Vector(1, 0), Vector(-1, 0), Vector(0, 1), Vector(0, -1)]:
-                        # We look at the position found, at the position below, at the position above,
-                        # at the position on the and at the position on the right.
-                        # We also check the boundary of the matrix
-                        if 0 <= x + direction.x < self.grid.shape[0] and 0 <= y + direction.y < self.grid.shape[1]:
-                            # If we found a cell with contains the previous minute value (minute - 1), we then
-                            # update that cell with the current minute value.
-                            if self.distances[x + direction.x, y + direction.y] == self.minute - 1:
-                                self.new_distances[x, y] = self.minute
-
-        self.distances = self.new_distances.copy()
+        # The cells containing the previous minute value (minute - 1) are the frontier of the search, the clear
+        # grounds with no blizzard at the same position or next to one of them (below, above, on the left or on the
+        # right) are updated with the current minute value
+        frontier = spread(self.distances == self.minute - 1, self.grid == self.TILE_GROUND, stay=True)
+        self.distances[frontier] = self.minute
 
     def inverse_direction(self):
         self.start_coord, self.end_coord = self.end_coord, self.start_coord
@@ -287,7 +265,6 @@ class Valley:
         self.distances.fill(-1)
         # The start position with set to the current minute
         self.distances[self.start_coord] = self.minute
-        self.new_distances = self.distances.copy()
 
     def travel(self):
         while True:
@@ -329,24 +306,33 @@ class Valley:
         print(" ")
 
 
-def day24_1(file):
-    v = Valley(file)
+def parse(text):
+    # Read the input in a single pass and convert the characters into tiles
+    # The grids are indexed by (x, y) in Fortran order (the transposition of the rows read), so the cells of a row
+    # are contiguous in memory
+    return parse_grid(text, translation_table({v: k for k, v in Valley.TILES.items()})).T
+
+
+def part1(grid):
+    v = Valley(grid)
     v.parse_input()
     v.travel()
-    print(v.minute)
+    return v.minute
 
 
-def day24_2(file):
-    v = Valley(file)
+def part2(grid):
+    v = Valley(grid)
     v.parse_input()
     v.travel()
     v.inverse_direction()
     v.travel()
     v.inverse_direction()
     v.travel()
-    print(v.minute)
+    return v.minute
 
 
 if __name__ == '__main__':
-    day24_1(sys.argv[1])
-    day24_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
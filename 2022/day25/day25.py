@@ -7,13 +7,8 @@
 import sys
 
 
-def parse_snafus(file):
-    snafus = []
-    with open(file) as f:
-        for line in f:
-            snafus.append(line.strip())
-
-    return snafus
+def parse(text):
+    return [line.strip() for line in text.splitlines()]
 
 
 def snafu2int(snafu):
@@ -47,16 +42,19 @@ def int2snafu(nb):
     return ''.join([digits[d] for d in nb_digits])
 
 
-def day25_1(file):
-    snafus = parse_snafus(file)
-    print(int2snafu(sum([snafu2int(x) for x in snafus])))
+def part1(snafus):
+    return int2snafu(sum([snafu2int(x) for x in snafus]))
 
 
-def day25_2(file):
+def part2(snafus):
     # To be continued (don't have enough stars)
-    pass
+    return None
 
 
 if __name__ == '__main__':
-    day25_1(sys.argv[1])
-    day25_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    # A part which isn't solved returns None, it has no answer to print
+    if (answer := part2(data)) is not None:
+        print(answer)
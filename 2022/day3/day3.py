@@ -8,34 +8,39 @@ import sys
 import string
 
 
-def day3_1(file):
+def parse(text):
+    # Return the list of rucksacks
+    return [line.rstrip() for line in text.splitlines()]
+
+
+def part1(rucksacks):
     priorities = list(string.ascii_lowercase) + list(string.ascii_uppercase)
     sum_priorities = 0
 
-    with open(file) as f:
-        for line in f:
-            commmon_items = list(set(line.rstrip()[:len(line) >> 1]) & set(line.rstrip()[len(line) >> 1:]))
-            sum_priorities = sum_priorities + sum([priorities.index(x) + 1 for x in commmon_items])
+    for rucksack in rucksacks:
+        commmon_items = list(set(rucksack[:len(rucksack) >> 1]) & set(rucksack[len(rucksack) >> 1:]))
+        sum_priorities = sum_priorities + sum([priorities.index(x) + 1 for x in commmon_items])
 
-    print(sum_priorities)
+    return sum_priorities
 
 
-def day3_2(file):
+def part2(rucksacks):
     priorities = list(string.ascii_lowercase) + list(string.ascii_uppercase)
     three_rucksacks = []
     sum_priorities = 0
 
-    with open(file) as f:
-        for line in f:
-            three_rucksacks.append(line.rstrip())
-            if len(three_rucksacks) == 3:
-                commmon_items = list(set(three_rucksacks[0]) & set(three_rucksacks[1]) & set(three_rucksacks[2]))
-                sum_priorities = sum_priorities + sum([priorities.index(x) + 1 for x in commmon_items])
-                three_rucksacks = []
+    for rucksack in rucksacks:
+        three_rucksacks.append(rucksack)
+        if len(three_rucksacks) == 3:
+            commmon_items = list(set(three_rucksacks[0]) & set(three_rucksacks[1]) & set(three_rucksacks[2]))
+            sum_priorities = sum_priorities + sum([priorities.index(x) + 1 for x in commmon_items])
+            three_rucksacks = []
 
-    print(sum_priorities)
+    return sum_priorities
 
 
 if __name__ == '__main__':
-    day3_1(sys.argv[1])
-    day3_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
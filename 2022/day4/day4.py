@@ -7,43 +7,41 @@
 import sys
 
 
-def day4_1(file):
-    contained_pairs = 0
+def parse(text):
+    # Return the list of pairs of sections as (pair1_start, pair1_end, pair2_start, pair2_end)
+    return [tuple(int(x) for p in line.rstrip().split(',') for x in p.split('-')) for line in text.splitlines()]
 
-    with open(file) as f:
-        for line in f:
-            pair1_start, pair1_end, pair2_start, pair2_end =\
-                [int(x) for p in line.rstrip().split(',') for x in p.split('-')]
 
-            if pair1_start > pair2_start or pair1_end < pair2_end:
-                pair2_start, pair1_start = pair1_start, pair2_start
-                pair2_end, pair1_end = pair1_end, pair2_end
+def part1(pairs):
+    contained_pairs = 0
 
-            if pair1_start <= pair2_start and pair1_end >= pair2_end:
-                contained_pairs += 1
+    for pair1_start, pair1_end, pair2_start, pair2_end in pairs:
+        if pair1_start > pair2_start or pair1_end < pair2_end:
+            pair2_start, pair1_start = pair1_start, pair2_start
+            pair2_end, pair1_end = pair1_end, pair2_end
 
-    print(contained_pairs)
+        if pair1_start <= pair2_start and pair1_end >= pair2_end:
+            contained_pairs += 1
 
+    return contained_pairs
 
-def day4_2(file):
-    contained_pairs = 0
 
-    with open(file) as f:
-        for line in f:
-            pair1_start, pair1_end, pair2_start, pair2_end =\
-                [int(x) for p in line.rstrip().split(',') for x in p.split('-')]
+def part2(pairs):
+    contained_pairs = 0
 
-            if pair1_start > pair2_start or pair1_end > pair2_end:
-                pair2_start, pair1_start = pair1_start, pair2_start
-                pair2_end, pair1_end = pair1_end, pair2_end
+    for pair1_start, pair1_end, pair2_start, pair2_end in pairs:
+        if pair1_start > pair2_start or pair1_end > pair2_end:
+            pair2_start, pair1_start = pair1_start, pair2_start
+            pair2_end, pair1_end = pair1_end, pair2_end
 
-            if pair1_start <= pair2_end and pair1_end >= pair2_start:
-                contained_pairs += 1
+        if pair1_start <= pair2_end and pair1_end >= pair2_start:
+            contained_pairs += 1
 
-    print(contained_pairs)
+    return contained_pairs
 
 
 if __name__ == '__main__':
-    day4_1(sys.argv[1])
-    day4_2(sys.argv[1])
-
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
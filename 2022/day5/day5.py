@@ -5,65 +5,73 @@
 #
 
 import sys
+from pathlib import Path
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.log import DEBUG, get_logger
 
-def day5_1(file):
+log = get_logger(__name__)
+
+
+def parse(text):
+    # Return the starting stacks of crates and the list of moves as (quantity, from, to) with 0-based stack indexes
     stacks = [[]]
-    with open(file) as f:
-        for line in f:
-            line = line.rstrip()
-            if line.find("[") >= 0:
-                crates = [(cr[0], cr[1][1]) for cr in enumerate([line[st:st + 4] for st in range(0, len(line), 4)])
-                          if cr[1][0:1] == '[' and cr[1][2:3] == ']']
-                for crate in crates:
-                    stacks.extend([list() for _ in range(len(stacks) - 1, crate[0])])
-                    stacks[crate[0]].insert(0, crate[1])
+    moves = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if line.find("[") >= 0:
+            crates = [(cr[0], cr[1][1]) for cr in enumerate([line[st:st + 4] for st in range(0, len(line), 4)])
+                      if cr[1][0:1] == '[' and cr[1][2:3] == ']']
+            for crate in crates:
+                stacks.extend([list() for _ in range(len(stacks) - 1, crate[0])])
+                stacks[crate[0]].insert(0, crate[1])
 
-            elif line.startswith("move "):
-                for _ in range(int(line[5:line.find(" from ")])):
-                    stacks[int(line[line.find(" to ") + 4:]) - 1].append(
-                        stacks[int(line[line.find(" from ") + 6:line.find(" to ")]) - 1].pop())
+        elif line.startswith("move "):
+            moves.append((int(line[5:line.find(" from ")]),
+                          int(line[line.find(" from ") + 6:line.find(" to ")]) - 1,
+                          int(line[line.find(" to ") + 4:]) - 1))
 
-        for i in range(max([len(st) for st in stacks]) - 1, -1, -1):
-            print("".join([f"[{stack[i]}] " if i < len(stack) else " "*4 for stack in stacks]))
+    return stacks, moves
 
-        print("".join([f"{i + 1:-2d}  " for i in range(len(stacks))]))
-        print("")
 
-    print("".join([st[-1] for st in stacks]))
+def display_stacks(stacks):
+    # Rendering the stacks is costly, it's only done when the debug logs are enabled
+    if not log.isEnabledFor(DEBUG):
+        return
 
+    lines = ["".join([f"[{stack[i]}] " if i < len(stack) else " "*4 for stack in stacks])
+             for i in range(max([len(st) for st in stacks]) - 1, -1, -1)]
+    lines.append("".join([f"{i + 1:-2d}  " for i in range(len(stacks))]))
+    log.debug("%s\n", "\n".join(lines))
 
-def day5_2(file):
-    stacks = [[]]
-    with open(file) as f:
-        for line in f:
-            line = line.rstrip()
-            if line.find("[") >= 0:
-                crates = [(cr[0], cr[1][1]) for cr in enumerate([line[st:st + 4] for st in range(0, len(line), 4)])
-                          if cr[1][0:1] == '[' and cr[1][2:3] == ']']
-                for crate in crates:
-                    stacks.extend([list() for _ in range(len(stacks) - 1, crate[0])])
-                    stacks[crate[0]].insert(0, crate[1])
 
-            elif line.startswith("move "):
-                move_qty = int(line[5:line.find(" from ")])
-                move_from = int(line[line.find(" to ") + 4:]) - 1
-                move_to = int(line[line.find(" from ") + 6:line.find(" to ")]) - 1
-                len_from = len(stacks[move_to])
+def part1(data):
+    stacks = [list(stack) for stack in data[0]]
+    for move_qty, move_from, move_to in data[1]:
+        for _ in range(move_qty):
+            stacks[move_to].append(stacks[move_from].pop())
 
-                for _ in range(move_qty):
-                    stacks[move_from].append(stacks[move_to].pop(len_from - move_qty))
+    display_stacks(stacks)
 
-                for i in range(max([len(st) for st in stacks]) - 1, -1, -1):
-                    print("".join([f"[{stack[i]}] " if i < len(stack) else " "*4 for stack in stacks]))
+    return "".join([st[-1] for st in stacks])
 
-                print("".join([f"{i + 1:-2d}  " for i in range(len(stacks))]))
-                print("")
 
-    print("".join([st[-1] for st in stacks]))
+def part2(data):
+    stacks = [list(stack) for stack in data[0]]
+    for move_qty, move_from, move_to in data[1]:
+        len_from = len(stacks[move_from])
 
+        for _ in range(move_qty):
+            stacks[move_to].append(stacks[move_from].pop(len_from - move_qty))
 
-if __name__ == '__main__':
-    day5_1(sys.argv[1])
-    day5_2(sys.argv[1])
+        display_stacks(stacks)
 
+    return "".join([st[-1] for st in stacks])
+
+
+if __name__ == '__main__':
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
@@ -23,19 +23,21 @@ def start_of_message(datastream):
     return n
 
 
-def day6_1(file):
-    with open(file) as f:
-        for line in f:
-            print(start_of_packet(line.strip()))
+def parse(text):
+    # The input may contain several datastreams, one per line
+    return [line.strip() for line in text.splitlines()]
 
 
-def day6_2(file):
-    with open(file) as f:
-        for line in f:
-            print(start_of_message(line.strip()))
+def part1(datastreams):
+    return "\n".join(str(start_of_packet(datastream)) for datastream in datastreams)
 
 
-if __name__ == '__main__':
-    day6_1(sys.argv[1])
-    day6_2(sys.argv[1])
+def part2(datastreams):
+    return "\n".join(str(start_of_message(datastream)) for datastream in datastreams)
+
 
+if __name__ == '__main__':
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
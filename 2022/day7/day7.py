@@ -7,7 +7,7 @@
 import sys
 
 
-def parse_input(file):
+def parse(text):
     # Parse input lines and build the filesystem tree with a data structure composed of nested dicts
     # Each dict represents a directory where each key represents an entry found (file/dir) in this directory.
     # The name of these keys is the name of this entry
@@ -20,28 +20,27 @@ def parse_input(file):
     # pwd will be a pointer to the current directory/dict and will travel from directory to subdirectory or parent
     # directory during the parsing
     pwd = root = {}
-    with open(file) as f:
-        for line in f:
-            line = line.rstrip()
-            if line.startswith("$ cd "):
-                # If we have a "cd <something>" command, we're entering to another directory, we update the pwd
-                # pointer value to this new directory
-                if line[5:].strip() == "..":
-                    pwd = pwd[".."]
-                elif line[5:].strip() in pwd:
-                    pwd = pwd[line[5:].strip()]
-            else:
-                # Otherwise, we consider this line is the directory list
-                # Its syntax has 2 syntax : "dir <dirname>" or "<size> <filename>"
-                size_or_dir, entry = line.split(" ")
-                # We consider that if the 1st word is a number, it's a file
-                if size_or_dir.isdigit():
-                    # New entry for a file with its size
-                    pwd[entry] = int(size_or_dir)
-                elif size_or_dir == "dir":
-                    # If the 1st word is "dir", it's a subdirectory
-                    # New entry for this subdirectory and its parent (".." entry) is set to the current directory
-                    pwd[entry] = {"..": pwd}
+    for line in text.splitlines():
+        line = line.rstrip()
+        if line.startswith("$ cd "):
+            # If we have a "cd <something>" command, we're entering to another directory, we update the pwd
+            # pointer value to this new directory
+            if line[5:].strip() == "..":
+                pwd = pwd[".."]
+            elif line[5:].strip() in pwd:
+                pwd = pwd[line[5:].strip()]
+        else:
+            # Otherwise, we consider this line is the directory list
+            # Its syntax has 2 syntax : "dir <dirname>" or "<size> <filename>"
+            size_or_dir, entry = line.split(" ")
+            # We consider that if the 1st word is a number, it's a file
+            if size_or_dir.isdigit():
+                # New entry for a file with its size
+                pwd[entry] = int(size_or_dir)
+            elif size_or_dir == "dir":
+                # If the 1st word is "dir", it's a subdirectory
+                # New entry for this subdirectory and its parent (".." entry) is set to the current directory
+                pwd[entry] = {"..": pwd}
     return root
 
 
@@ -94,18 +93,18 @@ def find_size_to_delete(root, used_size, size_to_delete=70_000_000):
     return tmp_size, size_to_delete
 
 
-def day7_1(file):
-    root = parse_input(file)
-    print(compute_size(root)[1])
+def part1(root):
+    return compute_size(root)[1]
 
 
-def day7_2(file):
-    root = parse_input(file)
+def part2(root):
     used_size, partial_size = compute_size(root)
-    print(find_size_to_delete(root, used_size)[1])
+    return find_size_to_delete(root, used_size)[1]
 
 
 if __name__ == '__main__':
-    day7_1(sys.argv[1])
-    day7_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
@@ -5,22 +5,18 @@
 #
 
 import sys
+from pathlib import Path
+
 import numpy as np
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.grid import parse_grid, translation_table
 
-def parse_input(file):
-    grid = None
-    with open(file) as f:
-        n = 0
-        for line in f:
-            line = line.rstrip()
-            if grid is None:
-                grid = np.zeros((len(line), len(line)), dtype=int)
-            if n < len(line):
-                grid[n] = list([int(x) for x in line])
-            n += 1
 
-    return grid
+def parse(text):
+    # Load the tree heights in a single pass, the grid is indexed by (y, x)
+    return parse_grid(text, translation_table({str(n): n for n in range(10)}))
 
 
 def scan_visible(line_or_col, visible_datas):
@@ -50,27 +46,26 @@ def get_scenic_score(line_or_col, index):
     return view_left * view_right
 
 
-def day8_1(file):
-    grid = parse_input(file)
-    visible_trees = np.zeros(grid.shape, dtype=int)
+def part1(grid):
+    visible_trees = np.zeros(grid.shape, dtype=np.uint8)
     for n in range(grid.shape[0]):
         scan_visible(grid[n], visible_trees[n])
         scan_visible(grid[:, n], visible_trees[:, n])
-    print(np.count_nonzero(visible_trees == 1))
+    return np.count_nonzero(visible_trees == 1)
 
 
-def day8_2(file):
-    grid = parse_input(file)
+def part2(grid):
     scenic_scores = []
     for x in range(grid.shape[0]):
         for y in range(grid.shape[0]):
             score = get_scenic_score(grid[:, x], y) * get_scenic_score(grid[y], x)
             scenic_scores.append(score)
-    print(max(scenic_scores))
-
+    return max(scenic_scores)
 
 
 if __name__ == '__main__':
-    day8_1(sys.argv[1])
-    day8_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
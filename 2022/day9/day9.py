@@ -5,7 +5,6 @@
 #
 
 import sys
-import numpy as np
 
 
 def display_grid(knots_pos):
@@ -14,13 +13,13 @@ def display_grid(knots_pos):
     ymin = min([x[1] for x in knots_pos])
     ymax = max([x[1] for x in knots_pos])
 
-    grid = np.full((xmax - xmin + 1, ymax - ymin + 1), ".", dtype=str)
-    print(grid.shape, xmin, xmax, ymin, ymax)
+    grid = [["."] * (ymax - ymin + 1) for _ in range(xmax - xmin + 1)]
+    print((len(grid), len(grid[0])), xmin, xmax, ymin, ymax)
     for n, pos in reversed(list(enumerate(knots_pos))):
         print(pos[0], pos[1], pos[0] - xmin, pos[1] - ymin)
         grid[pos[0] - xmin][pos[1] - ymin] = str(n)
 
-    print(grid)
+    print("\n".join("".join(row) for row in grid))
 
 
 def move_head(command, head_pos):
@@ -53,44 +52,45 @@ def move_tail(head_pos, tail_pos):
     return tail_pos[0], tail_pos[1]
 
 
-def day9_1(file):
+def parse(text):
+    # Return the list of commands as (command, steps)
+    return [(line.rstrip(), int(line.split(" ")[1])) for line in text.splitlines()]
+
+
+def part1(commands):
     head_pos = [0, 0]
     tail_pos = [0, 0]
     visited_positions = []
-    with open(file) as f:
-        for line in f:
-            line = line.rstrip()
-            steps = int(line.split(" ")[1])
-            for _ in range(steps):
-                head_pos[0], head_pos[1] = move_head(line, head_pos)
-                tail_pos[0], tail_pos[1] = move_tail(head_pos, tail_pos)
-                visited_positions.append(tuple(tail_pos))
+    for command, steps in commands:
+        for _ in range(steps):
+            head_pos[0], head_pos[1] = move_head(command, head_pos)
+            tail_pos[0], tail_pos[1] = move_tail(head_pos, tail_pos)
+            visited_positions.append(tuple(tail_pos))
 
-    print(len(set(visited_positions)))
+    return len(set(visited_positions))
 
 
-def day9_2(file):
+def part2(commands):
     knots_pos = []
     for _ in range(10):
         knots_pos.append([0, 0])
 
     visited_positions = []
-    with open(file) as f:
-        for line in f:
-            line = line.rstrip()
-            steps = int(line.split(" ")[1])
-            for _ in range(steps):
-                knots_pos[0][0], knots_pos[0][1] = move_head(line, knots_pos[0])
-                for i in range(1, len(knots_pos)):
-                    knots_pos[i][0], knots_pos[i][1] = move_tail(knots_pos[i - 1], knots_pos[i])
-                    if i == 9:
-                        visited_positions.append(tuple(knots_pos[i]))
+    for command, steps in commands:
+        for _ in range(steps):
+            knots_pos[0][0], knots_pos[0][1] = move_head(command, knots_pos[0])
+            for i in range(1, len(knots_pos)):
+                knots_pos[i][0], knots_pos[i][1] = move_tail(knots_pos[i - 1], knots_pos[i])
+                if i == 9:
+                    visited_positions.append(tuple(knots_pos[i]))
 
-            #display_grid(knots_pos)
-    print(len(set(visited_positions)))
+        #display_grid(knots_pos)
+    return len(set(visited_positions))
 
 
 if __name__ == '__main__':
-    day9_1(sys.argv[1])
-    day9_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
@@ -29,37 +29,41 @@ def convert_letters_digits(line):
     return new_line
 
 
-def find_calibration_sum(file, with_letters_digits=False):
+def find_calibration_sum(lines, with_letters_digits=False):
     calibration_sum = 0
 
-    with open(file) as f:
-        for line in f:
-            line = line.rstrip()
-            first_digit, last_digit = None, None
+    for line in lines:
+        first_digit, last_digit = None, None
 
-            if with_letters_digits:
-                line = convert_letters_digits(line)
+        if with_letters_digits:
+            line = convert_letters_digits(line)
 
-            for ch in line:
-                if ord('0') < ord(ch) <= ord('9'):
-                    if not first_digit:
-                        first_digit = ch
-                    last_digit = ch
+        for ch in line:
+            if ord('0') < ord(ch) <= ord('9'):
+                if not first_digit:
+                    first_digit = ch
+                last_digit = ch
 
-            calibration_sum += int(first_digit + last_digit)
+        calibration_sum += int(first_digit + last_digit)
 
     return calibration_sum
 
 
-def day1_1(file):
-    print(find_calibration_sum(file))
+def parse(text):
+    return [line.rstrip() for line in text.splitlines()]
 
 
-def day1_2(file):
-    print(find_calibration_sum(file, with_letters_digits=True))
+def part1(lines):
+    return find_calibration_sum(lines)
+
+
+def part2(lines):
+    return find_calibration_sum(lines, with_letters_digits=True)
 
 
 if __name__ == '__main__':
-    day1_1(sys.argv[1])
-    day1_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
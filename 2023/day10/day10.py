@@ -5,8 +5,14 @@
 #
 
 import sys
+from pathlib import Path
+
 import numpy as np
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.grid import parse_grid, translation_table
+
 # Pipes constants
 PIPE_V = 10
 PIPE_H = 11
@@ -98,25 +104,9 @@ def display_area(area, current_coord, visited_coords=None):
         print(line)
 
 
-def parse_file(file):
-    with open(file) as f:
-        size_x, size_y = 0, 0
-
-        for line in f:
-            size_x = max(size_x, len(line.rstrip()))
-            size_y += 1
-
-        # Initialize the array
-        area = np.ndarray((size_x, size_y), dtype=int)
-
-    # Second parse to fill the array
-    with open(file) as f:
-        y = 0
-        for line in f:
-            area[:, y] = [convert_to_pipe(ch) for ch in line.rstrip()]
-            y += 1
-
-    return area
+def parse(text):
+    # Load the area in a single pass and convert the characters to pipes, the array is indexed by (x, y)
+    return parse_grid(text, translation_table(PIPES)).T
 
 
 def find_loop(area):
@@ -209,16 +199,18 @@ def find_enclosed_area(visited_coords, nb_straight_pipes, nb_corner_pipes):
     return area
 
 
-def day10_1(file):
-    visited_coords, nb_straight_pipes, nb_corner_pipes = find_loop(parse_file(file))
-    print(find_farthest_point(visited_coords))
+def part1(area):
+    visited_coords, nb_straight_pipes, nb_corner_pipes = find_loop(area)
+    return find_farthest_point(visited_coords)
 
 
-def day10_2(file):
-    visited_coords, nb_straight_pipes, nb_corner_pipes = find_loop(parse_file(file))
-    print(find_enclosed_area(visited_coords, nb_straight_pipes, nb_corner_pipes))
+def part2(area):
+    visited_coords, nb_straight_pipes, nb_corner_pipes = find_loop(area)
+    return find_enclosed_area(visited_coords, nb_straight_pipes, nb_corner_pipes)
 
 
 if __name__ == '__main__':
-    day10_1(sys.argv[1])
-    day10_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
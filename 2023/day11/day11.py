@@ -5,7 +5,13 @@
 #
 
 import sys
+from pathlib import Path
+
 import numpy as np
+
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.grid import parse_grid, translation_table
 from itertools import combinations
 
 SPACE_EMPTY = 0
@@ -67,23 +73,9 @@ def expand_coord(cols_empty, rows_empty, coord, expansion=1):
     return result
 
 
-def parse_file(file):
-    with open(file) as f:
-        size_x, size_y = 0, 0
-
-        for line in f:
-            size_x = max(size_x, len(line.rstrip()))
-            size_y += 1
-
-        # Initialize the array
-        space = np.ndarray((size_x, size_y), dtype=int)
-
-    # Second parse to fill the array
-    with open(file) as f:
-        y = 0
-        for line in f:
-            space[:, y] = [SPACE[ch] for ch in line.rstrip()]
-            y += 1
+def parse(text):
+    # Load the space in a single pass and convert the characters, the array is indexed by (x, y)
+    space = parse_grid(text, translation_table(SPACE)).T
 
     #display_galaxy(space)
     return space
@@ -122,17 +114,17 @@ def find_shortest_paths(space, expansion=2):
     return sum([manhattan_distance(p[0], p[1]) for p in list(combinations(galaxies, 2))])
 
 
-def day11_1(file):
-    space = parse_file(file)
-    print(find_shortest_paths(space))
+def part1(space):
+    return find_shortest_paths(space)
 
 
-def day11_2(file):
-    space = parse_file(file)
-    print(find_shortest_paths(space, expansion=1_000_000))
+def part2(space):
+    return find_shortest_paths(space, expansion=1_000_000)
 
 
 if __name__ == '__main__':
-    day11_1(sys.argv[1])
-    day11_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
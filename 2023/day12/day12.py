@@ -8,6 +8,13 @@ import sys
 import re
 import itertools
 import fnmatch
+from pathlib import Path
+
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.log import get_logger
+
+log = get_logger(__name__)
 
 
 def partitions(n, k):
@@ -41,23 +48,22 @@ def partitions_with_zeroes(n, k):
            list([p + [0] for p in partitions(n, k - 1)]) + list([[0] + p + [0] for p in partitions(n, k - 2)])
 
 
-def parse_file(file):
+def parse(text):
     records = []
 
-    with open(file) as f:
-        for line in f:
-            # Match the line format and try to find the match in the line
-            match = re.search(r"^(.+)\s+(.+)$", line.rstrip())
+    for line in text.splitlines():
+        # Match the line format and try to find the match in the line
+        match = re.search(r"^(.+)\s+(.+)$", line.rstrip())
 
-            if match:
-                spring_groups = list(map(int, match.group(2).split(",")))
-                records.append((match.group(1), spring_groups))
+        if match:
+            spring_groups = list(map(int, match.group(2).split(",")))
+            records.append((match.group(1), spring_groups))
 
     return records
 
 
 def find_matches(unknown_record, spring_groups):
-    print(f"find_matches({unknown_record}, {spring_groups}")
+    log.debug("find_matches(%s, %s)", unknown_record, spring_groups)
     spring_sum = sum(spring_groups)
     nb_matches = 0
 
@@ -94,7 +100,7 @@ def find_matches(unknown_record, spring_groups):
         if fnmatch.fnmatch(pattern, unknown_record):
             nb_matches += 1
 
-    print(unknown_record, spring_groups, nb_matches)
+    log.debug("%s %s %d", unknown_record, spring_groups, nb_matches)
     return nb_matches
 
 
@@ -106,21 +112,24 @@ def find_matches_sum_unfolded(records):
     return sum([find_matches(record[0] + "?", record[1]) for record in records])
 
 
-def day12_1(file):
-    print(find_matches_sum(parse_file(file)))
+def part1(records):
+    return find_matches_sum(records)
 
 
-def day12_2(file):
-    #print(find_matches_sum_unfolded(parse_file(file)))
-    records = parse_file(file)
+def part2(records):
+    #return find_matches_sum_unfolded(records)
     for record in records:
-        print("?".join([record[0]] * 5), record[1] * 5)
+        log.debug("%s %s", "?".join([record[0]] * 5), record[1] * 5)
 
     #find_matches("????.#...#...?????", [4, 1, 1, 4])
     #find_matches("?????.#...#...", [4, 1, 1, 4])
 
 
 if __name__ == '__main__':
-    #day12_1(sys.argv[1])
-    day12_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    #print(part1(data))
+    # A part which isn't solved returns None, it has no answer to print
+    if (answer := part2(data)) is not None:
+        print(answer)
 
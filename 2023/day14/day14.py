@@ -4,50 +4,40 @@
 # https://adventofcode.com/2023/day/14
 #
 
+import hashlib
 import sys
+from pathlib import Path
+
 import numpy as np
-import hashlib
 
-GRID_ROUNDED_ROCK = "O"
-GRID_CUBED_ROCK = "#"
-GRID_EMPTY = "."
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import jit
+from aoc.engines import dispatch
+from aoc.grid import parse_grid
+from aoc.snapshot import Snapshot
+
+# The grid contains the character codes
+GRID_ROUNDED_ROCK = ord("O")
+GRID_CUBED_ROCK = ord("#")
+GRID_EMPTY = ord(".")
 
 
 def display_grid(grid):
     # For debugging purpose, display the grid array
     for y in range(grid.shape[1]):
-        print(''.join([grid[x, y] for x in range(grid.shape[0])]))
-
-
-def parse_grid(file):
-    with open(file) as f:
-        size_x, size_y = 0, 0
-
-        for line in f:
-            size_x = max(size_x, len(line.rstrip()))
-            size_y += 1
-
-        # Initialize the array
-        grid = np.ndarray((size_x, size_y), dtype=object)
+        print(''.join([chr(grid[x, y]) for x in range(grid.shape[0])]))
 
-    # Second parse to fill the array
-    with open(file) as f:
-        y = 0
-        for line in f:
-            grid[:, y] = [ch for ch in line.rstrip()]
-            y += 1
-
-    return grid
 
+def parse(text):
+    # Load the grid in a single pass, the array is indexed by (x, y) in Fortran order, so the cells of a row are
+    # contiguous in memory
+    return parse_grid(text).T
 
-def tilt_grid(grid, rotate=0):
-    # Rotate the grid to change to the tilt direction
-    # 0: north, 1: west, 2: south, 3: east
-    grid = np.rot90(grid, k=rotate)
-
-    # Initialize a new grid array with the same shape as the existing grid.
-    new_grid = np.copy(grid)
 
+@dispatch
+def roll_rocks(grid, new_grid):
+    # Move the rounded rocks of the grid up, one cell at a time until none can move, new_grid is a copy of the grid
     while True:
         # Initialize a counter to keep track of the number of tilts
         nb_tilt = 0
@@ -72,6 +62,22 @@ def tilt_grid(grid, rotate=0):
         if nb_tilt == 0:
             break
 
+
+# roll_rocks() only uses integers and arrays, numba compiles it as it is
+jit.compile_reference(roll_rocks)
+
+
+def tilt_grid(grid, rotate=0):
+    # Rotate the grid to change to the tilt direction
+    # 0: north, 1: west, 2: south, 3: east
+    grid = np.rot90(grid, k=rotate)
+
+    # Initialize a new grid array with the same shape as the existing grid.
+    new_grid = np.copy(grid)
+
+    # Move the rounded rocks up in the rotated grid
+    roll_rocks(grid, new_grid)
+
     # Rotate the grid back to its original orientation
     grid = np.rot90(grid, k=(-rotate) % 4)
 
@@ -97,8 +103,16 @@ def tilt_cycle_grid(grid):
     hash_cycle = False
     hash_cycle_start = 0
 
+    # Resume from the last snapshot of an interrupted run, if any. The hashes are stored in the order of their cycle.
+    snapshot = Snapshot("cycles")
+    first_cycle = 0
+    if (state := snapshot.restore()) is not None:
+        first_cycle, grid = int(state["cycle"]), state["grid"]
+        hashes = {hash_grid: n for n, hash_grid in enumerate(state["hashes"].tolist())}
+        total_loads = state["total_loads"].tolist()
+
     # Iterate up to 1 billion times (1_000_000_000).
-    for n in range(1_000_000_000):
+    for n in range(first_cycle, 1_000_000_000):
         # Rotate the grid four times using the 'tilt_grid' function with different direction:
         # north, then west, then south, then east
         for k in range(4):
@@ -121,6 +135,10 @@ def tilt_cycle_grid(grid):
             # Break out of the loop since a cycle has been detected.
             break
 
+        if snapshot.due():
+            snapshot.save(cycle=n + 1, grid=grid, hashes=list(hashes), total_loads=total_loads)
+    snapshot.discard()
+
     # Compute the index of the total load to return based on the hash cycle.
     # This is done by calculating the appropriate index in the 'total_loads' list using modulo arithmetic.
     return total_loads[(1_000_000_000 - hash_cycle_start) % hash_cycle + hash_cycle_start - 1]
@@ -148,17 +166,18 @@ def find_total_load(grid):
     return total_load
 
 
-def day14_1(file):
-    grid = parse_grid(file)
-    print(find_total_load(tilt_grid(grid)))
+def part1(grid):
+    # The tilts modify the grid in place, so we need a writable copy of the parsed one
+    return find_total_load(tilt_grid(np.copy(grid)))
 
 
-def day14_2(file):
-    grid = parse_grid(file)
-    print(tilt_cycle_grid(grid))
+def part2(grid):
+    return tilt_cycle_grid(np.copy(grid))
 
 
 if __name__ == '__main__':
-    day14_1(sys.argv[1])
-    day14_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
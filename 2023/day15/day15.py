@@ -6,6 +6,13 @@
 
 import sys
 import re
+from pathlib import Path
+
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.log import get_logger
+
+log = get_logger(__name__)
 
 
 class Lens:
@@ -65,11 +72,8 @@ def str2hash(string):
     return current_hash
 
 
-def parse_file(file):
-    with open(file) as f:
-        steps = f.readline().rstrip().split(',')
-
-    return steps
+def parse(text):
+    return text.split("\n", 1)[0].rstrip().split(',')
 
 
 def find_sum(steps):
@@ -114,21 +118,23 @@ def operate_lenses(steps):
                     boxes[n].remove_lens(lens_label)
 
             else:
-                print(f"Invalid operation {operation}")
+                log.warning("Invalid operation %s", operation)
 
     # Compute the focusing power of all Boxes.
     return sum([b.focusing_power for b in boxes])
 
 
-def day15_1(file):
-    print(find_sum(parse_file(file)))
+def part1(steps):
+    return find_sum(steps)
 
 
-def day15_2(file):
-    print(operate_lenses(parse_file(file)))
+def part2(steps):
+    return operate_lenses(steps)
 
 
 if __name__ == '__main__':
-    day15_1(sys.argv[1])
-    day15_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
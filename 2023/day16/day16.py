@@ -5,53 +5,30 @@
 #
 
 import sys
-import numpy as np
-from copy import copy
-
-
-class Vector(tuple):
-    """
-    Vector subclass tuple with 2 values x and y
-    It adds .x and .y properties for more code clarity
-    """
-
-    def __new__(cls, x=0, y=0):
-        return super(Vector, cls).__new__(cls, tuple((x, y)))
-
-    @property
-    def x(self):
-        return self[0]
-
-    @property
-    def y(self):
-        return self[1]
-
-
-class Coordinate:
-    _move_vectors = [Vector(0, -1), Vector(1, 0), Vector(0, 1), Vector(-1, 0)]
-
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-    def __repr__(self):
-        return f"Coordinate({self.x}, {self.y})"
+from pathlib import Path
 
-    def __copy__(self):
-        return type(self)(self.x, self.y)
+import numpy as np
 
-    def move(self, direction):
-        self.x += self._move_vectors[direction].x
-        self.y += self._move_vectors[direction].y
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import counters
+from aoc.coords import Vector
+from aoc.grid import parse_grid
 
 
 class Beam:
+    __slots__ = ("coord", "boundaries", "direction")
+
     DIRECTION_NORTH = 0
     DIRECTION_EAST = 1
     DIRECTION_SOUTH = 2
     DIRECTION_WEST = 3
 
+    # The move in each direction, indexed by the direction
+    DIRECTION_VECTORS = [Vector(0, -1), Vector(1, 0), Vector(0, 1), Vector(-1, 0)]
+
     def __init__(self, coord, boundaries, direction):
+        # The coordinates are immutable vectors, moving a beam replaces its coordinate
         self.coord = coord
         self.boundaries = boundaries
         self.direction = direction
@@ -74,15 +51,16 @@ class Beam:
         if turn_back:
             self.direction = (self.direction + 2) % 4
         else:
-            self.coord.move(self.direction)
+            self.coord = self.coord + self.DIRECTION_VECTORS[self.direction]
 
 
 class Layout:
-    GRID_EMPTY = "."
-    GRID_MIRROR_SLASH = "/"
-    GRID_MIRROR_ANTI_SLASH = "\\"
-    GRID_SPLITTER_VERT = "|"
-    GRID_SPLITTER_HORZ = "-"
+    # The grid contains the character codes
+    GRID_EMPTY = ord(".")
+    GRID_MIRROR_SLASH = ord("/")
+    GRID_MIRROR_ANTI_SLASH = ord("\\")
+    GRID_SPLITTER_VERT = ord("|")
+    GRID_SPLITTER_HORZ = ord("-")
 
     def __init__(self):
         self.grid = None
@@ -112,26 +90,12 @@ class Layout:
         # If no match is found, return False indicating the beam has not been seen in a mirror before
         return False
 
-    def parse(self, file):
-        with open(file) as f:
-            size_x, size_y = 0, 0
-
-            for line in f:
-                size_x = max(size_x, len(line.rstrip()))
-                size_y += 1
-
-            # Initialize the array
-            self.grid = np.ndarray((size_x, size_y), dtype=object)
-            self.energized_grid = np.full((size_x, size_y), False, dtype=bool)
-
-        # Second parse to fill the array
-        with open(file) as f:
-            y = 0
-            for line in f:
-                self.grid[:, y] = [ch for ch in line.rstrip()]
-                y += 1
+    def set_grid(self, grid):
+        self.grid = grid
+        size_x, size_y = self.grid.shape
+        self.energized_grid = np.full((size_x, size_y), False, dtype=bool, order='F')
 
-        self.boundaries = Coordinate(size_x, size_y)
+        self.boundaries = Vector(size_x, size_y)
 
     def move_beams(self):
         # Iterate over each beam in the list of beams
@@ -177,10 +141,10 @@ class Layout:
 
                         # Create new beams moving respectively at north and south from the current position
                         # and move them
-                        beam_north = Beam(copy(beam.coord), self.boundaries, Beam.DIRECTION_NORTH)
+                        beam_north = Beam(beam.coord, self.boundaries, Beam.DIRECTION_NORTH)
                         beam_north.move()
                         self.beams.append(beam_north)
-                        beam_south = Beam(copy(beam.coord), self.boundaries, Beam.DIRECTION_SOUTH)
+                        beam_south = Beam(beam.coord, self.boundaries, Beam.DIRECTION_SOUTH)
                         beam_south.move()
                         self.beams.append(beam_south)
                     else:
@@ -199,10 +163,10 @@ class Layout:
 
                         # Create new beams moving respectively at east and west from the current position
                         # and move them
-                        beam_east = Beam(copy(beam.coord), self.boundaries, Beam.DIRECTION_EAST)
+                        beam_east = Beam(beam.coord, self.boundaries, Beam.DIRECTION_EAST)
                         beam_east.move()
                         self.beams.append(beam_east)
-                        beam_west = Beam(copy(beam.coord), self.boundaries, Beam.DIRECTION_WEST)
+                        beam_west = Beam(beam.coord, self.boundaries, Beam.DIRECTION_WEST)
                         beam_west.move()
                         self.beams.append(beam_west)
                     else:
@@ -218,12 +182,15 @@ class Layout:
         self._init_layout()
 
         # Create a new beam starting at the specified coordinates and moving in the given direction
-        self.beams = [Beam(copy(start_coord), self.boundaries, direction)]
+        self.beams = [Beam(start_coord, self.boundaries, direction)]
 
         # Set the maximum number of times the number of energized cells is allowed to remain fixed
         nb_energized_p = None
         nb_energized_max_fixed = self.boundaries.x + self.boundaries.y
 
+        # Number of steps and number of beam moves (the beams alive at each step)
+        nb_steps, nb_beam_moves = 0, 0
+
         # Main loop to propagate and handle the beams
         while True:
             # Count the number of energized cells in the grid
@@ -235,6 +202,8 @@ class Layout:
                 nb_energized_max_fixed -= 1
 
             # Move all beams according to the rules of the contraption
+            nb_steps += 1
+            nb_beam_moves += len(self.beams)
             self.move_beams()
 
             # If the maximum fixed count reaches zero, break out of the loop
@@ -248,6 +217,9 @@ class Layout:
             # Update the previous number of energized cells
             nb_energized_p = nb_energized
 
+        counters.add("contraption steps", nb_steps)
+        counters.add("beam moves", nb_beam_moves)
+
         # Return the total count of energized cells in the grid
         return np.count_nonzero(self.energized_grid == True)
 
@@ -259,19 +231,19 @@ class Layout:
         for start_coord_x in range(self.grid.shape[0]):
             # Activate the contraption starting by a beam located at a tile in the top row and heading downward
             tiles_energized.append(
-                self.activate_contraption(Coordinate(start_coord_x, 0), Beam.DIRECTION_SOUTH))
+                self.activate_contraption(Vector(start_coord_x, 0), Beam.DIRECTION_SOUTH))
             # Activate the contraption starting by a beam located at a tile in the top row and heading upward
             tiles_energized.append(
-                self.activate_contraption(Coordinate(start_coord_x, self.grid.shape[1] - 1), Beam.DIRECTION_NORTH))
+                self.activate_contraption(Vector(start_coord_x, self.grid.shape[1] - 1), Beam.DIRECTION_NORTH))
 
         # Iterate over each tile in the leftmost column and rightmost column
         for start_coord_y in range(self.grid.shape[1]):
             # Activate the contraption starting by a beam located at a tile in the leftmost column and heading right
             tiles_energized.append(
-                self.activate_contraption(Coordinate(0, start_coord_y), Beam.DIRECTION_EAST))
+                self.activate_contraption(Vector(0, start_coord_y), Beam.DIRECTION_EAST))
             # Activate the contraption starting by a beam located at a tile in the rightmost column and heading left
             tiles_energized.append(
-                self.activate_contraption(Coordinate(self.grid.shape[0] - 1, start_coord_y), Beam.DIRECTION_WEST))
+                self.activate_contraption(Vector(self.grid.shape[0] - 1, start_coord_y), Beam.DIRECTION_WEST))
 
         # Return the maximum number of energized tiles among all configurations
         return max(tiles_energized)
@@ -281,7 +253,7 @@ class Layout:
 
         print(f"Layout {self.boundaries}")
         for y in range(self.grid.shape[1]):
-            print(''.join([self.grid[x, y] for x in range(self.grid.shape[0])]))
+            print(''.join([chr(self.grid[x, y]) for x in range(self.grid.shape[0])]))
         print("")
 
         for n in range(len(self.beams)):
@@ -305,19 +277,27 @@ class Layout:
             print(''.join(["#" if self.energized_grid[x, y] else "." for x in range(self.energized_grid.shape[0])]))
 
 
-def day16_1(file):
+def parse(text):
+    # Load the grid in a single pass, the array is indexed by (x, y)
+    return parse_grid(text).T
+
+
+def part1(grid):
     layout = Layout()
-    layout.parse(file)
-    print(layout.activate_contraption(Coordinate(0, 0), Beam.DIRECTION_EAST))
+    layout.set_grid(grid)
+    return layout.activate_contraption(Vector(0, 0), Beam.DIRECTION_EAST)
     #layout.display_energized()
 
 
-def day16_2(file):
+def part2(grid):
     layout = Layout()
-    layout.parse(file)
-    print(layout.find_best_energized_configuration())
+    layout.set_grid(grid)
+    return layout.find_best_energized_configuration()
+
 
 if __name__ == '__main__':
-    day16_1(sys.argv[1])
-    day16_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
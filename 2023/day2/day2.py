@@ -6,45 +6,51 @@
 
 import sys
 import re
+from pathlib import Path
+
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.log import get_logger
+
+log = get_logger(__name__)
 
 GAME_RED_CUBES = 12
 GAME_GREEN_CUBES = 13
 GAME_BLUE_CUBES = 14
 
 
-def parse_games(file):
+def parse(text):
     games = {}
 
-    with open(file) as f:
-        for line in f:
-            line = line.rstrip()
-            line = line.replace(";", ",")
+    for line in text.splitlines():
+        line = line.rstrip()
+        line = line.replace(";", ",")
 
-            # Match the line format and try to find the match in the line
-            match = re.search(r"Game (\d+): (.+)", line)
+        # Match the line format and try to find the match in the line
+        match = re.search(r"Game (\d+): (.+)", line)
 
-            if match:
-                game_id = int(match.group(1))
+        if match:
+            game_id = int(match.group(1))
 
-                color_datas = match.group(2).split(',')
+            color_datas = match.group(2).split(',')
 
-                color_revelations = []
+            color_revelations = []
 
-                for cube in color_datas:
-                    # Extract individual color and value
-                    color_match = re.search(r"(\d+) (blue|red|green)", cube)
+            for cube in color_datas:
+                # Extract individual color and value
+                color_match = re.search(r"(\d+) (blue|red|green)", cube)
 
-                    if color_match:
-                        value = int(color_match.group(1))
-                        color = color_match.group(2)
+                if color_match:
+                    value = int(color_match.group(1))
+                    color = color_match.group(2)
 
-                        # Add color and value to the list
-                        color_revelations.append((color, value))
+                    # Add color and value to the list
+                    color_revelations.append((color, value))
 
-                # Add the game to the dict
-                games[game_id] = color_revelations
-            else:
-                print(f"No match found for line: {line}")
+            # Add the game to the dict
+            games[game_id] = color_revelations
+        else:
+            log.warning("No match found for line: %s", line)
 
     return games
 
@@ -82,15 +88,17 @@ def find_fewest_nb_of_cubes(games):
 
     return result
 
-def day2_1(file):
-    print(find_impossible_games(parse_games(file)))
+def part1(games):
+    return find_impossible_games(games)
 
 
-def day2_2(file):
-    print(find_fewest_nb_of_cubes(parse_games(file)))
+def part2(games):
+    return find_fewest_nb_of_cubes(games)
 
 
 if __name__ == '__main__':
-    day2_1(sys.argv[1])
-    day2_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
@@ -5,62 +5,53 @@
 #
 
 import sys
+from pathlib import Path
+
 import numpy as np
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.grid import parse_grid
+
+
+# The schematic contains the character codes, symbols may be replaced with the 's' character
+SYMBOL = ord('s')
+DIGITS = np.arange(ord('0'), ord('9') + 1)
+
+# Translation table erasing the symbols: the digits and '.' are kept while any other character becomes 's'
+ERASE_SYMBOLS = np.full(256, SYMBOL, dtype=np.uint8)
+ERASE_SYMBOLS[DIGITS] = DIGITS
+ERASE_SYMBOLS[ord('.')] = ord('.')
+
 
-def erase_symbol(ch):
-    if not ch.isdigit() and ch != '.':
-        return 's'
-    else:
-        return ch
+def is_digit(value):
+    return ord('0') <= value <= ord('9')
 
 
 def parse_number(schem, coord_x, coord_y):
     # Parse a number at a given coordinate search both forward AND backward
     number = ""
 
-    if schem[coord_x, coord_y].isdigit():
+    if is_digit(schem[coord_x, coord_y]):
         # Iterate over schematics looking forward
         x = coord_x
-        while x < schem.shape[0] and schem[x, coord_y].isdigit():
-            number += schem[x, coord_y]
+        while x < schem.shape[0] and is_digit(schem[x, coord_y]):
+            number += chr(schem[x, coord_y])
             x += 1
 
         # Do the same but looking backward instead
         x = coord_x - 1
-        while x >= 0 and schem[x, coord_y].isdigit():
-            number = schem[x, coord_y] + number
+        while x >= 0 and is_digit(schem[x, coord_y]):
+            number = chr(schem[x, coord_y]) + number
             x -= 1
 
     # Returns 0 if no number has been found
     return int(number) if number else 0
 
 
-def parse_schematic(file, with_erase_symbol=True):
-    # First parse to find the size of the heightmap
-    with open(file) as f:
-        size_x, size_y = 0, 0
-
-        for line in f:
-            size_x = max(size_x, len(line.rstrip()))
-            size_y += 1
-
-    # Initialize the array
-    schem = np.ndarray((size_x, size_y), dtype=object)
-
-    # Second parse to fill the array
-    with open(file) as f:
-        y = 0
-        for line in f:
-            line = line.rstrip()
-            if with_erase_symbol:
-                schem[:, y] = [erase_symbol(ch) for ch in line]
-            else:
-                schem[:, y] = [ch for ch in line]
-
-            y += 1
-
-    return schem
+def parse(text):
+    # Load the schematic in a single pass, the array is indexed by (x, y)
+    return parse_grid(text).T
 
 
 def find_numbers(schem):
@@ -70,15 +61,15 @@ def find_numbers(schem):
         x = 0
         while x < schem.shape[0]:
             # Find a digit in the schematics
-            if schem[x, y].isdigit():
+            if is_digit(schem[x, y]):
                 part_number = False
                 number = ""
                 # If we have fonud a digit continue to iterate while we still have digits and did not cross the limit
-                while x < schem.shape[0] and schem[x, y].isdigit():
-                    number += schem[x, y]
+                while x < schem.shape[0] and is_digit(schem[x, y]):
+                    number += chr(schem[x, y])
                     # Search in the neighborhood the digit if a symbol is present
                     # If so, we consider the number we're parsing as a part number
-                    if np.count_nonzero(schem[max(0, x - 1):x + 2, max(0, y - 1):y + 2] == 's') > 0:
+                    if np.count_nonzero(schem[max(0, x - 1):x + 2, max(0, y - 1):y + 2] == SYMBOL) > 0:
                         part_number = True
                     x += 1
 
@@ -96,7 +87,7 @@ def find_gears(schem):
     for y in range(schem.shape[1]):
         for x in range(schem.shape[0]):
             # Find a gear ('*' symbol)
-            if schem[x, y] == '*':
+            if schem[x, y] == ord('*'):
                 numbers = []
                 # Search in the neighborhood the gear if we have digit and call the parse_number function
                 # to get the number
@@ -124,17 +115,17 @@ def find_gears(schem):
     return result
 
 
-def day3_1(file):
-    schem = parse_schematic(file)
-    print(find_numbers(schem))
+def part1(schem):
+    return find_numbers(ERASE_SYMBOLS[schem])
 
 
-def day3_2(file):
-    schem = parse_schematic(file, with_erase_symbol=False)
-    print(find_gears(schem))
+def part2(schem):
+    return find_gears(schem)
 
 
 if __name__ == '__main__':
-    day3_1(sys.argv[1])
-    day3_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
@@ -6,34 +6,39 @@
 
 import sys
 import re
+from pathlib import Path
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.log import get_logger
 
-def parse_cards(file):
-    # Parse the input file and return a dict containing all the cards with their ID and their number of
-    # matching numbers
+log = get_logger(__name__)
+
+
+def parse(text):
+    # Parse the input and return a dict containing all the cards with their ID and their number of matching numbers
     cards = {}
 
-    with open(file) as f:
-        for line in f:
-            # Match the game format
-            match = re.search(r"Card\s+(\d+):(.+\|.+)", line)
+    for line in text.splitlines(keepends=True):
+        # Match the game format
+        match = re.search(r"Card\s+(\d+):(.+\|.+)", line)
 
-            if match:
-                # Extract the card ID
-                card_id = int(match.group(1))
+        if match:
+            # Extract the card ID
+            card_id = int(match.group(1))
 
-                # Extract the two lists of numbers
-                winning_numbers = match.group(2).split('|')[0].strip().split()
-                numbers_i_have = match.group(2).split('|')[1].strip().split()
+            # Extract the two lists of numbers
+            winning_numbers = match.group(2).split('|')[0].strip().split()
+            numbers_i_have = match.group(2).split('|')[1].strip().split()
 
-                # Find the common numbers
-                matching_numbers = set(map(int, winning_numbers)).intersection(set(map(int, numbers_i_have)))
+            # Find the common numbers
+            matching_numbers = set(map(int, winning_numbers)).intersection(set(map(int, numbers_i_have)))
 
-                # Write the number of matching numbers in the cards dict
-                cards[card_id] = len(matching_numbers)
+            # Write the number of matching numbers in the cards dict
+            cards[card_id] = len(matching_numbers)
 
-            else:
-                print(f"No match found for line: {line}")
+        else:
+            log.warning("No match found for line: %s", line)
 
     return cards
 
@@ -69,15 +74,17 @@ def find_total_scratchcards(cards):
     return len(cards_pool)
 
 
-def day4_1(file):
-    print(find_total_points(parse_cards(file)))
+def part1(cards):
+    return find_total_points(cards)
 
 
-def day4_2(file):
-    print(find_total_scratchcards(parse_cards(file)))
+def part2(cards):
+    return find_total_scratchcards(cards)
 
 
 if __name__ == '__main__':
-    day4_1(sys.argv[1])
-    day4_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
@@ -9,17 +9,17 @@ import re
 import math
 
 
-def parse_races(file):
-    with open(file) as f:
-        line = f.readline().rstrip()
-        match = re.search(r"Time:\s+(.+)", line)
+def parse(text):
+    lines = text.splitlines()
+    line = lines[0].rstrip()
+    match = re.search(r"Time:\s+(.+)", line)
 
-        times = list(map(int, re.split(r"\s+", match.group(1))))
+    times = list(map(int, re.split(r"\s+", match.group(1))))
 
-        line = f.readline().rstrip()
-        match = re.search(r"Distance:\s+(.+)", line)
+    line = lines[1].rstrip()
+    match = re.search(r"Distance:\s+(.+)", line)
 
-        distances = list(map(int, re.split(r"\s+", match.group(1))))
+    distances = list(map(int, re.split(r"\s+", match.group(1))))
 
     return list(zip(times, distances))
 
@@ -70,15 +70,17 @@ def find_nb_ways_for_records2(races):
     return max_range - min_range + 1
 
 
-def day6_1(file):
-    print(find_nb_ways_for_records(parse_races(file)))
+def part1(races):
+    return find_nb_ways_for_records(races)
 
 
-def day6_2(file):
-    print(find_nb_ways_for_records2(parse_races(file)))
+def part2(races):
+    return find_nb_ways_for_records2(races)
 
 
 if __name__ == '__main__':
-    day6_1(sys.argv[1])
-    day6_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
@@ -6,6 +6,13 @@
 
 import sys
 import re
+from pathlib import Path
+
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.log import get_logger
+
+log = get_logger(__name__)
 
 
 def get_cards_distribution(l):
@@ -94,7 +101,8 @@ class CardHand:
                 else:
                     self._pretended_type_strength = self._TYPE_STRENGTH_ONE_PAIR
 
-            print(f"Joker: {''.join(self.cards)} => {self._TYPE_STRENGTH_LABELS[self._pretended_type_strength - 1]}")
+            log.debug("Joker: %s => %s", ''.join(self.cards),
+                      self._TYPE_STRENGTH_LABELS[self._pretended_type_strength - 1])
 
     def _compute_strength(self, cards):
         counts = get_cards_counters(cards)
@@ -140,7 +148,7 @@ class CardHand:
                 type_strength = self._TYPE_STRENGTH_HIGH_CARD
 
             else:
-                print(f"Unknown card hand: {cards}")
+                log.warning("Unknown card hand: %s", cards)
 
         else:
             type_strength = self._pretended_type_strength
@@ -179,23 +187,24 @@ class CardHand:
         return strength_value
 
 
-def parse_card_hands(file, with_joker=False):
-    card_hands = []
+def parse(text):
+    # Return the list of hands as (cards, bid), the CardHand objects are built by each part since they depend on the
+    # joker rule
+    hands = []
 
-    with open(file) as f:
-        for line in f:
-            match = re.search(r"^(\w+)\s+(\d+)$", line.rstrip())
+    for line in text.splitlines(keepends=True):
+        match = re.search(r"^(\w+)\s+(\d+)$", line.rstrip())
 
-            if match:
-                card_hands.append(CardHand([c for c in match.group(1)], int(match.group(2)), with_joker=with_joker))
-            else:
-                print(f"No match found for line: {line}")
+        if match:
+            hands.append(([c for c in match.group(1)], int(match.group(2))))
+        else:
+            log.warning("No match found for line: %s", line)
 
-    return card_hands
+    return hands
 
 
-def day7_1(file):
-    card_hands = parse_card_hands(file)
+def part1(hands):
+    card_hands = [CardHand(cards, bid) for cards, bid in hands]
     card_hands_sorted = sorted(card_hands, key=lambda ch: ch.strength_score)
 
     total_winnings = 0
@@ -204,13 +213,13 @@ def day7_1(file):
         ch = card_hands_sorted[n]
         total_winnings += (n + 1) * ch.bid
 
-        print(ch, ch.strength, ch.strength_score)
+        log.debug("%s %s %d", ch, ch.strength, ch.strength_score)
 
-    print(total_winnings)
+    return total_winnings
 
 
-def day7_2(file):
-    card_hands = parse_card_hands(file, with_joker=True)
+def part2(hands):
+    card_hands = [CardHand(cards, bid, with_joker=True) for cards, bid in hands]
     card_hands_sorted = sorted(card_hands, key=lambda ch: ch.strength_score)
 
     total_winnings = 0
@@ -219,12 +228,14 @@ def day7_2(file):
         ch = card_hands_sorted[n]
         total_winnings += (n + 1) * ch.bid
 
-        print(ch, ch.strength, ch.strength_score)
+        log.debug("%s %s %d", ch, ch.strength, ch.strength_score)
 
-    print(total_winnings)
+    return total_winnings
 
 
 if __name__ == '__main__':
-    #day7_1(sys.argv[1])
-    day7_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    #print(part1(data))
+    print(part2(data))
 
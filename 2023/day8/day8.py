@@ -7,6 +7,13 @@
 import sys
 import re
 import math
+from pathlib import Path
+
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.log import get_logger
+
+log = get_logger(__name__)
 
 
 def lcm(x, y):
@@ -24,37 +31,38 @@ def lcm_of_list(numbers):
     return result
 
 
-class Node(tuple):
+class Node:
     """
-    Node subclass tuple with 2 values left and right
-    It adds .left and .right properties for more code clarity
+    Node holds the 2 nodes reached by going left and right
+    Its values are kept in slots, reading .left or .right is a plain attribute read (no property call)
     """
+    __slots__ = ("left", "right")
 
-    def __new__(cls, x=0, y=0):
-        return super(Node, cls).__new__(cls, tuple((x, y)))
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
 
-    @property
-    def left(self):
-        return self[0]
+    def __repr__(self):
+        return f"Node({self.left}, {self.right})"
 
-    @property
-    def right(self):
-        return self[1]
+    def __iter__(self):
+        yield self.left
+        yield self.right
 
 
-def parse_file(file):
+def parse(text):
     nodes = {}
-    with open(file) as f:
-        instructions = [c for c in f.readline().rstrip()]
+    lines = text.splitlines()
+    instructions = [c for c in lines[0].rstrip()]
 
-        for line in f:
-            line = line.rstrip()
+    for line in lines[1:]:
+        line = line.rstrip()
 
-            # Match the line format and try to find the match in the line
-            match = re.search(r"(\w+) = \((\w+),\s*(\w+)\)", line)
+        # Match the line format and try to find the match in the line
+        match = re.search(r"(\w+) = \((\w+),\s*(\w+)\)", line)
 
-            if match:
-                nodes[match.group(1)] = Node(match.group(2), match.group(3))
+        if match:
+            nodes[match.group(1)] = Node(match.group(2), match.group(3))
 
     return instructions, nodes
 
@@ -72,7 +80,7 @@ def lookup_nodes(instructions, nodes, starting_node, as_ghost=False):
         elif instructions[instruction_index] == 'R':
             current_node = nodes[current_node].right
         else:
-            print(f"Unknown instruction: {instructions[instruction_index]}")
+            log.warning("Unknown instruction: %s", instructions[instruction_index])
 
         instruction_index = (instruction_index + 1) % len(instructions)
         nb_steps += 1
@@ -86,20 +94,22 @@ def lookup_nodes_as_ghost(instructions, nodes):
     return lcm_of_list([lookup_nodes(instructions, nodes, node, as_ghost=True) for node in current_nodes])
 
 
-def day8_1(file):
-    instructions, nodes = parse_file(file)
-    print(lookup_nodes(instructions, nodes, 'AAA'))
+def part1(network):
+    instructions, nodes = network
+    return lookup_nodes(instructions, nodes, 'AAA')
 
 
-def day8_2(file):
+def part2(network):
     # In this part, we cannot proceed as in part 1, as the number of iterations required is extremely high. Instead,
     # the idea is to look at the minimum number of steps required for each ghost and calculate the LCM of
     # these numbers.
-    instructions, nodes = parse_file(file)
-    print(lookup_nodes_as_ghost(instructions, nodes))
+    instructions, nodes = network
+    return lookup_nodes_as_ghost(instructions, nodes)
 
 
 if __name__ == '__main__':
-    day8_1(sys.argv[1])
-    day8_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
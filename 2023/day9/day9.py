@@ -5,16 +5,16 @@
 #
 
 import sys
-import re
+from pathlib import Path
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.numbers import parse_ints, split_lists
 
-def parse_report(file):
-    report = []
-    with open(file) as f:
-        for line in f:
-            report.append([int(v) for v in re.split(r'\s+', line.strip())])
 
-    return report
+def parse(text):
+    # One history of values by line
+    return [values for values in split_lists(*parse_ints(text, line_offsets=True)) if values]
 
 
 def find_extrapolated_value(values, backward_mode=False):
@@ -57,25 +57,25 @@ def find_extrapolated_value(values, backward_mode=False):
     return extrapolated_value
 
 
-def day9_1(file):
-    report = parse_report(file)
+def part1(report):
     extrapolated_values = 0
     for values in report:
         extrapolated_values += find_extrapolated_value(values)
 
-    print(extrapolated_values)
+    return extrapolated_values
 
 
-def day9_2(file):
-    report = parse_report(file)
+def part2(report):
     extrapolated_values = 0
     for values in report:
         extrapolated_values += find_extrapolated_value(values, backward_mode=True)
 
-    print(extrapolated_values)
+    return extrapolated_values
 
 
 if __name__ == '__main__':
-    day9_1(sys.argv[1])
-    day9_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
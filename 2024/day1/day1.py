@@ -5,45 +5,46 @@
 #
 
 import sys
-import re
+from pathlib import Path
 
+import numpy as np
 
-def parse_file(file):
-    with open(file) as f:
-        left_values = []
-        right_values = []
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.numbers import parse_ints
 
-        for line in f:
-            if values := re.split(r' +', line.strip()):
-                left_values.append(int(values[0]))
-                right_values.append(int(values[1]))
 
-    return left_values, right_values
+def parse(text):
+    # Return the left and the right lists as int64 arrays, each line gives a value of both
+    values = parse_ints(text).reshape(-1, 2)
 
+    return values[:, 0], values[:, 1]
 
-def print_sum(file):
-    left_values, right_values = parse_file(file)
-    left_values = sorted(left_values)
-    right_values = sorted(right_values)
 
-    print(sum([abs(right_values[i] - left_values[i]) for i in range(len(left_values))]))
+def find_sum(left_values, right_values):
+    return int(np.abs(np.sort(right_values) - np.sort(left_values)).sum())
 
 
-def print_similarity_score(file):
-    left_values, right_values = parse_file(file)
+def find_similarity_score(left_values, right_values):
+    # Count the occurrences of each value of the right list, then look the values of the left list up in them
+    values, counts = np.unique(right_values, return_counts=True)
+    indexes = np.minimum(np.searchsorted(values, left_values), len(values) - 1)
+    found = values[indexes] == left_values
 
-    print(sum([left_values[i] * right_values.count(left_values[i]) for i in range(len(left_values))]))
+    return int((left_values[found] * counts[indexes[found]]).sum())
 
 
-def day1_1(file):
-    print_sum(file)
+def part1(lists):
+    return find_sum(*lists)
 
 
-def day1_2(file):
-    print_similarity_score(file)
+def part2(lists):
+    return find_similarity_score(*lists)
 
 
 if __name__ == '__main__':
-    day1_1(sys.argv[1])
-    day1_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
@@ -5,7 +5,14 @@
 #
 
 import sys
-import re
+from pathlib import Path
+
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.log import get_logger
+from aoc.numbers import parse_ints, split_lists
+
+log = get_logger(__name__)
 
 
 def is_monotonic(values):
@@ -18,28 +25,22 @@ def are_adjacent_differences_valid(values):
     return all(1 <= abs(values[i] - values[i + 1]) <= 3 for i in range(len(values) - 1))
 
 
-def parse_file(file):
-    with open(file) as f:
-        lines = []
-        for line in f:
-            lines.append(list(map(int, re.split(r' +', line.strip()))))
-
-    return lines
+def parse(text):
+    # One report of values by line
+    return [values for values in split_lists(*parse_ints(text, line_offsets=True)) if values]
 
 
-def print_safe_list_nb(file):
-    lines = parse_file(file)
+def find_safe_list_nb(lines):
     safe_lists = 0
 
     for values in lines:
         if is_monotonic(values) and are_adjacent_differences_valid(values):
             safe_lists += 1
 
-    print(safe_lists)
+    return safe_lists
 
 
-def print_safe_list_with_toleration(file):
-    lines = parse_file(file)
+def find_safe_list_with_toleration(lines):
     safe_lists = 0
 
     for values in lines:
@@ -49,23 +50,25 @@ def print_safe_list_with_toleration(file):
             for i in range(len(values)):
                 new_values = values[:]
                 new_values.pop(i)
-                print(values, new_values)
+                log.debug("%s %s", values, new_values)
                 if is_monotonic(new_values) and are_adjacent_differences_valid(new_values):
                     safe_lists += 1
                     break
 
-    print(safe_lists)
+    return safe_lists
 
 
-def day2_1(file):
-    print_safe_list_nb(file)
+def part1(lines):
+    return find_safe_list_nb(lines)
 
 
-def day2_2(file):
-    print_safe_list_with_toleration(file)
+def part2(lines):
+    return find_safe_list_with_toleration(lines)
 
 
 if __name__ == '__main__':
-    day2_1(sys.argv[1])
-    day2_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
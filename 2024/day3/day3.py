@@ -8,21 +8,17 @@ import sys
 import re
 
 
-def parse_file(file):
-    with open(file) as f:
-        string = "".join(f.readlines())
-
+def find_muls_sum(string):
     # Find all occurrences of the pattern `mul(x, y)` in the substring,
     # where x and y are integers up to 3 digits long.
     muls = re.findall(r'mul\((\d{1,3}),(\d{1,3})\)', string)
 
     # Calculate the product of each pair of x and y
-    print(sum([int(mul[0]) * int(mul[1]) for mul in muls]))
+    return sum([int(mul[0]) * int(mul[1]) for mul in muls])
 
 
-def parse_file_with_disable_enable(file):
-    with open(file) as f:
-        string = "".join(l.rstrip() for l in f)
+def find_muls_sum_with_disable_enable(string):
+    string = "".join(l.rstrip() for l in string.splitlines())
 
     # Find all occurrences of the pattern `don't()` in the input string
     # and record their start indices along with the label 'dont'.
@@ -57,18 +53,25 @@ def parse_file_with_disable_enable(file):
             # For each match, calculate the product of x and y, and add it to the result.
             result += sum([int(mul[0]) * int(mul[1]) for mul in muls])
 
-    print(result)
+    return result
+
+
+def parse(text):
+    # The program is kept as is, the instructions are found by each part
+    return text
 
 
-def day3_1(file):
-    parse_file(file)
+def part1(string):
+    return find_muls_sum(string)
 
 
-def day3_2(file):
-    parse_file_with_disable_enable(file)
+def part2(string):
+    return find_muls_sum_with_disable_enable(string)
 
 
 if __name__ == '__main__':
-    day3_1(sys.argv[1])
-    day3_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
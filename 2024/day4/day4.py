@@ -4,30 +4,20 @@
 # https://adventofcode.com/2024/day/4
 #
 
-import sys
-import numpy as np
 import re
+import sys
+from pathlib import Path
 
+import numpy as np
 
-def parse_grid(file):
-    with open(file) as f:
-        size_x, size_y = 0, 0
-
-        for line in f:
-            size_x = max(size_x, len(line.rstrip()))
-            size_y += 1
-
-        # Initialize the array
-        grid = np.ndarray((size_x, size_y), dtype=int)
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.grid import parse_grid
 
-    # Second parse to fill the array
-    with open(file) as f:
-        y = 0
-        for line in f:
-            grid[:, y] = [ord(ch) for ch in line.rstrip()]
-            y += 1
 
-    return grid
+def parse(text):
+    # Load the character codes in a single pass, the array is indexed by (x, y)
+    return parse_grid(text).T
 
 
 def get_nb_xmas_in_line(line):
@@ -63,7 +53,7 @@ def find_xmas(grid):
         nb_xmas += get_nb_xmas_in_line(string)
         nb_xmas += get_nb_xmas_in_line(string[::-1])
 
-    print(nb_xmas)
+    return nb_xmas
 
 
 def find_xmas_x_shaped(grid):
@@ -101,19 +91,19 @@ def find_xmas_x_shaped(grid):
                         nb_xmas += 1
                         break
 
-    print(nb_xmas)
+    return nb_xmas
 
 
-def day4_1(file):
-    grid = parse_grid(file)
-    find_xmas(grid)
+def part1(grid):
+    return find_xmas(grid)
 
 
-def day4_2(file):
-    grid = parse_grid(file)
-    find_xmas_x_shaped(grid)
+def part2(grid):
+    return find_xmas_x_shaped(grid)
 
 
 if __name__ == '__main__':
-    day4_1(sys.argv[1])
-    day4_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
@@ -95,38 +95,48 @@ def parse_incorrect_update(pages, steps):
     return int(steps[len(steps) // 2])
 
 
-def parse_file(file, part2=False):
+def parse(text):
+    # Return the pages linked by the ordering rules, and the list of updates
     pages = []
-    result = 0
+    updates = []
+
+    for line in text.splitlines():
+        line = line.strip()
+        if line.find("|") > 0:
+            parse_page_ordering_rule(pages, line)
+
+        elif line.find(",") > 0:
+            # Split the input line into page steps using a comma as the delimiter
+            updates.append(line.split(','))
 
-    with open(file) as f:
-        for line in f:
-            line = line.strip()
-            if line.find("|") > 0:
-                parse_page_ordering_rule(pages, line)
+    return pages, updates
 
-            elif line.find(",") > 0:
-                # Split the input line into page steps using a comma as the delimiter
-                steps = line.split(',')
 
-                if not part2:
-                    result += parse_update(pages, steps)
-                else:
-                    middle_page_number = parse_update(pages, steps)
-                    if middle_page_number == 0:
-                        result += parse_incorrect_update(pages, steps)
+def part1(manual):
+    pages, updates = manual
+    result = 0
+
+    for steps in updates:
+        result += parse_update(pages, steps)
 
-    print(result)
+    return result
 
 
-def day5_1(file):
-    parse_file(file)
+def part2(manual):
+    pages, updates = manual
+    result = 0
 
+    for steps in updates:
+        middle_page_number = parse_update(pages, steps)
+        if middle_page_number == 0:
+            # The steps are reordered in place, so we work on a copy
+            result += parse_incorrect_update(pages, steps[:])
 
-def day5_2(file):
-    parse_file(file, part2=True)
+    return result
 
 
 if __name__ == '__main__':
-    day5_1(sys.argv[1])
-    day5_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
@@ -5,8 +5,65 @@
 #
 
 import sys
+from pathlib import Path
+
 import numpy as np
-import re
+
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc import jit
+from aoc.engines import dispatch
+from aoc.grid import parse_grid, translation_table
+
+
+@jit.kernel
+def walk_guard(grid, x, y, direction, vectors, obstruct):
+    # Kernel of LabGrid.move_guard() for numba, the visited positions are marked in an array instead of a list
+    # Return the final position and direction of the guard, and the positions visited in the order of their first visit
+    visited = np.zeros((grid.shape[0], grid.shape[1]), dtype=np.bool_)
+    order = np.empty((grid.shape[0] * grid.shape[1], 2), dtype=np.int64)
+    visited[x, y] = True
+    order[0, 0], order[0, 1] = x, y
+    nb_position = 1
+
+    while True:
+        next_x, next_y = x + vectors[direction, 0], y + vectors[direction, 1]
+        if not (0 <= next_x < grid.shape[0] and 0 <= next_y < grid.shape[1]):
+            break
+
+        if grid[next_x, next_y] == obstruct:
+            direction = (direction + 1) % 4
+        else:
+            x, y = next_x, next_y
+            if not visited[x, y]:
+                visited[x, y] = True
+                order[nb_position, 0], order[nb_position, 1] = x, y
+                nb_position += 1
+
+    return x, y, direction, order[:nb_position]
+
+
+@jit.kernel
+def walk_guard_with_direction(grid, x, y, direction, vectors, obstruct):
+    # Kernel of LabGrid.move_guard_with_direction() for numba
+    # Return the final position and direction of the guard, and whether it walks in a loop
+    visited = np.zeros((grid.shape[0], grid.shape[1], 4), dtype=np.bool_)
+    visited[x, y, direction] = True
+
+    while True:
+        next_x, next_y = x + vectors[direction, 0], y + vectors[direction, 1]
+        if not (0 <= next_x < grid.shape[0] and 0 <= next_y < grid.shape[1]):
+            break
+
+        if grid[next_x, next_y] == obstruct:
+            direction = (direction + 1) % 4
+        else:
+            x, y = next_x, next_y
+            if visited[x, y, direction]:
+                return x, y, direction, True
+            visited[x, y, direction] = True
+
+    return x, y, direction, False
 
 
 class LabGrid:
@@ -19,14 +76,17 @@ class LabGrid:
     }
     GUARD_DIRECTIONS = ['^', '>', 'v', '<']
     GUARD_VECTORS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-
-    def __init__(self, file):
-        self.file = file
-        self.grid = None
-        self.guard_direction = 0
-        self.guard_position = [0, 0]
-        self.guard_initial_position = 0
-        self.guard_initial_direction = [0, 0]
+    # The vectors as an array, for the compiled kernels
+    GUARD_VECTOR_ARRAY = np.array(GUARD_VECTORS, dtype=np.int64)
+
+    def __init__(self, grid, guard_position, guard_direction):
+        # The obstructions are added to the grid while looking for loops (see find_loops), so we work on a copy of the
+        # parsed one
+        self.grid = np.copy(grid)
+        self.guard_direction = guard_direction
+        self.guard_position = list(guard_position)
+        self.guard_initial_position = self.guard_position[:]
+        self.guard_initial_direction = self.guard_direction
         self.visited_position = []
 
     def display_grid(self):
@@ -41,35 +101,7 @@ class LabGrid:
 
         print(self.guard_position)
 
-    def parse_grid(self):
-        with open(self.file) as f:
-            size_x, size_y = 0, 0
-
-            for line in f:
-                size_x = max(size_x, len(line.rstrip()))
-                size_y += 1
-
-            # Initialize the array
-            self.grid = np.ndarray((size_x, size_y), dtype=int)
-
-        # Second parse to fill the array
-        with open(self.file) as f:
-            y = 0
-            for line in f:
-                line = line.rstrip()
-                for x in range(len(line)):
-                    if line[x] in self.GUARD_DIRECTIONS:
-                        self.guard_direction = self.GUARD_DIRECTIONS.index(line[x])
-                        self.guard_position[0], self.guard_position[1] = x, y
-                        self.grid[x, y] = self.GRID_EMPTY
-                    else:
-                        self.grid[x, y] = self.GRID[line[x]]
-                y += 1
-
-        self.guard_initial_position = self.guard_position[:]
-        self.guard_initial_direction = self.guard_direction
-
-
+    @dispatch
     def move_guard(self):
         next_position = self.guard_position[:]  # Copy the current guard position
         nb_position = 1  # Counter for unique positions visited
@@ -104,6 +136,16 @@ class LabGrid:
 
         return nb_position
 
+    @jit.engine(move_guard)
+    def move_guard_jit(self):
+        # Same walk, on the array of the grid
+        self.guard_position[0], self.guard_position[1], self.guard_direction, order = walk_guard(
+            self.grid, self.guard_position[0], self.guard_position[1], self.guard_direction, self.GUARD_VECTOR_ARRAY,
+            self.GRID_OBSTRUCT)
+        self.visited_position = [(x, y) for x, y in order.tolist()]
+
+        return len(self.visited_position)
+
     def reset_position(self):
         # Reset the position
         self.guard_position[0], self.guard_position[1] = self.guard_initial_position[0], self.guard_initial_position[1]
@@ -125,6 +167,7 @@ class LabGrid:
 
         return nb_loops
 
+    @dispatch
     def move_guard_with_direction(self):
         # Same algorithm as move_guard() but with direction recorded to detect loops
 
@@ -165,18 +208,40 @@ class LabGrid:
 
         return is_loop
 
-def day6_1(file):
-    labgrid = LabGrid(file)
-    labgrid.parse_grid()
-    print(labgrid.move_guard())
+    @jit.engine(move_guard_with_direction)
+    def move_guard_with_direction_jit(self):
+        # Same walk, on the array of the grid
+        self.guard_position[0], self.guard_position[1], self.guard_direction, is_loop = walk_guard_with_direction(
+            self.grid, self.guard_position[0], self.guard_position[1], self.guard_direction, self.GUARD_VECTOR_ARRAY,
+            self.GRID_OBSTRUCT)
+
+        return is_loop
+
+def parse(text):
+    # Load the grid in a single pass, the array is indexed by (x, y)
+    # The guard characters are not in GRID and are converted to GRID_EMPTY
+    chars = parse_grid(text)
+    grid = translation_table(LabGrid.GRID, default=LabGrid.GRID_EMPTY)[chars].T
+
+    # Find the guard, its direction is given by the character
+    guard_codes = [ord(ch) for ch in LabGrid.GUARD_DIRECTIONS]
+    y, x = np.argwhere(np.isin(chars, guard_codes))[0]
+
+    return grid, (int(x), int(y)), guard_codes.index(chars[y, x])
+
+
+def part1(lab):
+    labgrid = LabGrid(*lab)
+    return labgrid.move_guard()
 
 
-def day6_2(file):
-    labgrid = LabGrid(file)
-    labgrid.parse_grid()
-    print(labgrid.find_loops())
+def part2(lab):
+    labgrid = LabGrid(*lab)
+    return labgrid.find_loops()
 
 
 if __name__ == '__main__':
-    day6_1(sys.argv[1])
-    day6_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
@@ -5,7 +5,11 @@
 #
 
 import sys
-import re
+from pathlib import Path
+
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.numbers import parse_ints, split_lists
 
 
 def increment_base3(base3_str):
@@ -23,16 +27,15 @@ def increment_base3(base3_str):
     return base3_result or '0'
 
 
-def parse_file(file):
+def parse(text):
+    # Each line gives the result of an equation, then its numbers
     equations = []
-    with open(file) as f:
-        for line in f:
-            line = line.strip()
-            if m := re.search(r'^(\d+): (.*)$', line):
-                equations.append({
-                    'result': int(m.group(1)),
-                    'numbers': [int(n) for n in m.group(2).split(' ')]
-                })
+    for values in split_lists(*parse_ints(text, line_offsets=True)):
+        if values:
+            equations.append({
+                'result': values[0],
+                'numbers': values[1:]
+            })
 
     return equations
 
@@ -101,16 +104,16 @@ def find_calibration_result_3ops(equations):
     return calibration_result
 
 
-def day7_1(file):
-    equations = parse_file(file)
-    print(find_calibration_result(equations))
+def part1(equations):
+    return find_calibration_result(equations)
 
 
-def day7_2(file):
-    equations = parse_file(file)
-    print(find_calibration_result_3ops(equations))
+def part2(equations):
+    return find_calibration_result_3ops(equations)
 
 
 if __name__ == '__main__':
-    day7_1(sys.argv[1])
-    day7_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
@@ -5,8 +5,14 @@
 #
 
 import sys
+from pathlib import Path
+
 import numpy as np
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.grid import parse_grid
+
 
 def display_grid(grid):
     # For debugging purpose, display the grid array
@@ -15,34 +21,20 @@ def display_grid(grid):
         print(' '.join(cells))
 
 
-def parse_grid(file):
+def parse(text):
     antennas_list = {}
 
-    with open(file) as f:
-        size_x, size_y = 0, 0
-
-        for line in f:
-            size_x = max(size_x, len(line.rstrip()))
-            size_y += 1
-
-        # Initialize the array
-        grid = np.ndarray((size_x, size_y), dtype=int)
-
-    # Second parse to fill the array
-    with open(file) as f:
-        y = 0
-        for line in f:
-            line = line.rstrip()
-            for x in range(len(line)):
-                if line[x] == '.':
-                    grid[x, y] = 0
-                else:
-                    grid[x, y] = ord(line[x])
-                    if ord(line[x]) not in antennas_list:
-                        antennas_list[ord(line[x])] = [(x, y)]
-                    else:
-                        antennas_list[ord(line[x])].append((x, y))
-            y += 1
+    # Load the character codes in a single pass, '.' is replaced with 0
+    chars = parse_grid(text)
+    grid = np.where(chars == ord('.'), 0, chars).T
+
+    # List the antennas by frequency, in the order of the file
+    for y, x in np.argwhere(chars != ord('.')):
+        freq = int(chars[y, x])
+        if freq not in antennas_list:
+            antennas_list[freq] = [(int(x), int(y))]
+        else:
+            antennas_list[freq].append((int(x), int(y)))
 
     return grid, antennas_list
 
@@ -50,7 +42,7 @@ def parse_grid(file):
 def find_antinodes(grid, antennas_list):
     nb_antinodes = 0
     # The antinodes found will be noted on a separate grid, in order to be sure not counting them twice
-    antinodes_grid = np.zeros(grid.shape, dtype=int)
+    antinodes_grid = np.zeros(grid.shape, dtype=np.uint8, order='F')
 
     for freq, antennas in antennas_list.items():
         # Get all couples of antennas with the same frequency.
@@ -70,7 +62,7 @@ def find_antinodes(grid, antennas_list):
 def find_antinodes2(grid, antennas_list):
     nb_antinodes = 0
     # The antinodes found will be noted on a separate grid, in order to be sure not counting them twice
-    antinodes_grid = np.zeros(grid.shape, dtype=int)
+    antinodes_grid = np.zeros(grid.shape, dtype=np.uint8, order='F')
 
     for freq, antennas in antennas_list.items():
         # Get all couples of antennas with the same frequency.
@@ -102,16 +94,18 @@ def find_antinodes2(grid, antennas_list):
     return nb_antinodes
 
 
-def day8_1(file):
-    grid, antennas_list = parse_grid(file)
-    print(find_antinodes(grid, antennas_list))
+def part1(city):
+    grid, antennas_list = city
+    return find_antinodes(grid, antennas_list)
 
 
-def day8_2(file):
-    grid, antennas_list = parse_grid(file)
-    print(find_antinodes2(grid, antennas_list))
+def part2(city):
+    grid, antennas_list = city
+    return find_antinodes2(grid, antennas_list)
 
 
 if __name__ == '__main__':
-    day8_1(sys.argv[1])
-    day8_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
@@ -5,7 +5,6 @@
 #
 
 import sys
-import numpy as np
 
 
 class Blocks:
@@ -19,20 +18,15 @@ class Blocks:
 
     def display_blocks(self):
         # For debugging purpose, display the blocks array
-        cells = [f"{self.blocks[x]}" if self.blocks[x] != -1 else '.' for x in range(self.blocks.shape[0])]
+        cells = [f"{self.blocks[x]}" if self.blocks[x] != -1 else '.' for x in range(len(self.blocks))]
         print(''.join(cells))
 
-    def parse_map(self, file):
-        with open(file) as f:
-            # Convert the map line into a list of integers representing block sizes.
-            map_line = [int(x) for x in f.readline().strip()]
-            # Initialize a NumPy array to represent the blocks.
-            # The size of the array is the total sum of block sizes.
-            self.blocks = np.ndarray((sum([block_size for block_size in map_line]),), dtype=int)
-
-            # Fill the blocks array with the default value indicating free blocks. The array will be filled by
-            # non-free blocks with their ID later on.
-            self.blocks.fill(self.BLOCK_FREE)
+    def parse_map(self, map_line):
+        # Initialize a list to represent the blocks, its size is the total sum of block sizes. The blocks are read and
+        # written one at a time, which is faster with a list than with a NumPy array.
+        # Fill the list with the default value indicating free blocks. The list will be filled by non-free blocks with
+        # their ID later on.
+        self.blocks = [self.BLOCK_FREE] * sum(map_line)
 
         map_index = 0
         block_index = 0
@@ -68,7 +62,7 @@ class Blocks:
                 block_id += 1
 
     def find_first_free_block(self, offset=0):
-        for i in range(offset, self.blocks.shape[0]):
+        for i in range(offset, len(self.blocks)):
             if self.blocks[i] == self.BLOCK_FREE:
                 return i
 
@@ -95,7 +89,7 @@ class Blocks:
         free_block_offset = 0
 
         # Iterate over the blocks array from the last element to the first.
-        for i in range(self.blocks.shape[0] - 1, 0, -1):
+        for i in range(len(self.blocks) - 1, 0, -1):
             # Check if the current block is not free.
             if self.blocks[i] != self.BLOCK_FREE:
                 # Find the first free block starting from the given offset. This is for time optimization only, as we're
@@ -135,27 +129,34 @@ class Blocks:
 
     def checksum_blocks(self):
         checksum = 0
-        for i in range(self.blocks.shape[0]):
+        for i in range(len(self.blocks)):
             if self.blocks[i] != self.BLOCK_FREE:
                 checksum += i * self.blocks[i]
 
         return checksum
 
 
-def day9_1(file):
+def parse(text):
+    # Convert the map line into a list of integers representing block sizes.
+    return [int(x) for x in text.split("\n", 1)[0].strip()]
+
+
+def part1(map_line):
     blocks = Blocks()
-    blocks.parse_map(file)
+    blocks.parse_map(map_line)
     blocks.compact_blocks()
-    print(blocks.checksum_blocks())
+    return blocks.checksum_blocks()
 
 
-def day9_2(file):
+def part2(map_line):
     blocks = Blocks()
-    blocks.parse_map(file)
+    blocks.parse_map(map_line)
     blocks.compact_blocks_without_frag()
-    print(blocks.checksum_blocks())
+    return blocks.checksum_blocks()
 
 
 if __name__ == '__main__':
-    day9_1(sys.argv[1])
-    day9_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
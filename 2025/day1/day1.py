@@ -6,52 +6,52 @@
 
 import sys
 
-def rotate_dial(file):
+def parse(text):
+    # Each rotation is a direction and a number of ticks
+    return [(line[0], int(line[1:])) for line in text.splitlines() if line]
+
+def rotate_dial(rotations):
     dial_value = 50
     password = 0
 
-    with open(file) as f:
-        for line in f:
-            if line[0] == "L":
-                tick_number = int(line[1:])
-                dial_value = (dial_value - tick_number) % 100
-            elif line[0] == "R":
-                tick_number = int(line[1:])
-                dial_value = (dial_value + tick_number) % 100
+    for direction, tick_number in rotations:
+        if direction == "L":
+            dial_value = (dial_value - tick_number) % 100
+        elif direction == "R":
+            dial_value = (dial_value + tick_number) % 100
 
-            if dial_value == 0:
-                password = password + 1
+        if dial_value == 0:
+            password = password + 1
 
     return password
 
-def rotate_dial2(file):
+def rotate_dial2(rotations):
     dial_value = 50
     password = 0
 
-    with open(file) as f:
-        for line in f:
-            tick_number = int(line[1:])
+    for direction, tick_number in rotations:
+        if direction == "L":
+            pace = -1
+        elif direction == "R":
+            pace = 1
 
-            if line[0] == "L":
-                pace = -1
-            elif line[0] == "R":
-                pace = 1
-
-            for n in range(tick_number):
-                dial_value = (dial_value + pace) % 100
-                if dial_value == 0:
-                    password = password + 1
+        for n in range(tick_number):
+            dial_value = (dial_value + pace) % 100
+            if dial_value == 0:
+                password = password + 1
 
     return password
 
-def day1_1(file):
-    print(rotate_dial(file))
+def part1(rotations):
+    return rotate_dial(rotations)
 
-def day1_2(file):
-    print(rotate_dial2(file))
+def part2(rotations):
+    return rotate_dial2(rotations)
 
 
 if __name__ == '__main__':
-    day1_1(sys.argv[1])
-    day1_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
@@ -26,27 +26,29 @@ def is_valid2(nb):
         return False
 
 
-def parse_input(file, is_valid_funct):
-    response = 0
-    with open(file) as f:
-        ranges = f.readline().rstrip()
+def parse(text):
+    ranges = text.split("\n", 1)[0].rstrip()
+    return [tuple(int(x) for x in rg.split("-")) for rg in ranges.split(",")]
 
-        for rg in ranges.split(","):
-            rg_start, rg_end = rg.split("-")
-            for n in range(int(rg_start), int(rg_end) + 1):
-                if is_valid_funct(n):
-                    response += n
+def sum_valid(ranges, is_valid_funct):
+    response = 0
+    for rg_start, rg_end in ranges:
+        for n in range(rg_start, rg_end + 1):
+            if is_valid_funct(n):
+                response += n
 
     return response
 
-def day2_1(file):
-    print(parse_input(file, is_valid))
+def part1(ranges):
+    return sum_valid(ranges, is_valid)
 
-def day2_2(file):
-    print(parse_input(file, is_valid2))
+def part2(ranges):
+    return sum_valid(ranges, is_valid2)
 
 
 if __name__ == '__main__':
-    #day2_1(sys.argv[1])
-    day2_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    #print(part1(data))
+    print(part2(data))
 
@@ -50,33 +50,20 @@ def max_subsequence(list_nb, k):
     # We keep only the first k digits.
     return int("".join(map(str, stack[:k])))
 
-def parse_file(file):
-    result = 0
-    with open(file) as f:
-        for line in f:
-            line = line.rstrip()
-            result += find_highest(line)
+def parse(text):
+    return [line.rstrip() for line in text.splitlines()]
 
-    return result
+def part1(banks):
+    return sum(find_highest(line) for line in banks)
 
-def parse_file2(file):
-    result = 0
-    with open(file) as f:
-        for line in f:
-            line = line.rstrip()
-            result += max_subsequence(line, 12)
-
-    return result
-
-def day3_1(file):
-    print(parse_file(file))
-
-def day3_2(file):
-    print(parse_file2(file))
+def part2(banks):
+    return sum(max_subsequence(line, 12) for line in banks)
     #print(max_subsequence([ int(x) for x in list("818181911112111") ], 12))
 
 
 if __name__ == '__main__':
-    #day3_1(sys.argv[1])
-    day3_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    #print(part1(data))
+    print(part2(data))
 
@@ -5,8 +5,14 @@
 #
 
 import sys
+from pathlib import Path
+
 import numpy as np
 
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.grid import parse_grid, translation_table
+
 mapping = { '.': 0, '@': 1, 'x': 2 }
 
 def display_grid(grid):
@@ -16,25 +22,9 @@ def display_grid(grid):
         print(''.join([reverse_mapping[grid[x, y]] for x in range(grid.shape[0])]))
 
 
-def parse_grid(file):
-    with open(file) as f:
-        size_x, size_y = 0, 0
-
-        for line in f:
-            size_x = max(size_x, len(line.rstrip()))
-            size_y += 1
-
-        # Initialize the array
-        grid = np.ndarray((size_x, size_y), dtype=int)
-
-    # Second parse to fill the array
-    with open(file) as f:
-        y = 0
-        for line in f:
-            grid[:, y] = [mapping[ch] for ch in line.rstrip()]
-            y += 1
-
-    return grid
+def parse(text):
+    # Load the grid in a single pass, the array is indexed by (x, y)
+    return parse_grid(text, translation_table(mapping)).T
 
 def roll_can_removed(grid, x, y):
     grid_adjacent = grid[max(0, x - 1):min(x + 2, grid.shape[0]), max(0, y - 1):min(y + 2, grid.shape[1])]
@@ -71,14 +61,16 @@ def get_nb_rolls_removed(grid):
 
     return nb_rolls_removed
 
-def day4_1(file):
-    print(get_nb_rolls_accessible(parse_grid(file)))
+def part1(grid):
+    return get_nb_rolls_accessible(grid)
 
-def day4_2(file):
-    print(get_nb_rolls_removed(parse_grid(file)))
+def part2(grid):
+    return get_nb_rolls_removed(grid)
 
 
 if __name__ == '__main__':
-    day4_1(sys.argv[1])
-    day4_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
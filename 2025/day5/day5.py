@@ -5,65 +5,50 @@
 #
 
 import sys
+from pathlib import Path
 
+import numpy as np
 
-def merge_ranges(ranges):
-    # Ranges needs to be sorted by starting interval
-    ranges.sort()
+# Make the shared aoc package importable when running this file as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from aoc.intervals import IntervalSet
+from aoc.numbers import parse_ints, split_lists
 
-    merged = []
-    start, end = ranges[0]
 
-    for s, e in ranges[1:]:
-
-        if s <= end:  # overlap
-            end = max(end, e)
-
-        else:  # no overlap, then push previous and start new
-            merged.append((start, end))
-            start, end = s, e
-
-    merged.append((start, end))
-
-    return merged
-
-def parse_file(file):
+def parse(text):
     fresh_ranges = []
     available_ingredients = []
 
-    with open(file) as f:
-        for line in f:
-            if '-' in line:
-                begin, end = line.rstrip().split('-')
-                fresh_ranges.append((int(begin), int(end)))
-            elif line.rstrip().isdigit():
-                available_ingredients.append(int(line))
+    # The ranges "begin-end" give 2 integers, the ingredients a single one
+    for values in split_lists(*parse_ints(text, line_offsets=True)):
+        if len(values) == 2:
+            fresh_ranges.append(tuple(values))
+        elif len(values) == 1:
+            available_ingredients.append(values[0])
 
     return fresh_ranges, available_ingredients
 
-def get_nb_fresh_ingredients(file):
-    fresh_ranges, available_ingredients = parse_file(file)
-    fresh_ingredients = []
-
-    for ingredient_id in available_ingredients:
-        for fresh_range in fresh_ranges:
-            if fresh_range[0] <= ingredient_id <= fresh_range[1]:
-                fresh_ingredients.append(ingredient_id)
-
-    return len(set(fresh_ingredients))
+def get_nb_fresh_ingredients(fresh_ranges, available_ingredients):
+    # Each ingredient is counted once, even when it is listed several times
+    fresh = IntervalSet.from_inclusive(fresh_ranges)
+    return int(fresh.contains(np.unique(available_ingredients)).sum())
 
-def get_nb_all_fresh_ingredients(file):
-    fresh_ranges, available_ingredients = parse_file(file)
-    return sum(e - s + 1 for s, e in merge_ranges(fresh_ranges))
+def get_nb_all_fresh_ingredients(fresh_ranges):
+    # The overlapping ranges are merged by the interval set
+    return IntervalSet.from_inclusive(fresh_ranges).length
 
-def day5_1(file):
-    print(get_nb_fresh_ingredients(file))
+def part1(inventory):
+    fresh_ranges, available_ingredients = inventory
+    return get_nb_fresh_ingredients(fresh_ranges, available_ingredients)
 
-def day5_2(file):
-    print(get_nb_all_fresh_ingredients(file))
+def part2(inventory):
+    fresh_ranges, _ = inventory
+    return get_nb_all_fresh_ingredients(fresh_ranges)
 
 
 if __name__ == '__main__':
-    day5_1(sys.argv[1])
-    day5_2(sys.argv[1])
+    with open(sys.argv[1]) as f:
+        data = parse(f.read())
+    print(part1(data))
+    print(part2(data))
 
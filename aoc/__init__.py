@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+#
+# Shared tooling for the Advent of Code solutions of this repository
+#
+
+"""
+The solutions themselves live in <year>/day<N>/day<N>.py and remain runnable as standalone scripts. This package
+gathers what is common to all of them: a runner able to execute many days in a single process, and the helpers used
+by the runner.
+
+Usage:
+  python -m aoc run 2022 16 --part 2
+  python -m aoc run 2023 all
+  python -m aoc run 2022 11 --profile
+  python -m aoc run 2022 15 --memory
+  python -m aoc imports 2022
+"""
@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+#
+# Command line entry point: python -m aoc <command> ...
+#
+
+import argparse
+import math
+import sys
+import time
+
+from aoc import (batch, bench, cache, complexity, days, engines, generators, imports, jit, log, profiling, runner,
+                 scheduler, server, snapshot)
+
+
+def check_engine(name):
+    # A day runs the reference engine of the steps which don't implement the selected one (see engines), but an engine
+    # implemented by none of the days is most likely a typo
+    if name is None:
+        return True
+
+    names = set()
+    for year, day, _ in days.select(part=1):
+        try:
+            names.update(engines.module_engines(days.load_day(year, day)))
+        except Exception:
+            # The error will be reported when the day runs
+            pass
+    if name in names:
+        return True
+
+    names = [engines.REFERENCE] + sorted(names - {engines.REFERENCE})
+    hint = " (numba isn't installed)" if name == jit.ENGINE and not jit.available else ""
+    print(f"no day has the engine {name}{hint}, engines: {', '.join(names)}", file=sys.stderr)
+    return False
+
+
+def cmd_run(args):
+    if args.log_level:
+        log.configure(args.log_level)
+    # Resuming implies taking new snapshots, in the default directory unless another one is given
+    if args.resume and args.snapshots is None:
+        args.snapshots = str(snapshot.SNAPSHOT_DIR)
+
+    jobs = days.select(args.year, args.day, args.part)
+    if not check_engine(args.engine):
+        return 2
+
+    total = 0.0
+    nb_errors = 0
+
+    if args.jobs != 1:
+        # Show the results as they complete, then all the answers in order
+        start = time.perf_counter()
+        results = scheduler.run(jobs, args.input, args.jobs, args.timeout,
+                                on_result=lambda r: print(runner.format_result(r), flush=True),
+                                profile_dir=args.profile, trace_memory=args.memory, cache_dir=args.cache,
+                                engine=args.engine, count=args.counters, snapshot_dir=args.snapshots,
+                                resume=args.resume)
+        print()
+        for result in results:
+            print(runner.format_result(result))
+            nb_errors += result.error is not None
+        print(f"{len(jobs)} parts in {time.perf_counter() - start:.3f}s "
+              f"({sum(r.wall for r in results):.3f}s of work)")
+        print_profiles(args.profile)
+
+        return 1 if nb_errors else 0
+
+    for result in runner.run(jobs, args.input, args.profile, args.memory, args.cache, args.engine, args.counters,
+                             args.snapshots, args.resume):
+        print(runner.format_result(result), flush=True)
+        if args.verbose and result.output:
+            print(result.output, end="")
+        total += result.wall
+        nb_errors += result.error is not None
+
+    if len(jobs) > 1:
+        print(f"{len(jobs)} parts in {total:.3f}s")
+    print_profiles(args.profile)
+
+    return 1 if nb_errors else 0
+
+
+def print_profiles(profile_dir):
+    if profile_dir is not None:
+        print(f"profiles (.pstats and .collapsed) written to {profile_dir}")
+
+
+def cmd_bench(args):
+    jobs = days.select(args.year, args.day, args.part)
+    measures = bench.run(jobs, args.repeat, on_measure=lambda k, m: print(bench.format_measure(k, m), flush=True),
+                         cache_dir=args.cache)
+    bench.append_history(measures)
+
+    regressions = bench.find_regressions(measures, bench.load_baseline(), args.threshold)
+    for key, what, before, after in regressions:
+        print(f"REGRESSION {key} {what}: {before} -> {after}")
+
+    if args.save_baseline:
+        bench.save_baseline(measures)
+        print(f"baseline saved to {bench.BASELINE_FILE}")
+
+    return 1 if regressions else 0
+
+
+def cmd_compare(args):
+    if len(args.engines) > 2:
+        print("at most 2 engines can be compared", file=sys.stderr)
+        return 2
+
+    jobs = days.select(args.year, args.day, args.part)
+    engine_a, engine_b = args.engines if len(args.engines) == 2 else (engines.REFERENCE, args.engines[0])
+    if not (check_engine(engine_a) and check_engine(engine_b)):
+        return 2
+
+    comparisons = bench.compare_engines(jobs, engine_a, engine_b, args.repeat,
+                                        on_compare=lambda k, c: print(bench.format_comparison(k, c), flush=True))
+
+    return 1 if any(bench.comparison_failed(c) for c in comparisons.values()) else 0
+
+
+def cmd_generate(args):
+    text = generators.generate(int(args.year), int(args.day), args.size, args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+    return 0
+
+
+def cmd_complexity(args):
+    jobs = complexity.select(args.year, args.day, args.part)
+    if not jobs:
+        print("no generator for the days selected", file=sys.stderr)
+        return 2
+
+    sizes = complexity.geometric_sizes(args.start, args.factor, args.steps)
+    ranking = []
+    nb_errors = 0
+
+    for year, day, part in jobs:
+        print(f"{year} day{day:<2} part {part}", flush=True)
+        try:
+            measures, error = complexity.profile(
+                year, day, part, sizes, args.repeat, args.max_time, args.function, args.seed,
+                on_measure=lambda m: print(complexity.format_measure(m, args.function), flush=True))
+        except ValueError as e:
+            measures, error = [], str(e)
+        if error:
+            print(f"  ERROR {error}")
+            nb_errors += 1
+        if len(measures) >= 2:
+            print(complexity.format_exponents(measures, args.function))
+            ranking.append((complexity.exponents(measures)[1], f"{year}/{day}/{part}"))
+
+    if len(ranking) > 1:
+        print("\nranked by exponent over the input length:")
+        for exponent, key in sorted(ranking, key=lambda r: -r[0] if r[0] is not None else math.inf):
+            print(f"  {key:12} {complexity.format_exponent(exponent)}")
+
+    return 1 if nb_errors else 0
+
+
+def cmd_imports(args):
+    measures = imports.run(args.year, args.day,
+                           on_measure=lambda k, m: print(imports.format_measure(k, m, args.top), flush=True))
+    load_times = [load_time for load_time, _, error in measures.values() if error is None]
+    if len(measures) > 1:
+        print(f"{len(measures)} days, {sum(load_times) * 1000:.1f}ms of imports")
+
+    return 1 if len(load_times) < len(measures) else 0
+
+
+def add_cache_argument(parser):
+    parser.add_argument("--cache", nargs="?", const=str(cache.CACHE_DIR), metavar="DIR",
+                        help="keep the parsed inputs in an on-disk cache in DIR and reuse them on the next runs "
+                             f"(default: {cache.CACHE_DIR.relative_to(days.ROOT)})")
+
+
+def cmd_batch(args):
+    files = batch.find_files(args.inputs)
+    parts = days.PARTS if args.part == "all" else (int(args.part),)
+    nb_errors = 0
+
+    for result in batch.run(int(args.year), int(args.day), files, parts, args.jobs, args.cache):
+        print(batch.result_json(result), flush=True)
+        nb_errors += result.error is not None
+
+    return 1 if nb_errors or not files else 0
+
+
+def cmd_serve(args):
+    server.serve(args.socket, args.jobs, on_ready=lambda s: print(f"listening on {s.socket_file}", flush=True))
+
+    return 0
+
+
+def cmd_solve(args):
+    jobs = days.select(args.year, args.day, args.part)
+    total = 0.0
+    nb_errors = 0
+
+    with server.Client(args.socket) as client:
+        for year, day, part in jobs:
+            file = days.resolve_input(year, day, args.input)
+            with open(file) as f:
+                response = client.solve(year, day, part, f.read())
+            result = runner.Result(year, day, part, str(file), response["answer"], response["output"], response["wall"],
+                                   response["cpu"], response["error"])
+            print(runner.format_result(result), flush=True)
+            if args.verbose and result.output:
+                print(result.output, end="")
+            total += result.wall
+            nb_errors += result.error is not None
+
+    if len(jobs) > 1:
+        print(f"{len(jobs)} parts in {total:.3f}s")
+
+    return 1 if nb_errors else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m aoc", description="Run the Advent of Code solutions")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run some days in a single process and report the wall time of each part")
+    run.add_argument("year", help="year to run, or 'all'")
+    run.add_argument("day", nargs="?", default="all", help="day to run, or 'all' (default)")
+    run.add_argument("--part", default="all", choices=["1", "2", "all"], help="part to run (default: all)")
+    run.add_argument("--input", help="input file, either a name in the day directory or a path "
+                                     "(default: input.txt)")
+    run.add_argument("-j", "--jobs", type=int, default=1,
+                     help="number of worker processes, 0 for one per CPU (default: 1, run in this process)")
+    run.add_argument("--timeout", type=float, help="maximum time in seconds allowed for each part (with --jobs)")
+    run.add_argument("-v", "--verbose", action="store_true", help="also show everything printed by the parts")
+    run.add_argument("--log-level", choices=log.LEVELS,
+                     help=f"level of the logs written by the parts, shown with --verbose (default: the {log.ENV_LEVEL} "
+                          "environment variable, or warning)")
+    run.add_argument("--profile", nargs="?", const=str(profiling.PROFILE_DIR), metavar="DIR",
+                     help="run each part under cProfile and write <year>_day<N>_part<P>.pstats and .collapsed "
+                          f"(flamegraph stacks) files in DIR (default: {profiling.PROFILE_DIR.relative_to(days.ROOT)})")
+    run.add_argument("--memory", nargs="?", type=int, const=5, default=0, metavar="N",
+                     help="trace the memory allocations with tracemalloc and report the peak of each part with its N "
+                          "top allocation sites (default: 5), this slows down the parts")
+    run.add_argument("--counters", action="store_true",
+                     help="report the work counted by the parts (states expanded, rounds simulated...)")
+    run.add_argument("--engine", help=f"engine of the days to run (default: {engines.REFERENCE}), {jit.ENGINE} runs "
+                                      "the kernels compiled with numba: the time of the first part calling a kernel "
+                                      "includes its compilation, or its loading from the cache of numba")
+    run.add_argument("--snapshots", nargs="?", const=str(snapshot.SNAPSHOT_DIR), metavar="DIR",
+                     help="let the long simulations save snapshots of their state in DIR every "
+                          f"{snapshot.INTERVAL:g} seconds (default: {snapshot.SNAPSHOT_DIR.relative_to(days.ROOT)})")
+    run.add_argument("--resume", action="store_true",
+                     help="resume the simulations from the snapshots left by an interrupted run (implies --snapshots)")
+    add_cache_argument(run)
+    run.set_defaults(func=cmd_run)
+
+    bench_ = commands.add_parser("bench", help="measure wall time, CPU time and peak RSS of each part, each in its "
+                                               "own process, and compare them to the baseline")
+    bench_.add_argument("year", nargs="?", default="all", help="year to benchmark, or 'all' (default)")
+    bench_.add_argument("day", nargs="?", default="all", help="day to benchmark, or 'all' (default)")
+    bench_.add_argument("--part", default="all", choices=["1", "2", "all"], help="part to benchmark (default: all)")
+    bench_.add_argument("--repeat", type=int, default=1, help="number of runs of each part, the best is kept")
+    bench_.add_argument("--threshold", type=float, default=0.2,
+                        help="slowdown ratio over the baseline reported as a regression (default: 0.2)")
+    bench_.add_argument("--save-baseline", action="store_true", help="save the measures as the new baseline")
+    add_cache_argument(bench_)
+    bench_.set_defaults(func=cmd_bench)
+
+    compare = commands.add_parser("compare", help="run 2 engines of a day on the same inputs, check that their answers "
+                                                  "match and report the speed-up of the second one")
+    compare.add_argument("year")
+    compare.add_argument("day")
+    compare.add_argument("engines", nargs="+", metavar="ENGINE",
+                         help=f"engines to compare, a single engine is compared to the {engines.REFERENCE} one (the "
+                              f"first run of the {jit.ENGINE} engine compiles its kernels, keep --repeat above 1)")
+    compare.add_argument("--part", default="all", choices=["1", "2", "all"], help="part to compare (default: all)")
+    compare.add_argument("--repeat", type=int, default=3, help="number of runs of each engine, the best is kept "
+                                                               "(default: 3)")
+    compare.set_defaults(func=cmd_compare)
+
+    generate = commands.add_parser("generate", help="generate a synthetic input of a given size")
+    generate.add_argument("year")
+    generate.add_argument("day")
+    generate.add_argument("--size", type=int, required=True, help="size of the input, its meaning depends on the day")
+    generate.add_argument("--seed", type=int, default=0, help="seed of the random generator (default: 0)")
+    generate.add_argument("-o", "--output", help="file to write (default: standard output)")
+    generate.set_defaults(func=cmd_generate)
+
+    complexity_ = commands.add_parser("complexity", help="run the parts on generated inputs of growing sizes and fit "
+                                                         "their wall time to a power law of the input size")
+    complexity_.add_argument("year", nargs="?", default="all", help="year to measure, or 'all' (default)")
+    complexity_.add_argument("day", nargs="?", default="all", help="day to measure, or 'all' (default)")
+    complexity_.add_argument("--part", default="all", choices=["1", "2", "all"], help="part to measure (default: all)")
+    complexity_.add_argument("--function", help="measure only the calls to this function of the day module")
+    complexity_.add_argument("--start", type=int, default=16, help="first size of the inputs (default: 16)")
+    complexity_.add_argument("--factor", type=float, default=2.0,
+                             help="ratio between 2 successive sizes (default: 2)")
+    complexity_.add_argument("--steps", type=int, default=6, help="maximum number of sizes (default: 6)")
+    complexity_.add_argument("--max-time", type=float, default=10.0,
+                             help="stop growing the size once a part takes longer than this time in seconds "
+                                  "(default: 10)")
+    complexity_.add_argument("--repeat", type=int, default=1, help="number of runs on each size, the best is kept")
+    complexity_.add_argument("--seed", type=int, default=0, help="seed of the generators (default: 0)")
+    complexity_.set_defaults(func=cmd_complexity)
+
+    imports_ = commands.add_parser("imports", help="measure the time taken to load each day module, each in a new "
+                                                   "process, with its slowest imports (python -X importtime)")
+    imports_.add_argument("year", nargs="?", default="all", help="year to measure, or 'all' (default)")
+    imports_.add_argument("day", nargs="?", default="all", help="day to measure, or 'all' (default)")
+    imports_.add_argument("--top", type=int, default=3, help="number of slowest imports shown (default: 3)")
+    imports_.set_defaults(func=cmd_imports)
+
+    batch_ = commands.add_parser("batch", help="solve a day on many input files over a pool of processes, the results "
+                                               "are written as JSON lines")
+    batch_.add_argument("year")
+    batch_.add_argument("day")
+    batch_.add_argument("inputs", nargs="+", metavar="INPUT", help="input files, directories or glob patterns")
+    batch_.add_argument("--part", default="all", choices=["1", "2", "all"], help="part to solve (default: all)")
+    batch_.add_argument("-j", "--jobs", type=int, default=0,
+                        help="number of worker processes, 0 for one per CPU (default: 0)")
+    add_cache_argument(batch_)
+    batch_.set_defaults(func=cmd_batch)
+
+    serve = commands.add_parser("serve", help="start a server solving the requests received on a Unix socket, with the "
+                                              "day modules kept loaded in a pool of worker processes")
+    serve.add_argument("--socket", default=str(server.SOCKET_FILE),
+                       help=f"path of the socket (default: {server.SOCKET_FILE.relative_to(days.ROOT)})")
+    serve.add_argument("-j", "--jobs", type=int, default=0,
+                       help="number of worker processes, 0 for one per CPU (default: 0)")
+    serve.set_defaults(func=cmd_serve)
+
+    solve = commands.add_parser("solve", help="solve some days with a running server (see serve)")
+    solve.add_argument("year", help="year to solve, or 'all'")
+    solve.add_argument("day", nargs="?", default="all", help="day to solve, or 'all' (default)")
+    solve.add_argument("--part", default="all", choices=["1", "2", "all"], help="part to solve (default: all)")
+    solve.add_argument("--input", help="input file, either a name in the day directory or a path "
+                                       "(default: input.txt)")
+    solve.add_argument("--socket", default=str(server.SOCKET_FILE),
+                       help=f"path of the socket (default: {server.SOCKET_FILE.relative_to(days.ROOT)})")
+    solve.add_argument("-v", "--verbose", action="store_true", help="also show everything printed by the parts")
+    solve.set_defaults(func=cmd_solve)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
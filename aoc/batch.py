@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# Solve a day over many input files
+#
+
+"""
+The input files are spread over a pool of worker processes. Each worker loads the day module (and numpy with it) once
+when it starts, then solves the input files it is given one after the other, both parts of a file sharing a single
+parse.
+
+The results are reported as soon as all the parts of a file are solved, so their order follows the completion of the
+files, not their names. As JSON lines, each result is written as:
+
+  {"year": 2022, "day": 5, "part": 1, "input": "inputs/0001.txt", "answer": "CMZ", "wall": 0.0001, "cpu": 0.0001,
+   "error": null}
+"""
+
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from aoc import days, runner
+
+JSON_FIELDS = ("year", "day", "part", "input", "answer", "wall", "cpu", "error")
+
+
+def find_files(patterns):
+    # Expand a list of directories (all the files they contain), glob patterns and files into a sorted list of files
+    files = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            files.update(p for p in path.iterdir() if p.is_file())
+        else:
+            files.update(Path(p) for p in glob.glob(pattern) if Path(p).is_file())
+
+    return sorted(files)
+
+
+def _init_worker(year, day):
+    # Load the day module once per worker, an error is reported with the results of each file
+    try:
+        days.load_day(year, day)
+    except Exception:
+        pass
+
+
+def _solve_file(year, day, parts, file, cache_dir):
+    # Executed in a worker process
+    return list(runner.run([(year, day, part) for part in parts], str(file), cache_dir=cache_dir))
+
+
+def run(year, day, files, parts=days.PARTS, workers=None, cache_dir=None):
+    # Solve the parts of a day on each file, yield the results of each file as soon as they are available
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_worker,
+                             initargs=(year, day)) as executor:
+        futures = [executor.submit(_solve_file, year, day, parts, file, cache_dir) for file in files]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def result_json(result):
+    fields = {field: getattr(result, field) for field in JSON_FIELDS}
+    fields["wall"], fields["cpu"] = round(result.wall, 6), round(result.cpu, 6)
+
+    return json.dumps(fields)
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+#
+# Benchmark the parts of the day modules and detect regressions
+#
+
+"""
+Each part is measured against input.txt (and input2.txt when present) in a fresh Python process, so that the peak
+RSS reported by getrusage() belongs to that part only. Within that process we record:
+  - the wall time and the CPU time of the part, the best of --repeat runs
+  - the peak RSS of the process, which includes the interpreter and the modules imported (numpy mostly)
+
+Every benchmark run is appended to .aoc/bench_history.json along with the current git commit. A run can also be saved
+as the baseline (.aoc/bench_baseline.json), later runs are compared against it: a part is flagged as a regression
+when it is slower than its baseline by more than the threshold ratio, ignoring differences under a few milliseconds
+which are only noise.
+
+Two engines of a day (see engines) are compared in the current process instead: the input is parsed once beforehand,
+then the parts are run with each engine in turn. Their answers must match, the speed-up is the ratio of their best
+wall times.
+
+With a cache directory, the parsed inputs are loaded from the on-disk cache (see cache): the parse time is then left
+out of the measures, except for the first run on an input.
+"""
+
+import json
+import resource
+import signal
+import subprocess
+import sys
+import time
+
+from aoc import days, engines, runner
+
+HISTORY_FILE = days.ROOT / ".aoc" / "bench_history.json"
+BASELINE_FILE = days.ROOT / ".aoc" / "bench_baseline.json"
+BENCH_INPUTS = ("input.txt", "input2.txt")
+
+# Wall time differences below this value (in seconds) are never considered as regressions
+NOISE_FLOOR = 0.005
+
+
+def bench_inputs(year, day):
+    # Benchmark on input.txt and input2.txt, or on the default input of the days which have none of them
+    inputs = [file for file in days.find_inputs(year, day) if file.name in BENCH_INPUTS]
+    if not inputs and days.default_input(year, day):
+        inputs = [days.default_input(year, day)]
+
+    return inputs
+
+
+def peak_rss():
+    # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def measure(year, day, part, file, repeat=1, cache_dir=None):
+    # Run a part several times in the current process and keep the best timings
+    # The module is imported beforehand, so that its import time isn't counted in the first run. An import error will be
+    # reported by run_part().
+    try:
+        days.load_day(year, day)
+    except Exception:
+        pass
+
+    results = [runner.run_part(year, day, part, file, cache_dir=cache_dir) for _ in range(repeat)]
+
+    return {
+        "answer": results[0].answer,
+        "error": results[0].error,
+        "wall": min(r.wall for r in results),
+        "cpu": min(r.cpu for r in results),
+        "rss": peak_rss(),
+    }
+
+
+def measure_in_subprocess(year, day, part, file, repeat=1, cache_dir=None):
+    # Run measure() in a new interpreter, it prints its measures as JSON
+    cmd = [sys.executable, "-m", "aoc.bench", str(year), str(day), str(part), str(file), str(repeat)]
+    if cache_dir is not None:
+        cmd.append(str(cache_dir))
+    proc = subprocess.run(cmd, cwd=days.ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        # The last line of the traceback, or the exit status of a child which died without writing one (killed by a
+        # signal...)
+        lines = proc.stderr.strip().splitlines()
+        if lines:
+            error = lines[-1]
+        elif proc.returncode < 0:
+            error = f"killed by signal {signal.Signals(-proc.returncode).name}"
+        else:
+            error = f"exited with status {proc.returncode}"
+        return {"answer": None, "error": error, "wall": 0.0, "cpu": 0.0, "rss": 0}
+
+    return json.loads(proc.stdout.splitlines()[-1])
+
+
+def bench_key(year, day, part, file):
+    return f"{year}/{day}/{part}/{file.name}"
+
+
+def run(jobs, repeat=1, on_measure=None, cache_dir=None):
+    # Benchmark a list of (year, day, part) jobs on their inputs and return a dict of measures indexed by bench_key()
+    measures = {}
+    for year, day, part in jobs:
+        for file in bench_inputs(year, day):
+            key = bench_key(year, day, part, file)
+            measures[key] = measure_in_subprocess(year, day, part, file, repeat, cache_dir)
+            if on_measure:
+                on_measure(key, measures[key])
+
+    return measures
+
+
+def compare_engines(jobs, engine_a=engines.REFERENCE, engine_b=engines.REFERENCE, repeat=1, on_compare=None):
+    # Run the jobs with the 2 engines on the same inputs, return a dict of comparisons indexed by bench_key()
+    # Each comparison holds the answer, the error and the best wall time of both engines.
+    comparisons = {}
+    for year, day, part in jobs:
+        for file in bench_inputs(year, day):
+            inputs = {}
+            try:
+                runner.parse_input(year, day, file, inputs)
+            except Exception:
+                # The error will be reported by run_part()
+                pass
+
+            results = {engine_a: [], engine_b: []}
+            for _ in range(repeat):
+                for engine in results:
+                    results[engine].append(runner.run_part(year, day, part, file, inputs=inputs, engine=engine))
+
+            key = bench_key(year, day, part, file)
+            comparisons[key] = {
+                "engines": [engine_a, engine_b],
+                "answer": [results[e][0].answer for e in (engine_a, engine_b)],
+                "error": [results[e][0].error for e in (engine_a, engine_b)],
+                "wall": [min(r.wall for r in results[e]) for e in (engine_a, engine_b)],
+            }
+            if on_compare:
+                on_compare(key, comparisons[key])
+
+    return comparisons
+
+
+def comparison_failed(c):
+    return any(c["error"]) or c["answer"][0] != c["answer"][1]
+
+
+def format_comparison(key, c):
+    (name_a, name_b), (answer_a, answer_b), (wall_a, wall_b) = c["engines"], c["answer"], c["wall"]
+    if any(c["error"]):
+        errors = ", ".join(f"{name}: {error}" for name, error in zip(c["engines"], c["error"]) if error)
+        return f"{key:24} ERROR {errors}"
+    if answer_a != answer_b:
+        return f"{key:24} MISMATCH {name_a}: {answer_a}, {name_b}: {answer_b}"
+
+    return (f"{key:24} {name_a} {wall_a:9.4f}s  {name_b} {wall_b:9.4f}s  "
+            f"speed-up x{wall_a / wall_b if wall_b else float('inf'):.2f}  {answer_a}")
+
+
+def git_commit():
+    proc = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=days.ROOT, capture_output=True, text=True)
+    return proc.stdout.strip() if proc.returncode == 0 else None
+
+
+def load_json(file, default):
+    try:
+        with open(file) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return default
+
+
+def save_json(file, data):
+    file.parent.mkdir(exist_ok=True)
+    with open(file, "w") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+
+
+def append_history(measures, file=HISTORY_FILE):
+    history = load_json(file, [])
+    history.append({"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "commit": git_commit(), "measures": measures})
+    save_json(file, history)
+
+
+def load_baseline(file=BASELINE_FILE):
+    return load_json(file, {})
+
+
+def save_baseline(measures, file=BASELINE_FILE):
+    # Merge into the existing baseline, so that a partial benchmark only replaces the parts it measured
+    baseline = load_baseline(file)
+    baseline.update({key: m for key, m in measures.items() if m["error"] is None})
+    save_json(file, baseline)
+
+
+def find_regressions(measures, baseline, threshold=0.2):
+    # Return the list of (key, what, baseline value, new value) for the measures worse than their baseline
+    regressions = []
+    for key, m in sorted(measures.items()):
+        if m["error"] is not None or key not in baseline:
+            continue
+
+        base = baseline[key]
+        if m["wall"] > base["wall"] * (1 + threshold) and m["wall"] - base["wall"] > NOISE_FLOOR:
+            regressions.append((key, "wall", base["wall"], m["wall"]))
+        if m["rss"] > base["rss"] * (1 + threshold):
+            regressions.append((key, "rss", base["rss"], m["rss"]))
+        if m["answer"] != base["answer"]:
+            regressions.append((key, "answer", base["answer"], m["answer"]))
+
+    return regressions
+
+
+def format_measure(key, m):
+    if m["error"]:
+        return f"{key:24} ERROR {m['error']}"
+
+    return f"{key:24} wall {m['wall']:9.4f}s  cpu {m['cpu']:9.4f}s  rss {m['rss'] / 2**20:7.1f} MiB  {m['answer']}"
+
+
+if __name__ == '__main__':
+    # Child process mode: python -m aoc.bench <year> <day> <part> <input> <repeat> [<cache dir>]
+    print(json.dumps(measure(int(sys.argv[1]), int(sys.argv[2]), int(sys.argv[3]), sys.argv[4], int(sys.argv[5]),
+                             sys.argv[6] if len(sys.argv) > 6 else None)))
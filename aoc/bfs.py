@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# Breadth-first searches over the cells of 2D/3D grids
+#
+
+"""
+Several puzzles search a grid step by step: the exterior air around a lava droplet, the positions an expedition may
+reach through the blizzards, the trails climbing from the trailheads... Instead of a queue of coordinates processed
+one at a time, the search works on whole frontiers: a frontier is a boolean mask of the grid, and the next one is
+computed by shifting it by one cell along each axis (the orthogonal neighbours, 4 in 2D, 6 in 3D) in a few
+vectorised operations. The frontier never wraps around the edges of the grid.
+
+The cells that may be entered are given by passable, either a boolean mask or a function of the step returning it
+(the cells of height 3 can only be entered at the step 3, the blizzards move every minute...):
+
+  # The distance of every air cell from the corner, -1 where it can't be reached
+  distance_map(to_mask(grid.shape, [(0, 0, 0)]), grid == AIR)
+
+layers() yields the successive frontiers from the sources (the step 0). A cell is entered once, at its shortest
+distance, unless wait is given: a cell may then be entered again and the frontier may stay in place, to search
+through a grid changing at each step. flood_fill(), distance_map() and path_counts() are built on it.
+
+The frontier spreads along all the axes of the grid, unless only some of them are given: several independent searches
+can be run at once on a stack of grids, the first axis indexing the grids and the frontier spreading along the others.
+
+Searches which must be told apart on the same grid are labelled instead: each source carries a bit of an integer
+label, and spread_labels() gives every cell the bitwise or of the labels of its neighbours, so a cell holds the bits
+of all the sources reaching it (64 searches at once with np.uint64 labels).
+
+A list of cells (a (n, ndim) array of indexes, or tuples) is converted into a mask with to_mask(), and a mask into the
+indexes of its cells with cells().
+"""
+
+import numpy as np
+
+
+def to_mask(shape, indexes):
+    # Build the boolean mask of a grid from the indexes of its cells, a (n, ndim) array or a list of tuples
+    mask = np.zeros(shape, dtype=bool)
+    indexes = np.asarray(indexes, dtype=np.intp).reshape(-1, len(shape))
+    mask[tuple(indexes.T)] = True
+
+    return mask
+
+
+def cells(mask):
+    # The indexes of the cells of a mask, as a (n, ndim) array
+    return np.argwhere(mask)
+
+
+def _neighbours(values, out, combine, axes=None):
+    # Combine into out the values of the orthogonal neighbours of every cell along the axes (all of them by default),
+    # with a ufunc (np.logical_or, np.add)
+    for axis in range(values.ndim) if axes is None else axes:
+        lower = tuple(slice(None, -1) if a == axis else slice(None) for a in range(values.ndim))
+        upper = tuple(slice(1, None) if a == axis else slice(None) for a in range(values.ndim))
+        combine(out[upper], values[lower], out=out[upper])
+        combine(out[lower], values[upper], out=out[lower])
+
+    return out
+
+
+def spread(frontier, passable=None, stay=False, axes=None):
+    # The passable cells one step away from the frontier, including the cells of the frontier itself with stay
+    reached = frontier.copy() if stay else np.zeros(frontier.shape, dtype=bool)
+    _neighbours(frontier, reached, np.logical_or, axes)
+    if passable is not None:
+        reached &= passable
+
+    return reached
+
+
+def spread_labels(labels, passable=None, axes=None):
+    # The labels (integer bit sets) one step away from the labelled cells: each passable cell gets the bitwise or of
+    # the labels of its neighbours, the other cells 0
+    reached = _neighbours(labels, np.zeros_like(labels), np.bitwise_or, axes)
+    if passable is not None:
+        reached[~passable] = 0
+
+    return reached
+
+
+def layers(sources, passable, wait=False, axes=None):
+    # Yield the frontier of each step of the search, starting with the sources at the step 0, until it is empty
+    # With wait, the search never stops by itself, the caller breaks out of it.
+    passable_at = passable if callable(passable) else lambda step: passable
+    frontier = np.asarray(sources, dtype=bool)
+    visited = frontier.copy()
+    step = 0
+
+    while frontier.any():
+        yield frontier
+        step += 1
+        frontier = spread(frontier, passable_at(step), stay=wait, axes=axes)
+        if not wait:
+            frontier &= ~visited
+            visited |= frontier
+
+
+def flood_fill(sources, passable, axes=None):
+    # The mask of all the cells reachable from the sources
+    reached = np.zeros(np.shape(sources), dtype=bool)
+    for frontier in layers(sources, passable, axes=axes):
+        reached |= frontier
+
+    return reached
+
+
+def distance_map(sources, passable, axes=None):
+    # The number of steps from the nearest source to every cell, -1 for the cells that can't be reached
+    distances = np.full(np.shape(sources), -1, dtype=np.int32)
+    for step, frontier in enumerate(layers(sources, passable, axes=axes)):
+        distances[frontier] = step
+
+    return distances
+
+
+def path_counts(sources, passable, axes=None):
+    # The number of shortest paths from the sources to every cell, 0 for the cells that can't be reached
+    # A cell of a frontier is reached by all the paths of its neighbours in the previous frontier.
+    counts = np.zeros(np.shape(sources), dtype=np.int64)
+    previous = None
+    for frontier in layers(sources, passable, axes=axes):
+        if previous is None:
+            counts[frontier] = 1
+        else:
+            paths = _neighbours(np.where(previous, counts, 0), np.zeros(counts.shape, dtype=np.int64), np.add, axes)
+            counts[frontier] = paths[frontier]
+        previous = frontier
+
+    return counts
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+#
+# Persistent cache of the parsed inputs
+#
+
+"""
+Parsing an input can take a good share of the time of a day (regular expressions applied to every line, grids read
+character by character...). With the cache enabled, the data returned by parse() (or parse_mapped()) is saved on disk
+and the next runs on the same input load it back instead of parsing it again.
+
+An entry is keyed by the SHA-256 of:
+  - the content of the input file
+  - the version of the day module, which is the source of the module and of the aoc modules it uses (aoc.grid...):
+    editing the parser makes the old entries unreachable, they are then evicted
+
+NumPy arrays are saved with np.save (.npy), anything else is pickled (.pickle). Data which can't be pickled (a lambda,
+a generator...) is simply not cached.
+
+The cache is bounded in size: once it grows over max_size bytes, the least recently used entries are removed. Each
+hit touches the modification time of its entry, which is used as the time of last use.
+
+Besides the parsed inputs, a day module can cache the arrays it derives from its input at a high cost (a distance
+matrix, a table of precomputed states...) with cached_array(). These are stored as .npy entries in the same directory
+and loaded back memory-mapped (np.load with mmap_mode='r'), so a warm run only pays for the pages it actually reads.
+The arrays returned from the cache are read-only. The runner enables this cache while a part runs (see
+derived_cache), a day module run as a script always builds its arrays.
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from aoc import days, reader
+
+CACHE_DIR = days.ROOT / ".aoc" / "cache"
+
+# Default size limit of the cache, in bytes
+MAX_SIZE = 512 * 2**20
+
+SUFFIXES = (".npy", ".pickle")
+
+# Directory where cached_array() stores its arrays, None when the derived arrays are not cached
+derived_dir = None
+
+
+def module_sources(module):
+    # The files whose content defines the parser: the day module and the aoc modules it imported names from
+    files = {Path(module.__file__)}
+    for value in vars(module).values():
+        owner = value if inspect.ismodule(value) else sys.modules.get(getattr(value, "__module__", None) or "")
+        if owner is not None and owner.__name__.split(".")[0] == "aoc" and getattr(owner, "__file__", None):
+            files.add(Path(owner.__file__))
+
+    return sorted(files)
+
+
+def module_version(module):
+    digest = hashlib.sha256()
+    for file in module_sources(module):
+        digest.update(file.read_bytes())
+
+    return digest.hexdigest()
+
+
+def cache_key(module, content):
+    # The content of the input is its text or its bytes
+    digest = hashlib.sha256(module_version(module).encode())
+    digest.update(content.encode() if isinstance(content, str) else content)
+
+    return digest.hexdigest()
+
+
+def entry_files(cache_dir, key):
+    return [Path(cache_dir) / f"{key}{suffix}" for suffix in SUFFIXES]
+
+
+def load(cache_dir, key):
+    # Return (True, data) on a hit, (False, None) otherwise. An entry which can't be read is removed.
+    for file in entry_files(cache_dir, key):
+        try:
+            if file.suffix == ".npy":
+                import numpy as np
+                data = np.load(file, allow_pickle=False)
+            else:
+                with open(file, "rb") as f:
+                    data = pickle.load(f)
+        except FileNotFoundError:
+            continue
+        except Exception:
+            file.unlink(missing_ok=True)
+            continue
+
+        os.utime(file)
+        return True, data
+
+    return False, None
+
+
+def _is_ndarray(data):
+    # Don't import numpy for the days which don't use it
+    np = sys.modules.get("numpy")
+    return np is not None and type(data) is np.ndarray and not data.dtype.hasobject
+
+
+def store(cache_dir, key, data, max_size=MAX_SIZE):
+    # Save an entry, then evict the least recently used ones. Return False when the data can't be saved.
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    suffix = ".npy" if _is_ndarray(data) else ".pickle"
+
+    # Write to a temporary file first: several worker processes may store the same entry at the same time
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if suffix == ".npy":
+                sys.modules["numpy"].save(f, data, allow_pickle=False)
+            else:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_dir / f"{key}{suffix}")
+    except Exception:
+        Path(tmp).unlink(missing_ok=True)
+        return False
+
+    evict(cache_dir, max_size)
+    return True
+
+
+def evict(cache_dir, max_size=MAX_SIZE):
+    # Remove the least recently used entries until the cache fits in max_size bytes, return the number removed
+    entries = []
+    for file in Path(cache_dir).iterdir():
+        if file.suffix in SUFFIXES:
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, file))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, file in sorted(entries, key=lambda x: x[0]):
+        if total <= max_size:
+            break
+        file.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+
+    return removed
+
+
+def cached_parse(module, file, cache_dir=CACHE_DIR, max_size=MAX_SIZE):
+    # Parse an input with its day module (see days.parse_file), going through the cache
+    # The key is computed from the bytes of the file, mapped in memory, not from its decoded text.
+    with reader.mapped(file) as content:
+        key = cache_key(module, content)
+    found, data = load(cache_dir, key)
+    if not found:
+        data = days.parse_file(module, file)
+        store(cache_dir, key, data, max_size)
+
+    return data
+
+
+@contextmanager
+def derived_cache(cache_dir):
+    # Enable cached_array() in the block, with its arrays stored in cache_dir (None leaves it disabled)
+    global derived_dir
+    previous, derived_dir = derived_dir, cache_dir
+    try:
+        yield
+    finally:
+        derived_dir = previous
+
+
+def derived_key(module, name, sources):
+    # The sources are the inputs of the computation: arrays, strings or bytes
+    digest = hashlib.sha256(module_version(module).encode())
+    digest.update(name.encode())
+    for source in sources:
+        if isinstance(source, str):
+            source = source.encode()
+        if isinstance(source, bytes):
+            digest.update(f"bytes{len(source)}".encode())
+            digest.update(source)
+        else:
+            import numpy as np
+            source = np.ascontiguousarray(source)
+            digest.update(f"{source.dtype.str}{source.shape}".encode())
+            digest.update(source.tobytes())
+
+    return digest.hexdigest()
+
+
+def cached_array(name, build, *sources, max_size=MAX_SIZE):
+    # Return the array computed by build() from the given sources. When the derived cache is enabled, the array is
+    # loaded memory-mapped from the cache if it has already been computed, otherwise it is computed and stored.
+    # name identifies the computation among the ones of the module defining build.
+    if derived_dir is None:
+        return build()
+
+    import numpy as np
+
+    key = derived_key(sys.modules[build.__module__], name, sources)
+    file = Path(derived_dir) / f"{key}.npy"
+    try:
+        # A plain ndarray view over the mapping, indexing a np.memmap is slower
+        array = np.load(file, mmap_mode="r").view(np.ndarray)
+        os.utime(file)
+        return array
+    except FileNotFoundError:
+        pass
+    except Exception:
+        file.unlink(missing_ok=True)
+
+    array = np.asarray(build())
+    store(derived_dir, key, array, max_size)
+
+    return array
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+#
+# Estimate the empirical complexity of the parts on generated inputs of growing sizes
+#
+
+"""
+A part is run on the inputs produced by the generator of its day (see generators) for a geometric series of sizes, and
+its wall time is fitted to a power law t = c * n^k by a least squares regression of log(t) over log(n). The exponent k
+tells how the part scales: 1 for a linear part, 2 for a quadratic one...
+
+The exponent is given both over the size parameter of the generator (its meaning depends on the day: number of lines,
+side of a grid...) and over the length of the input in bytes, which is comparable from one day to another: the days are
+ranked by this one.
+
+The input is parsed before the part is run, the parse time is measured and fitted apart. Instead of the whole part, a
+function of the day module can be measured alone: the cumulated time of its calls made by the part is fitted.
+
+The sizes keep growing until a part takes longer than the time limit, so that a quadratic part doesn't run for hours on
+the last sizes. Measures too short to be meaningful are left out of the fit.
+"""
+
+import functools
+import math
+import tempfile
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from pathlib import Path
+
+from aoc import days, generators, runner
+
+# Measures shorter than this value (in seconds) are only noise, they are left out of the fit
+MIN_TIME = 0.001
+
+# A part or function measured on an input, times in seconds
+Measure = namedtuple("Measure", ["size", "length", "parse", "wall"])
+
+
+def geometric_sizes(start, factor, steps):
+    # Sizes start, start * factor, start * factor^2... without duplicates once rounded
+    sizes = []
+    for i in range(steps):
+        size = round(start * factor ** i)
+        if not sizes or size > sizes[-1]:
+            sizes.append(size)
+
+    return sizes
+
+
+def fit_exponent(points):
+    # Least squares fit of log(y) = log(c) + k * log(x) on the (x, y) points, return k or None with less than 2 points
+    points = [(math.log(x), math.log(y)) for x, y in points if x > 0 and y > 0]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return None
+
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+def exponents(measures, field="wall"):
+    # Return the exponents of a field of the measures (over the size, over the input length), None when less than 2
+    # measures are long enough to be fitted
+    points = [m for m in measures if getattr(m, field) >= MIN_TIME]
+    return (fit_exponent([(m.size, getattr(m, field)) for m in points]),
+            fit_exponent([(m.length, getattr(m, field)) for m in points]))
+
+
+@contextmanager
+def timed_function(module, name):
+    # Replace a function of a module by a wrapper cumulating the time of its calls in the list yielded
+    # Only the outermost calls are timed, so that a recursive function isn't counted several times.
+    func = getattr(module, name, None)
+    if not callable(func):
+        raise ValueError(f"{module.__name__} has no function {name}")
+
+    total = [0.0]
+    depth = 0
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal depth
+        if depth:
+            return func(*args, **kwargs)
+
+        depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            total[0] += time.perf_counter() - start
+            depth -= 1
+
+    setattr(module, name, wrapper)
+    try:
+        yield total
+    finally:
+        setattr(module, name, func)
+
+
+def measure(year, day, part, file, repeat=1, function=None):
+    # Parse an input and run a part on it, return (parse time, best time of the part or of the function, error)
+    # The module is imported beforehand, so that its import time isn't counted in the parse time. An import error will
+    # be reported by run_part().
+    try:
+        days.load_day(year, day)
+    except Exception:
+        pass
+
+    inputs = {}
+    start = time.perf_counter()
+    try:
+        runner.parse_input(year, day, file, inputs)
+    except Exception:
+        # The error will be reported by run_part()
+        pass
+    parse_time = time.perf_counter() - start
+
+    times = []
+    for _ in range(repeat):
+        if function is None:
+            result = runner.run_part(year, day, part, file, inputs=inputs)
+            times.append(result.wall)
+        else:
+            with timed_function(days.load_day(year, day), function) as total:
+                result = runner.run_part(year, day, part, file, inputs=inputs)
+            times.append(total[0])
+        if result.error:
+            return parse_time, None, result.error
+
+    return parse_time, min(times), None
+
+
+def profile(year, day, part, sizes, repeat=1, max_time=10.0, function=None, seed=0, on_measure=None):
+    # Measure a part on the generated inputs of the given sizes, return (measures, error)
+    # The sizes stop growing once the part (the whole part, even when a function is measured) takes longer than
+    # max_time.
+    measures = []
+    with tempfile.TemporaryDirectory(prefix="aoc_complexity_") as tmp:
+        for size in sizes:
+            text = generators.generate(year, day, size, seed)
+            file = Path(tmp) / f"input_{size}.txt"
+            file.write_text(text)
+
+            start = time.perf_counter()
+            parse_time, wall, error = measure(year, day, part, file, repeat, function)
+            if error:
+                return measures, error
+
+            measures.append(Measure(size, len(text), parse_time, wall))
+            if on_measure:
+                on_measure(measures[-1])
+            if (time.perf_counter() - start) / repeat > max_time:
+                break
+
+    return measures, None
+
+
+def select(year="all", day="all", part="all"):
+    # The (year, day, part) jobs of the days which have a generator
+    return [(y, d, p) for y, d, p in days.select(year, day, part) if (y, d) in generators.GENERATORS]
+
+
+def format_measure(m, function=None):
+    return (f"  size {m.size:7}  input {m.length:10} B  parse {m.parse:9.4f}s  "
+            f"{function or 'part'} {m.wall:9.4f}s")
+
+
+def format_exponent(exponent):
+    return f"{exponent:5.2f}" if exponent is not None else "    ?"
+
+
+def format_exponents(measures, function=None):
+    (parse_size, parse_length), (wall_size, wall_length) = exponents(measures, "parse"), exponents(measures)
+    return (f"  exponent over the input length (over the size): {function or 'part'} "
+            f"{format_exponent(wall_length).strip()} ({format_exponent(wall_size).strip()}), "
+            f"parse {format_exponent(parse_length).strip()} ({format_exponent(parse_size).strip()})")
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# Compact coordinate types for the grid and space puzzles
+#
+
+"""
+Many puzzles move things step by step: elves on a grove, beams in a contraption, points of a cube... Their coordinates
+are read and combined at every step, so they must be cheap to build and to read. Vector and Vector3 keep their
+components in __slots__: an instance has no __dict__, .x is a plain slot read (no __getattr__, no property call, no
+NumPy scalar), and building one is a single small allocation.
+
+The vectors are immutable by convention, the operations return new vectors:
+
+  position = Vector(3, 4)
+  position += Vector(0, -1)           # Vector(3, 3)
+  grid[position.x, position.y]        # or grid[tuple(position)]
+  x, y = position
+
+They compare and hash like the tuple of their components (hash(Vector(3, 3)) == hash((3, 3))), so they can be the keys
+of a dict or the members of a set.
+"""
+
+
+class Vector:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x=0, y=0):
+        self.x = x
+        self.y = y
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.x}, {self.y})"
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __eq__(self, other):
+        if not isinstance(other, Vector):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    def __add__(self, other):
+        return type(self)(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other):
+        return type(self)(self.x - other.x, self.y - other.y)
+
+    def __neg__(self):
+        return type(self)(-self.x, -self.y)
+
+    def __mul__(self, factor):
+        return type(self)(self.x * factor, self.y * factor)
+
+    __rmul__ = __mul__
+
+
+class Vector3:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x=0, y=0, z=0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.x}, {self.y}, {self.z})"
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+        yield self.z
+
+    def __eq__(self, other):
+        if not isinstance(other, Vector3):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y and self.z == other.z
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
+
+    def __add__(self, other):
+        return type(self)(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other):
+        return type(self)(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __neg__(self):
+        return type(self)(-self.x, -self.y, -self.z)
+
+    def __mul__(self, factor):
+        return type(self)(self.x * factor, self.y * factor, self.z * factor)
+
+    __rmul__ = __mul__
+
+    def rotate_x(self):
+        # Rotate by 90° around the x-axis, counterclockwise when looking from the positive x
+        return type(self)(self.x, -self.z, self.y)
+
+    def rotate_y(self):
+        # Rotate by 90° around the y-axis, counterclockwise when looking from the positive y
+        return type(self)(self.z, self.y, -self.x)
+
+    def rotate_z(self):
+        # Rotate by 90° around the z-axis, counterclockwise when looking from the positive z
+        return type(self)(-self.y, self.x, self.z)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# Counters of the work done by the parts
+#
+
+"""
+The wall time of a part doesn't tell whether a change made it do less work or do the same work faster. The day modules
+count their units of work (states expanded, rounds simulated, grains of sand poured...) with add():
+
+  from aoc import counters
+  counters.add("rounds", nb_round)
+
+The counters are disabled by default, add() then returns right away. A hot loop must not call it at each iteration
+though: it counts in a local variable and adds the total once the loop is over.
+
+The runner enables the counters with counting() while a part runs (python -m aoc run --counters), they are reported
+with its result.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+
+# Counts of the running part, None when the counters are disabled
+counts = None
+
+
+def add(name, n=1):
+    if counts is not None:
+        counts[name] += n
+
+
+@contextmanager
+def counting():
+    # Enable the counters in the block, the counts are collected in the Counter returned
+    global counts
+    previous, counts = counts, Counter()
+    try:
+        yield counts
+    finally:
+        counts = previous
+
+
+def format_counts(counts):
+    if not counts:
+        return "  counters: none"
+
+    return "  counters: " + ", ".join(f"{name}={value}" for name, value in sorted(counts.items()))
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# Discovery and loading of the day modules
+#
+
+"""
+Day modules are plain scripts stored as <year>/day<N>/day<N>.py. Their directories are not valid package names, so we
+load them from their path with importlib and register them in sys.modules under a unique name (aoc_<year>_day<N>),
+since the same module name (e.g. day12) exists for several years.
+
+Every day module works on the content of its input, not on a file path, through 3 functions:
+  - parse(text): parse the input text and return the data needed by the parts
+  - part1(data) and part2(data): solve each part of the puzzle from the parsed data and return the answer
+
+The parts must not modify the parsed data, so that a single parse can feed both of them.
+
+A day may also define parse_mapped(data), parsing the content of its input file memory-mapped (see reader) instead of
+its text, to go through a large input in constant memory. The input files are then parsed with it, parse(text) is only
+used for the inputs given as text.
+"""
+
+import importlib.util
+import re
+import sys
+from pathlib import Path
+
+from aoc import reader
+
+ROOT = Path(__file__).resolve().parent.parent
+PARTS = (1, 2)
+
+
+def find_years():
+    # A year is a top-level directory with a 4-digit name
+    return sorted(int(p.name) for p in ROOT.iterdir() if p.is_dir() and re.fullmatch(r'\d{4}', p.name))
+
+
+def day_path(year, day):
+    return ROOT / str(year) / f"day{day}" / f"day{day}.py"
+
+
+def find_days(year):
+    # A day is a day<N> directory containing its day<N>.py module
+    days = []
+    for p in (ROOT / str(year)).iterdir():
+        if m := re.fullmatch(r'day(\d+)', p.name):
+            if day_path(year, int(m.group(1))).is_file():
+                days.append(int(m.group(1)))
+
+    return sorted(days)
+
+
+def find_inputs(year, day):
+    # Inputs are stored next to the module as input.txt, input2.txt, ...
+    return sorted((ROOT / str(year) / f"day{day}").glob("input*.txt"))
+
+
+def default_input(year, day):
+    # Prefer input.txt, otherwise use the first input found
+    inputs = find_inputs(year, day)
+    for file in inputs:
+        if file.name == "input.txt":
+            return file
+
+    return inputs[0] if inputs else None
+
+
+def resolve_input(year, day, name=None):
+    # Find an input file from a name relative to the day directory or from a path
+    if name is None:
+        return default_input(year, day)
+
+    path = ROOT / str(year) / f"day{day}" / name
+    return path if path.is_file() else Path(name)
+
+
+def module_name(year, day):
+    return f"aoc_{year}_day{day}"
+
+
+def load_day(year, day):
+    # Import the module only once per process, later calls reuse the one registered in sys.modules
+    name = module_name(year, day)
+    if name in sys.modules:
+        return sys.modules[name]
+
+    path = day_path(year, day)
+    if not path.is_file():
+        raise FileNotFoundError(f"no module for {year} day {day}: {path}")
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+
+    return module
+
+
+def parse_file(module, file):
+    # Parse an input file with its day module, memory-mapped when the day defines parse_mapped()
+    if hasattr(module, "parse_mapped"):
+        with reader.mapped(file) as data:
+            return module.parse_mapped(data)
+
+    with open(file) as f:
+        return module.parse(f.read())
+
+
+def get_part(module, part):
+    # Find the part<N> function of a module
+    func = getattr(module, f"part{part}", None)
+    if func is None:
+        raise AttributeError(f"{module.__name__} has no function part{part}")
+
+    return func
+
+
+def select(year="all", day="all", part="all"):
+    # Expand the "all" selectors into a list of (year, day, part)
+    years = find_years() if year == "all" else [int(year)]
+    jobs = []
+    for y in years:
+        days = find_days(y) if day == "all" else [int(day)]
+        for d in days:
+            parts = PARTS if part == "all" else [int(part)]
+            for p in parts:
+                jobs.append((y, d, p))
+
+    return jobs
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# Alternative implementations (engines) of the steps of a day
+#
+
+"""
+A faster implementation of a step of a solution is added next to the existing one instead of replacing it, so that
+both can be run and compared (see bench.compare_engines). The existing implementation is the reference engine, the
+others are registered on it under a name:
+
+  @dispatch
+  def dijkstra(graph, start):
+      ...
+
+  @dijkstra.engine("heap")
+  def dijkstra_heap(graph, start):
+      ...
+
+Calling dijkstra() runs the engine selected with use() (python -m aoc run --engine), or the reference engine when the
+selected one isn't implemented for this step. A day may dispatch several steps, an engine name then selects the
+implementations of all the steps which have one. The methods of a class can be dispatched too.
+
+When none is selected, the reference engine runs. The JIT-compiled engine (see jit) is selected explicitly: its first
+call of a kernel compiles it, or loads it from the cache of numba, which would be counted in the time of the part.
+"""
+
+import functools
+import types
+from contextlib import contextmanager
+
+REFERENCE = "reference"
+
+# Name of the engine run when none is selected
+default = REFERENCE
+
+# Name of the engine currently selected
+selected = default
+
+
+class Dispatcher:
+    def __init__(self, func):
+        functools.update_wrapper(self, func)
+        self.engines = {REFERENCE: func}
+
+    def __call__(self, *args, **kwargs):
+        return self.engines.get(selected, self.engines[REFERENCE])(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        # Bind the instance like a function would, for the dispatched methods
+        return self if instance is None else types.MethodType(self, instance)
+
+    def engine(self, name):
+        # Decorator registering an implementation of the step as the engine name
+        def register(func):
+            self.engines[name] = func
+            return func
+
+        return register
+
+
+def dispatch(func):
+    return Dispatcher(func)
+
+
+def module_engines(module):
+    # Return the sorted names of the engines implemented by a day module, the reference first
+    names = set()
+    for value in vars(module).values():
+        # The dispatched methods are found in the classes of the module
+        for step in [value] + (list(vars(value).values()) if isinstance(value, type) else []):
+            if isinstance(step, Dispatcher):
+                names.update(step.engines)
+
+    return [REFERENCE] + sorted(names - {REFERENCE})
+
+
+@contextmanager
+def use(name=None):
+    # Select an engine in the block, None selects the default engine
+    # The steps which don't implement the engine run their reference engine (see Dispatcher).
+    global selected
+    previous, selected = selected, name or default
+    try:
+        yield
+    finally:
+        selected = previous
@@ -0,0 +1,965 @@
+# -*- coding: utf-8 -*-
+#
+# Seeded synthetic input generators, one for each day
+#
+
+"""
+The inputs checked in are the small examples of the puzzles, they are too small to exercise the costly paths of the
+solvers. The generators below emit valid inputs of any size for each day: the size parameter is the main dimension of
+the puzzle (number of lines, side of a grid, number of sensors, ...), its meaning is given in the docstring of each
+generator. For the same (year, day, size, seed) the same input is produced.
+
+Valid means that the solvers can process them and find an answer: a path always exists between the start and the end of
+a heightmap, the guard of 2024 day 6 always leaves the lab, the ghosts of 2023 day 8 always reach their destination,
+... Some generators check their output by simulating the puzzle and pick another layout when it fails.
+
+Usage:
+  python -m aoc generate 2022 12 --size 2000 --seed 1 > /tmp/heightmap.txt
+"""
+
+import math
+import random
+import string
+
+GENERATORS = {}
+
+
+def generator(year, day):
+    # Register a generator function(size, rng) returning the input as a string
+    def register(func):
+        GENERATORS[(year, day)] = func
+        return func
+
+    return register
+
+
+def generate(year, day, size, seed=0):
+    if (year, day) not in GENERATORS:
+        raise KeyError(f"no generator for {year} day {day}")
+
+    return GENERATORS[(year, day)](size, random.Random(seed))
+
+
+def join_lines(lines):
+    return "\n".join(lines) + "\n"
+
+
+def random_grid(size_x, size_y, rng, chars, weights=None):
+    return [''.join(rng.choices(chars, weights, k=size_x)) for _ in range(size_y)]
+
+
+#
+# 2022
+#
+
+@generator(2022, 1)
+def gen_2022_1(size, rng):
+    """size: number of elves"""
+    return "\n".join(join_lines([str(rng.randint(1000, 70000)) for _ in range(rng.randint(1, 15))])
+                     for _ in range(size))
+
+
+@generator(2022, 2)
+def gen_2022_2(size, rng):
+    """size: number of rounds"""
+    return join_lines([f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(size)])
+
+
+@generator(2022, 3)
+def gen_2022_3(size, rng):
+    """size: number of rucksacks (rounded up to a multiple of 3)"""
+    letters = string.ascii_letters
+    lines = []
+    for _ in range((size + 2) // 3):
+        # Every group of 3 elves shares exactly one badge, every rucksack has one item in both compartments
+        badge = rng.choice(letters)
+        for _ in range(3):
+            pool = [ch for ch in letters if ch != badge]
+            common = rng.choice(pool)
+            pool.remove(common)
+            half = rng.randint(4, 16)
+            first = rng.sample(pool[:len(pool) // 2], half - 1) + [common]
+            second = rng.sample(pool[len(pool) // 2:], half - 1) + [common]
+            (first if rng.random() < 0.5 else second)[rng.randrange(half - 1)] = badge
+            rng.shuffle(first)
+            rng.shuffle(second)
+            lines.append(''.join(first) + ''.join(second))
+
+    return join_lines(lines)
+
+
+@generator(2022, 4)
+def gen_2022_4(size, rng):
+    """size: number of pairs of sections"""
+    def assignment():
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    return join_lines([f"{assignment()},{assignment()}" for _ in range(size)])
+
+
+@generator(2022, 5)
+def gen_2022_5(size, rng):
+    """size: number of moves (9 stacks)"""
+    initial = [[rng.choice(string.ascii_uppercase) for _ in range(rng.randint(2, 8))] for _ in range(9)]
+    stacks = [s[:] for s in initial]
+    moves = []
+    for _ in range(size):
+        src = rng.choice([i for i in range(9) if len(stacks[i]) > 1])
+        dst = rng.choice([i for i in range(9) if i != src])
+        # Never empty a stack, the answer is made of the top crates of all the stacks
+        qty = rng.randint(1, len(stacks[src]) - 1)
+        moves.append(f"move {qty} from {src + 1} to {dst + 1}")
+        stacks[dst].extend(stacks[src][-qty:])
+        del stacks[src][-qty:]
+
+    height = max(len(s) for s in initial)
+    lines = [' '.join(f"[{s[h]}]" if h < len(s) else "   " for s in initial) for h in range(height - 1, -1, -1)]
+    lines.append(' '.join(f" {i + 1} " for i in range(9)))
+
+    return join_lines(lines + [""] + moves)
+
+
+@generator(2022, 6)
+def gen_2022_6(size, rng):
+    """size: length of the datastream, the start-of-message marker is near its end"""
+    # Use only 3 letters, no marker of 4 distinct characters can appear before the one we insert
+    stream = rng.choices("abc", k=max(size - 14, 0))
+    return ''.join(stream) + ''.join(rng.sample(string.ascii_lowercase, 14)) + "\n"
+
+
+@generator(2022, 7)
+def gen_2022_7(size, rng):
+    """size: number of directories"""
+    # Build a random tree, then explore it depth first with cd/ls commands
+    children = {0: []}
+    for d in range(1, size):
+        parent = rng.randrange(d)
+        children[parent].append(d)
+        children[d] = []
+
+    lines = ["$ cd /"]
+
+    def explore(d):
+        lines.append("$ ls")
+        for c in children[d]:
+            lines.append(f"dir d{c}")
+        for i in range(rng.randint(1, 4)):
+            lines.append(f"{rng.randint(100, 150000)} f{i}.{rng.choice(['txt', 'dat', 'log', 'bin'])}")
+        for c in children[d]:
+            lines.append(f"$ cd d{c}")
+            explore(c)
+            lines.append("$ cd ..")
+
+    explore(0)
+
+    return join_lines(lines)
+
+
+@generator(2022, 8)
+def gen_2022_8(size, rng):
+    """size: side of the square forest"""
+    return join_lines(random_grid(size, size, rng, string.digits))
+
+
+@generator(2022, 9)
+def gen_2022_9(size, rng):
+    """size: number of motions"""
+    return join_lines([f"{rng.choice('UDLR')} {rng.randint(1, 20)}" for _ in range(size)])
+
+
+@generator(2022, 10)
+def gen_2022_10(size, rng):
+    """size: number of instructions (at least 240 cycles are always produced)"""
+    lines = []
+    cycles = 0
+    x = 1
+    while len(lines) < size or cycles < 240:
+        if rng.random() < 0.3:
+            lines.append("noop")
+            cycles += 1
+        else:
+            # Keep the sprite around the screen
+            value = rng.randint(-x - 5, 45 - x)
+            x += value
+            lines.append(f"addx {value}")
+            cycles += 2
+
+    return join_lines(lines)
+
+
+@generator(2022, 11)
+def gen_2022_11(size, rng):
+    """size: number of monkeys"""
+    primes = [p for p in range(2, 1000) if all(p % d for d in range(2, int(math.sqrt(p)) + 1))]
+    blocks = []
+    # Like in the puzzle only one monkey squares the worry level, and the items it holds are never thrown back to it,
+    # otherwise the worry levels would grow too fast for part 1
+    size = max(size, 3)
+    square = rng.randrange(size)
+    for m in range(size):
+        operation = "old * old" if m == square else \
+            rng.choice([f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 9)}"])
+        targets = rng.sample([i for i in range(size) if i not in (m, square)], 2) if size > 3 else \
+            [i for i in range(size) if i not in (m, square)] * 2
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        blocks.append(f"Monkey {m}:\n"
+                      f"  Starting items: {items}\n"
+                      f"  Operation: new = {operation}\n"
+                      f"  Test: divisible by {primes[m % len(primes)]}\n"
+                      f"    If true: throw to monkey {targets[0]}\n"
+                      f"    If false: throw to monkey {targets[1]}\n")
+
+    return "\n".join(blocks)
+
+
+@generator(2022, 12)
+def gen_2022_12(size, rng):
+    """size: side of the square heightmap (at least 15, to climb from a to z)"""
+    size = max(size, 15)
+    # The cell after the start must be an a and the cell before the end must be a z
+    span = 2 * size - 4
+    lines = []
+    for y in range(size):
+        line = []
+        for x in range(size):
+            # Elevation grows from the top-left corner (a) to the bottom-right corner (z), the top row and the right
+            # column are always kept as is, so there's always a path climbing at most one level per step. Other cells
+            # may be lowered, descending is always allowed.
+            level = 25 * max(0, x + y - 1) // span
+            if y > 0 and x < size - 1 and rng.random() < 0.3:
+                level = rng.randint(0, level)
+            line.append(chr(ord('a') + level))
+        lines.append(line)
+
+    lines[0][0] = 'S'
+    lines[size - 1][size - 1] = 'E'
+
+    return join_lines([''.join(line) for line in lines])
+
+
+@generator(2022, 13)
+def gen_2022_13(size, rng):
+    """size: number of pairs of packets"""
+    def packet(depth=0):
+        items = []
+        for _ in range(rng.randint(0, 5)):
+            if depth < 4 and rng.random() < 0.3:
+                items.append(packet(depth + 1))
+            else:
+                items.append(str(rng.randint(0, 10)))
+        return "[" + ",".join(items) + "]"
+
+    return "\n".join(f"{packet()}\n{packet()}\n" for _ in range(size))
+
+
+@generator(2022, 14)
+def gen_2022_14(size, rng):
+    """size: number of rock paths"""
+    lines = []
+    for _ in range(size):
+        x, y = rng.randint(480, 520), rng.randint(5, 20 + size // 4)
+        points = [(x, y)]
+        for i in range(rng.randint(1, 5)):
+            # Alternate horizontal and vertical segments
+            if i % 2:
+                y = max(1, y + rng.randint(-4, 4))
+            else:
+                x = max(1, x + rng.randint(-6, 6))
+            points.append((x, y))
+        lines.append(" -> ".join(f"{px},{py}" for px, py in points))
+
+    return join_lines(lines)
+
+
+@generator(2022, 15)
+def gen_2022_15(size, rng):
+    """size: number of sensors"""
+    # Sensors are scattered over the search area, with a beacon close enough so that a hidden point stays uncovered: it
+    # lies just outside the range of the closest sensors, and is the point found by part 2.
+    # The search area grows with the number of sensors, up to the one of the puzzle. It is centered on the row scanned
+    # by part 1 (y=2000000), so that the number of sensors crossing it grows with the size too.
+    limit = min(4_000_000, 1000 * size)
+    offset = 2_000_000 - limit // 2
+    hidden = (rng.randint(1, limit - 1), offset + rng.randint(1, limit - 1))
+    lines = []
+    spacing = max(1, int(limit / math.sqrt(size)))
+    for _ in range(size):
+        sx, sy = rng.randint(0, limit), offset + rng.randint(0, limit)
+        dist = abs(sx - hidden[0]) + abs(sy - hidden[1])
+        if dist < 2:
+            continue
+        radius = min(dist - 1, rng.randint(spacing, 2 * spacing))
+        dx = rng.randint(-radius, radius)
+        dy = (radius - abs(dx)) * rng.choice([-1, 1])
+        lines.append(f"Sensor at x={sx}, y={sy}: closest beacon is at x={sx + dx}, y={sy + dy}")
+
+    # Make sure the hidden point lies on the edge of at least one sensor
+    sx, sy = hidden[0] - 5, hidden[1]
+    lines.append(f"Sensor at x={sx}, y={sy}: closest beacon is at x={sx}, y={sy - 4}")
+
+    return join_lines(lines)
+
+
+def valve_name(i):
+    return string.ascii_uppercase[i // 26 % 26] + string.ascii_uppercase[i % 26]
+
+
+@generator(2022, 16)
+def gen_2022_16(size, rng):
+    """size: number of valves (at most 676)"""
+    size = min(max(size, 2), 26 * 26)
+    # A random tree keeps the network connected, some extra tunnels are then added
+    tunnels = {i: set() for i in range(size)}
+    for i in range(1, size):
+        j = rng.randrange(i)
+        tunnels[i].add(j)
+        tunnels[j].add(i)
+    for _ in range(size // 4):
+        i, j = rng.sample(range(size), 2)
+        tunnels[i].add(j)
+        tunnels[j].add(i)
+
+    lines = []
+    for i in range(size):
+        # Like in the puzzle, most valves are broken (flow rate 0), starting valve AA included
+        flow = 0 if i == 0 or rng.random() < 0.6 else rng.randint(1, 25)
+        targets = ", ".join(valve_name(t) for t in sorted(tunnels[i]))
+        if len(tunnels[i]) > 1:
+            lines.append(f"Valve {valve_name(i)} has flow rate={flow}; tunnels lead to valves {targets}")
+        else:
+            lines.append(f"Valve {valve_name(i)} has flow rate={flow}; tunnel leads to valve {targets}")
+
+    return join_lines(lines)
+
+
+@generator(2022, 17)
+def gen_2022_17(size, rng):
+    """size: number of jets"""
+    return ''.join(rng.choices("<>", k=size)) + "\n"
+
+
+@generator(2022, 18)
+def gen_2022_18(size, rng):
+    """size: number of cubes"""
+    # A random walk produces a droplet with pockets of trapped air
+    side = max(3, round(size ** (1 / 3) * 1.5))
+    cubes = set()
+    x = y = z = side // 2
+    while len(cubes) < size:
+        cubes.add((x, y, z))
+        axis = rng.randrange(3)
+        step = rng.choice([-1, 1])
+        x, y, z = [min(side, max(0, c + step)) if a == axis else c for a, c in enumerate((x, y, z))]
+
+    return join_lines([f"{x},{y},{z}" for x, y, z in cubes])
+
+
+@generator(2022, 19)
+def gen_2022_19(size, rng):
+    """size: number of blueprints"""
+    lines = []
+    for i in range(1, size + 1):
+        lines.append(f"Blueprint {i}: Each ore robot costs {rng.randint(2, 4)} ore. "
+                     f"Each clay robot costs {rng.randint(2, 4)} ore. "
+                     f"Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. "
+                     f"Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} obsidian.")
+
+    return join_lines(lines)
+
+
+@generator(2022, 20)
+def gen_2022_20(size, rng):
+    """size: length of the sequence"""
+    numbers = [rng.randint(-10000, 10000) for _ in range(max(size, 1) - 1)]
+    numbers = [n if n else 1 for n in numbers]
+    # The sequence contains exactly one 0
+    numbers.insert(rng.randint(0, len(numbers)), 0)
+
+    return join_lines([str(n) for n in numbers])
+
+
+@generator(2022, 21)
+def gen_2022_21(size, rng):
+    """size: number of monkeys"""
+    # The root compares two numbers. The human is a leaf of the left subtree, whose value strictly increases with the
+    # human number (only additions, and multiplications by positive numbers along its path), so the bisection of
+    # part 2 always converges. The right side is a monkey yelling the value of the left one for a chosen human
+    # number, which is greater than the one of the input (part 2 expects to search upward).
+    names = {"root", "humn"}
+    jobs = {}
+
+    def new_name():
+        while (name := ''.join(rng.choices(string.ascii_lowercase, k=4))) in names:
+            pass
+        names.add(name)
+        return name
+
+    def build(budget):
+        # Build a random subtree of about budget monkeys, return its name and its value
+        name = new_name()
+        if budget <= 2:
+            jobs[name] = rng.randint(1, 20)
+            return name, jobs[name]
+
+        left, a = build((budget - 1) // 2)
+        right, b = build(budget - 1 - (budget - 1) // 2)
+        op = rng.choice("+-*/")
+        if op == "-" and a < b or op == "*" and a * b > 10 ** 6 or op == "/" and (b == 0 or a % b):
+            op = "+"
+        jobs[name] = f"{left} {op} {right}"
+        return name, {"+": a + b, "-": a - b, "*": a * b, "/": a // b if b else 0}[op]
+
+    human = rng.randint(100, 10000)
+    path_len = max(1, min(size // 4, 50))
+    budget = max(1, (size - path_len - 3) // path_len)
+    current, value = "humn", human
+    for _ in range(path_len):
+        other, other_value = build(budget)
+        name = new_name()
+        if other_value > 0 and rng.random() < 0.3:
+            jobs[name] = f"{current} * {other}"
+            value *= other_value
+        else:
+            jobs[name] = f"{current} + {other}" if rng.random() < 0.5 else f"{other} + {current}"
+            value += other_value
+        current = name
+
+    right = new_name()
+    jobs[right] = value
+    jobs["root"] = f"{current} + {right}"
+    jobs["humn"] = rng.randint(1, 99)
+
+    items = list(jobs.items())
+    rng.shuffle(items)
+
+    return join_lines([f"{name}: {job}" for name, job in items])
+
+
+@generator(2022, 22)
+def gen_2022_22(size, rng):
+    """size: side of the faces of the cube"""
+    size = max(size, 2)
+    # The cube net is the one of the example:
+    #     ..#
+    #   ###
+    #     ##
+    faces = {(2, 0), (0, 1), (1, 1), (2, 1), (2, 2), (3, 2)}
+    lines = []
+    for fy in range(3):
+        for y in range(size):
+            line = ''
+            for fx in range(4):
+                if (fx, fy) in faces:
+                    line += ''.join('#' if rng.random() < 0.05 and (fx, fy, y) != (2, 0, 0) else '.'
+                                    for _ in range(size))
+                else:
+                    line += ' ' * size
+            lines.append(line.rstrip())
+
+    # The starting tile (the first open tile of the top row) must be open
+    lines[0] = lines[0][:2 * size] + '.' + lines[0][2 * size + 1:]
+
+    path = ''.join(f"{rng.randint(1, 2 * size)}{rng.choice('LR')}" for _ in range(size * 2))
+
+    return join_lines(lines + ["", path + str(rng.randint(1, size))])
+
+
+@generator(2022, 23)
+def gen_2022_23(size, rng):
+    """size: side of the square initial area"""
+    return join_lines(random_grid(size, size, rng, ".#", [2, 1]))
+
+
+@generator(2022, 24)
+def gen_2022_24(size, rng):
+    """size: width of the valley (its height is half of it)"""
+    width, height = max(size, 3), max(size // 2, 3)
+    # Blizzards never enter the columns of the entrance and the exit (like in the puzzle), so there's no vertical
+    # blizzard in these two columns
+    lines = ["#." + "#" * width]
+    for y in range(height):
+        line = ''.join(rng.choices("><^v.", [1, 1, 1, 1, 4], k=width))
+        line = line[0].replace('^', '.').replace('v', '.') + line[1:-1] + \
+            line[-1].replace('^', '.').replace('v', '.')
+        lines.append("#" + line + "#")
+    lines.append("#" * width + ".#")
+
+    return join_lines(lines)
+
+
+def int2snafu(nb):
+    digits = ''
+    while nb:
+        nb, r = divmod(nb + 2, 5)
+        digits = "=-012"[r] + digits
+
+    return digits or '0'
+
+
+def snafu_sum_supported(total):
+    # The solver of 2022 day 25 doesn't carry over the leading digit when converting the sum to SNAFU, so it can only
+    # convert the numbers whose leading digit stays under 3 after the carries of the other digits
+    digits = []
+    while total > 0:
+        total, r = divmod(total, 5)
+        digits.insert(0, r)
+    for x in range(len(digits) - 1, 0, -1):
+        if digits[x] > 2:
+            digits[x] -= 5
+            digits[x - 1] += 1
+
+    return not digits or digits[0] <= 2
+
+
+@generator(2022, 25)
+def gen_2022_25(size, rng):
+    """size: number of SNAFU numbers"""
+    numbers = [rng.randint(1, 5 ** rng.randint(1, 20)) for _ in range(size)]
+    # Add numbers until the sum can be converted by the solver
+    while not snafu_sum_supported(sum(numbers)):
+        numbers.append(rng.randint(1, 5 ** rng.randint(1, 20)))
+
+    return join_lines([int2snafu(n) for n in numbers])
+
+
+#
+# 2023
+#
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+@generator(2023, 1)
+def gen_2023_1(size, rng):
+    """size: number of lines"""
+    lines = []
+    for _ in range(size):
+        # Every line contains at least one digit (part 1) and may spell out some other ones (part 2)
+        parts = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(1, 6)):
+            parts.append(rng.choice([rng.choice(DIGIT_WORDS), ''.join(rng.choices("abcdpqrstxyz", k=3)),
+                                     rng.choice(string.digits[1:])]))
+        rng.shuffle(parts)
+        lines.append(''.join(parts))
+
+    return join_lines(lines)
+
+
+@generator(2023, 2)
+def gen_2023_2(size, rng):
+    """size: number of games"""
+    lines = []
+    for i in range(1, size + 1):
+        sets = []
+        for _ in range(rng.randint(1, 6)):
+            cubes = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            sets.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in cubes))
+        # Every color is shown at least once in a game
+        sets.append("1 red, 1 green, 1 blue")
+        rng.shuffle(sets)
+        lines.append(f"Game {i}: " + "; ".join(sets))
+
+    return join_lines(lines)
+
+
+@generator(2023, 3)
+def gen_2023_3(size, rng):
+    """size: side of the square schematic"""
+    # The schematic is surrounded by a border of periods, the solver doesn't check the boundaries
+    size = max(size, 3)
+    lines = ['.' * size]
+    for _ in range(size - 2):
+        line = '.'
+        while len(line) < size:
+            r = rng.random()
+            if r < 0.15:
+                line += str(rng.randint(1, 999))
+            elif r < 0.22:
+                line += rng.choice("*#+$/=%@&-")
+            line += '.' * rng.randint(1, 3)
+        lines.append(line[:size - 1] + '.')
+    lines.append('.' * size)
+
+    return join_lines(lines)
+
+
+@generator(2023, 4)
+def gen_2023_4(size, rng):
+    """size: number of cards"""
+    lines = []
+    for i in range(1, size + 1):
+        winning = rng.sample(range(1, 100), 10)
+        # Few matching numbers, the number of copies grows exponentially with them
+        mine = rng.sample(winning, rng.choice([0, 0, 1, 1, 2, 3])) if size - i > 10 else []
+        mine += rng.sample([n for n in range(1, 100) if n not in winning], 25 - len(mine))
+        rng.shuffle(mine)
+        lines.append(f"Card {i:3}: " + ' '.join(f"{n:2}" for n in winning) + " | " +
+                     ' '.join(f"{n:2}" for n in mine))
+
+    return join_lines(lines)
+
+
+@generator(2023, 5)
+def gen_2023_5(size, rng):
+    """size: number of ranges of each map"""
+    categories = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+    limit = 4_000_000_000
+    seeds = []
+    for _ in range(10):
+        seeds += [rng.randint(0, limit // 2), rng.randint(1, limit // 100)]
+
+    lines = ["seeds: " + ' '.join(map(str, seeds))]
+    for src, dst in zip(categories, categories[1:]):
+        lines += ["", f"{src}-to-{dst} map:"]
+        # Source ranges are contiguous and not overlapping
+        bounds = sorted(rng.sample(range(limit), size + 1))
+        for start, end in zip(bounds, bounds[1:]):
+            lines.append(f"{rng.randint(0, limit - (end - start))} {start} {end - start}")
+
+    return join_lines(lines)
+
+
+@generator(2023, 6)
+def gen_2023_6(size, rng):
+    """size: number of races"""
+    times = [rng.randint(7, 99) for _ in range(size)]
+    distances = [rng.randint(1, t * t // 4 - 1) for t in times]
+
+    return join_lines(["Time:     " + ''.join(f"{t:5}" for t in times),
+                       "Distance: " + ''.join(f"{d:5}" for d in distances)])
+
+
+@generator(2023, 7)
+def gen_2023_7(size, rng):
+    """size: number of hands"""
+    return join_lines([f"{''.join(rng.choices('AKQJT98765432', k=5))} {rng.randint(1, 1000)}" for _ in range(size)])
+
+
+@generator(2023, 8)
+def gen_2023_8(size, rng):
+    """size: number of nodes (at most 36^3)"""
+    # Each ghost follows its own cycle A -> ... -> Z -> back to the node after A, whatever the instruction (both
+    # sides of a node lead to the same next node), the first ghost starts at AAA and ends at ZZZ.
+    size = min(max(size, 4), 36 ** 3 // 2)
+    nb_ghosts = max(1, min(6, size // 8))
+    alphabet = string.ascii_uppercase + string.digits
+    inner = [c for c in alphabet if c not in "AZ"]
+    used = {"AAA", "ZZZ"}
+
+    def name(last):
+        while (n := ''.join(rng.choices(alphabet, k=2)) + last) in used:
+            pass
+        used.add(n)
+        return n
+
+    lines = []
+    length = max(1, size // nb_ghosts - 2)
+    for g in range(nb_ghosts):
+        start = "AAA" if g == 0 else name("A")
+        end = "ZZZ" if g == 0 else name("Z")
+        chain = [name(rng.choice(inner)) for _ in range(rng.randint(max(1, length // 2), length))]
+        nodes = [start] + chain + [end]
+        for a, b in zip(nodes, nodes[1:]):
+            lines.append(f"{a} = ({b}, {b})")
+        lines.append(f"{end} = ({nodes[1]}, {nodes[1]})")
+    rng.shuffle(lines)
+
+    return join_lines([''.join(rng.choices("LR", k=rng.randint(10, 300))), ""] + lines)
+
+
+@generator(2023, 9)
+def gen_2023_9(size, rng):
+    """size: number of histories"""
+    lines = []
+    for _ in range(size):
+        # Values of a polynomial, the differences always end with zeroes
+        coefs = [rng.randint(-10, 10) for _ in range(rng.randint(1, 5))]
+        lines.append(' '.join(str(sum(c * x ** i for i, c in enumerate(coefs))) for x in range(21)))
+
+    return join_lines(lines)
+
+
+@generator(2023, 10)
+def gen_2023_10(size, rng):
+    """size: side of the square field of pipes"""
+    size = max(size, 6)
+    # The loop follows the bottom row from right to left, then climbs along a random skyline from left to right:
+    # in each column the loop goes up or down to the height of that column, then goes on to the next column. In the
+    # last column it goes back down to the bottom row.
+    bottom = size - 2
+    tops = [rng.randint(1, size - 4) for _ in range(size - 2)]
+    loop = [(x, bottom) for x in range(size - 2, 0, -1)]
+    y = bottom
+    for i, col in enumerate(range(1, size - 1)):
+        target = tops[i] if col < size - 2 else bottom - 1
+        if col > 1:
+            loop.append((col, y))
+        while y != target:
+            y += 1 if target > y else -1
+            loop.append((col, y))
+
+    chars = {(-1, 0, 1, 0): '-', (1, 0, -1, 0): '-', (0, -1, 0, 1): '|', (0, 1, 0, -1): '|'}
+    corners = {frozenset([(0, -1), (1, 0)]): 'L', frozenset([(0, -1), (-1, 0)]): 'J',
+               frozenset([(0, 1), (-1, 0)]): '7', frozenset([(0, 1), (1, 0)]): 'F'}
+    grid = [rng.choices("|-LJ7F.", k=size) for _ in range(size)]
+    for i, (cx, cy) in enumerate(loop):
+        px, py = loop[i - 1]
+        nx, ny = loop[(i + 1) % len(loop)]
+        a, b = (px - cx, py - cy), (nx - cx, ny - cy)
+        grid[cy][cx] = chars.get(a + b, corners.get(frozenset([a, b]), '.'))
+
+    # The start connects to every neighbour, so the tiles around it which are not part of the loop must be empty
+    sx, sy = loop[0]
+    grid[sy][sx] = 'S'
+    loop_cells = set(loop)
+    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+        if (sx + dx, sy + dy) not in loop_cells:
+            grid[sy + dy][sx + dx] = '.'
+
+    return join_lines([''.join(line) for line in grid])
+
+
+@generator(2023, 11)
+def gen_2023_11(size, rng):
+    """size: side of the square image"""
+    return join_lines(random_grid(size, size, rng, ".#", [40, 1]))
+
+
+@generator(2023, 12)
+def gen_2023_12(size, rng):
+    """size: number of records"""
+    lines = []
+    for _ in range(size):
+        # Build a valid arrangement, then hide some of its springs
+        # The solver expects at least 3 groups
+        groups = [rng.randint(1, 4) for _ in range(rng.randint(3, 5))]
+        record = '.' * rng.randint(0, 2) + ('.' * rng.randint(1, 2)).join('#' * g for g in groups) + \
+            '.' * rng.randint(0, 2)
+        record = ''.join('?' if rng.random() < 0.4 else c for c in record)
+        lines.append(f"{record} {','.join(map(str, groups))}")
+
+    return join_lines(lines)
+
+
+@generator(2023, 14)
+def gen_2023_14(size, rng):
+    """size: side of the square platform"""
+    return join_lines(random_grid(size, size, rng, ".O#", [6, 3, 1]))
+
+
+@generator(2023, 15)
+def gen_2023_15(size, rng):
+    """size: number of steps"""
+    labels = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6))) for _ in range(max(1, size // 4))]
+    steps = [rng.choice(labels) + (f"={rng.randint(1, 9)}" if rng.random() < 0.7 else "-") for _ in range(size)]
+
+    return ','.join(steps) + "\n"
+
+
+@generator(2023, 16)
+def gen_2023_16(size, rng):
+    """size: side of the square contraption"""
+    return join_lines(random_grid(size, size, rng, ".|-/\\", [30, 1, 1, 1, 1]))
+
+
+#
+# 2024
+#
+
+@generator(2024, 1)
+def gen_2024_1(size, rng):
+    """size: number of pairs of locations"""
+    # Draw the locations from a small pool, some of them appear in both lists
+    pool = [rng.randint(10000, 99999) for _ in range(max(1, size // 2))]
+    return join_lines([f"{rng.choice(pool)}   {rng.choice(pool)}" for _ in range(size)])
+
+
+@generator(2024, 2)
+def gen_2024_2(size, rng):
+    """size: number of reports"""
+    lines = []
+    for _ in range(size):
+        sign = rng.choice([-1, 1])
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            # Mostly safe steps, with some unsafe ones
+            step = rng.randint(1, 3) if rng.random() < 0.9 else rng.choice([0, 4, 5, -2])
+            levels.append(levels[-1] + sign * step)
+        lines.append(' '.join(map(str, levels)))
+
+    return join_lines(lines)
+
+
+@generator(2024, 3)
+def gen_2024_3(size, rng):
+    """size: number of instructions, valid or corrupted"""
+    chunks = []
+    for _ in range(size):
+        r = rng.random()
+        a, b = rng.randint(1, 999), rng.randint(1, 999)
+        if r < 0.5:
+            chunks.append(f"mul({a},{b})")
+        elif r < 0.6:
+            chunks.append(rng.choice(["do()", "don't()"]))
+        else:
+            chunks.append(rng.choice([f"mul[{a},{b}]", f"mul({a},{b}]", f"mul ( {a},{b})", "what()", "from()"]))
+        chunks.append(''.join(rng.choices("#$%&*@^!+ )([]<>'", k=rng.randint(0, 4))))
+
+    return ''.join(chunks) + "\n"
+
+
+@generator(2024, 4)
+def gen_2024_4(size, rng):
+    """size: side of the square word search"""
+    return join_lines(random_grid(size, size, rng, "XMAS"))
+
+
+@generator(2024, 5)
+def gen_2024_5(size, rng):
+    """size: number of updates"""
+    # The rules are all the pairs of a total order of the pages, so that every update can be sorted
+    pages = rng.sample(range(10, 100), 25)
+    rules = [f"{a}|{b}" for i, a in enumerate(pages) for b in pages[i + 1:]]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(size):
+        update = rng.sample(pages, rng.choice([5, 7, 9, 11]))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(','.join(map(str, update)))
+
+    return join_lines(rules + [""] + updates)
+
+
+def guard_leaves(grid, x, y):
+    # Simulate the guard of 2024 day 6, return True if the guard leaves the lab
+    size_y, size_x = len(grid), len(grid[0])
+    dx, dy = 0, -1
+    seen = set()
+    while 0 <= x < size_x and 0 <= y < size_y:
+        if (x, y, dx, dy) in seen:
+            return False
+        seen.add((x, y, dx, dy))
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < size_x and 0 <= ny < size_y and grid[ny][nx] == '#':
+            dx, dy = -dy, dx
+        else:
+            x, y = nx, ny
+
+    return True
+
+
+@generator(2024, 6)
+def gen_2024_6(size, rng):
+    """size: side of the square lab"""
+    size = max(size, 2)
+    while True:
+        grid = random_grid(size, size, rng, ".#", [12, 1])
+        x, y = rng.randrange(size), rng.randrange(size)
+        grid[y] = grid[y][:x] + '^' + grid[y][x + 1:]
+        # Try another layout if the guard is trapped in a loop
+        if guard_leaves(grid, x, y):
+            return join_lines(grid)
+
+
+@generator(2024, 7)
+def gen_2024_7(size, rng):
+    """size: number of equations"""
+    lines = []
+    for _ in range(size):
+        numbers = [rng.randint(1, 99) for _ in range(rng.randint(2, 8))]
+        # Half of the equations can be made true
+        value = numbers[0]
+        for n in numbers[1:]:
+            value = rng.choice([value + n, value * n, int(f"{value}{n}")])
+        if rng.random() < 0.5:
+            value += 1
+        lines.append(f"{value}: {' '.join(map(str, numbers))}")
+
+    return join_lines(lines)
+
+
+@generator(2024, 8)
+def gen_2024_8(size, rng):
+    """size: side of the square map"""
+    return join_lines(random_grid(size, size, rng, "." + string.ascii_letters + string.digits,
+                                  [200] + [1] * 62))
+
+
+@generator(2024, 9)
+def gen_2024_9(size, rng):
+    """size: number of digits of the disk map"""
+    # Odd length, the map starts and ends with a file, files are never empty
+    digits = [str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9)) for i in range(size | 1)]
+
+    return ''.join(digits) + "\n"
+
+
+@generator(2024, 10)
+def gen_2024_10(size, rng):
+    """size: side of the square topographic map"""
+    # Diagonal slopes produce many trails, some random heights break them
+    return join_lines([''.join(str((x + y) % 10) if rng.random() < 0.9 else rng.choice(string.digits)
+                               for x in range(size)) for y in range(size)])
+
+
+#
+# 2025
+#
+
+@generator(2025, 1)
+def gen_2025_1(size, rng):
+    """size: number of rotations"""
+    return join_lines([f"{rng.choice('LR')}{rng.randint(1, 300)}" for _ in range(size)])
+
+
+@generator(2025, 2)
+def gen_2025_2(size, rng):
+    """size: number of ranges"""
+    ranges = []
+    for _ in range(size):
+        start = rng.randint(10, 10 ** rng.randint(2, 10))
+        ranges.append(f"{start}-{start + rng.randint(0, 100000)}")
+
+    return ','.join(ranges) + "\n"
+
+
+@generator(2025, 3)
+def gen_2025_3(size, rng):
+    """size: number of banks"""
+    return join_lines([''.join(rng.choices("123456789", k=100)) for _ in range(size)])
+
+
+@generator(2025, 4)
+def gen_2025_4(size, rng):
+    """size: side of the square grid"""
+    return join_lines(random_grid(size, size, rng, ".@", [2, 3]))
+
+
+@generator(2025, 5)
+def gen_2025_5(size, rng):
+    """size: number of fresh ranges (as many ingredients)"""
+    ranges = []
+    for _ in range(size):
+        start = rng.randint(1, 10 ** 14)
+        ranges.append(f"{start}-{start + rng.randint(0, 10 ** 12)}")
+    ingredients = [str(rng.randint(1, 10 ** 14)) for _ in range(size)]
+
+    return join_lines(ranges + [""] + ingredients)
+
+
+@generator(2025, 6)
+def gen_2025_6(size, rng):
+    """size: number of problems"""
+    rows = [[] for _ in range(4)]
+    operators = []
+    for _ in range(size):
+        # All the numbers of a problem have the same number of digits: the solver of part 2 reads the digits of a
+        # column from top to bottom and can't handle the padding of shorter numbers
+        width = rng.randint(1, 4)
+        for row in rows:
+            row.append(str(rng.randint(10 ** (width - 1), 10 ** width - 1)))
+        operators.append(rng.choice("+*").ljust(width))
+
+    return join_lines([' '.join(row) for row in rows] + [' '.join(operators)])
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# Shared loader for the grid inputs
+#
+
+"""
+Many puzzles give a rectangular map of characters. The loader reads the file once as bytes and views it as a uint8
+array of shape (rows, columns) with np.frombuffer: each line is a row, the newline characters are kept in the buffer
+but sliced out of the view, so no copy is made.
+
+A translation table (an array of 256 codes indexed by the byte values) can be given to convert the characters into
+numerical values in a single vectorised pass, this produces a new contiguous array.
+
+For instance, with the following input:
+
+  #.O
+  ..#
+
+load_grid(file) returns the character codes:
+
+  [[35 46 79]
+   [46 46 35]]
+
+and load_grid(file, translation_table({'.': 0, '#': 1, 'O': 2})) returns:
+
+  [[1 0 2]
+   [0 0 1]]
+"""
+
+import numpy as np
+
+
+def translation_table(mapping, default=0, dtype=np.uint8):
+    # Build a translation table from a dict {character: code}, characters not in the dict are converted to default.
+    # A signed dtype (np.int8) may be chosen when the codes are used in subtractions.
+    table = np.full(256, default, dtype=dtype)
+    for ch, code in mapping.items():
+        table[ord(ch)] = code
+
+    return table
+
+
+def parse_grid(data, table=None):
+    # Build the grid from the content of a file (bytes or str). Without a translation table, the returned array is a
+    # read-only view on data.
+    if isinstance(data, str):
+        data = data.encode()
+
+    # Ignore the trailing newlines, the last line may not end with a newline
+    end = len(data)
+    while end and data[end - 1] in b"\r\n":
+        end -= 1
+
+    # Lines are separated by "\n" or "\r\n", the stride between 2 rows is the length of a line with its separator
+    width = data.find(b"\n", 0, end)
+    if width < 0:
+        width, stride = end, end + 1
+    else:
+        stride = width + 1
+        if width and data[width - 1] == ord("\r"):
+            width -= 1
+
+    if (end + stride - width) % stride:
+        raise ValueError("all the lines of a grid must have the same length")
+
+    grid = np.ndarray(((end + stride - width) // stride, width), dtype=np.uint8, buffer=data, strides=(stride, 1))
+
+    if table is not None:
+        return table[grid]
+
+    return grid
+
+
+def load_grid(file, table=None):
+    # Read a grid file in a single pass, see parse_grid()
+    with open(file, "rb") as f:
+        return parse_grid(f.read(), table)
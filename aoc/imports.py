@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# Measure the import time of the day modules with python -X importtime
+#
+
+"""
+Each day module is loaded in a fresh interpreter started with -X importtime, which writes a line to stderr for every
+module imported:
+
+  import time: self [us] | cumulative | imported package
+  import time:       412 |        412 |     _io
+  import time:     28541 |      75102 | numpy
+
+The interpreter and the aoc package are imported first, then a marker is written to stderr and the day module is
+loaded: the lines written after the marker are the imports done by the day module. Those with no indentation in the
+last column are imported directly by it, their cumulative time includes their own imports.
+
+The day module itself is executed from its path (see days.load_day) and doesn't get a line, its total load time is
+measured separately with perf_counter.
+"""
+
+import json
+import re
+import subprocess
+import sys
+
+from aoc import days
+
+MARKER = "-- aoc: loading the day module"
+
+LOAD_SCRIPT = f"""
+import json, sys, time
+from aoc import days
+print({MARKER!r}, file=sys.stderr, flush=True)
+start = time.perf_counter()
+days.load_day(int(sys.argv[1]), int(sys.argv[2]))
+print(json.dumps(time.perf_counter() - start))
+"""
+
+IMPORT_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)')
+
+
+def parse_importtime(text):
+    # Return the direct imports [(module, cumulative seconds), ...] written after the marker, the slowest first
+    imports = []
+    _, found, text = text.partition(MARKER)
+    if not found:
+        return imports
+
+    for line in text.splitlines():
+        if m := IMPORT_LINE.match(line):
+            if not m.group(3):
+                imports.append((m.group(4), int(m.group(2)) / 1e6))
+
+    return sorted(imports, key=lambda x: x[1], reverse=True)
+
+
+def measure_imports(year, day):
+    # Load a day module in a new interpreter, return (load time in seconds, direct imports, error)
+    cmd = [sys.executable, "-X", "importtime", "-c", LOAD_SCRIPT, str(year), str(day)]
+    proc = subprocess.run(cmd, cwd=days.ROOT, capture_output=True, text=True)
+    imports = parse_importtime(proc.stderr)
+    if proc.returncode != 0:
+        return None, imports, proc.stderr.strip().splitlines()[-1]
+
+    return json.loads(proc.stdout.splitlines()[-1]), imports, None
+
+
+def run(year="all", day="all", on_measure=None):
+    # Measure the imports of the selected days, return a dict {(year, day): (load time, imports, error)}
+    measures = {}
+    for y, d in sorted({(y, d) for y, d, _ in days.select(year, day)}):
+        measures[(y, d)] = measure_imports(y, d)
+        if on_measure:
+            on_measure((y, d), measures[(y, d)])
+
+    return measures
+
+
+def format_measure(key, measure, top=3):
+    year, day = key
+    load_time, imports, error = measure
+    label = f"{year} day{day:<2}"
+    if error:
+        return f"{label}: ERROR {error}"
+
+    heaviest = ", ".join(f"{module} {seconds * 1000:.1f}ms" for module, seconds in imports[:top])
+    return f"{label}: {load_time * 1000:7.1f}ms" + (f"  ({heaviest})" if heaviest else "")
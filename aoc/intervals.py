@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# Sets of integer intervals backed by sorted arrays
+#
+
+"""
+Several puzzles work on ranges of integers: ranges of seeds mapped from one category to the next, ranges of fresh
+ingredients, cells of a line covered by sensors... An IntervalSet holds such a set of integers as its disjoint
+intervals, sorted in 2 int64 arrays of starts and ends. The intervals are half-open, [start, end): the inclusive range
+3-5 of a puzzle is the interval [3, 6).
+
+The intervals given to build a set may overlap, touch or be empty, they are merged into the smallest list of disjoint
+intervals:
+
+  IntervalSet([3, 10, 16, 12], [6, 15, 21, 19])  ->  IntervalSet([3, 6), [10, 21))
+
+The operations between sets (|, &, -) split the integers at all the bounds of both sets into elementary segments, keep
+the segments according to their membership in each set and merge the result, all in vectorised passes. A point is
+looked up by a binary search over the starts, in O(log n), contains() looks up a whole array of points at once.
+"""
+
+import numpy as np
+
+
+class IntervalSet:
+    def __init__(self, starts=(), ends=()):
+        # Build the set from the intervals [starts[i], ends[i]), which may overlap and be in any order
+        starts = np.asarray(starts, dtype=np.int64).ravel()
+        ends = np.asarray(ends, dtype=np.int64).ravel()
+        if starts.shape != ends.shape:
+            raise ValueError("an interval set needs as many starts as ends")
+
+        non_empty = ends > starts
+        starts, ends = starts[non_empty], ends[non_empty]
+        order = np.argsort(starts, kind="stable")
+        starts, ends = starts[order], ends[order]
+
+        # An interval starts a new group unless it overlaps or touches the intervals before it
+        if starts.size:
+            max_ends = np.maximum.accumulate(ends)
+            first = np.flatnonzero(np.concatenate(([True], starts[1:] > max_ends[:-1])))
+            starts, ends = starts[first], np.maximum.reduceat(ends, first)
+
+        self.starts = starts
+        self.ends = ends
+
+    @classmethod
+    def from_inclusive(cls, ranges):
+        # Build the set from a list of inclusive ranges (first, last)
+        ranges = np.asarray(ranges, dtype=np.int64).reshape(-1, 2)
+        return cls(ranges[:, 0], ranges[:, 1] + 1)
+
+    def __repr__(self):
+        return f"IntervalSet({', '.join(f'[{s}, {e})' for s, e in self)})"
+
+    def __iter__(self):
+        # The (start, end) of the intervals, in order
+        return zip(self.starts.tolist(), self.ends.tolist())
+
+    def __len__(self):
+        # The number of intervals, see length for the number of integers
+        return len(self.starts)
+
+    def __bool__(self):
+        return bool(self.starts.size)
+
+    def __eq__(self, other):
+        return (isinstance(other, IntervalSet) and np.array_equal(self.starts, other.starts)
+                and np.array_equal(self.ends, other.ends))
+
+    def __contains__(self, value):
+        index = np.searchsorted(self.starts, value, side="right") - 1
+        return bool(index >= 0 and value < self.ends[index])
+
+    def contains(self, values):
+        # Look up an array of points, return a boolean array
+        values = np.asarray(values, dtype=np.int64)
+        if not self.starts.size:
+            return np.zeros(values.shape, dtype=bool)
+
+        indexes = np.searchsorted(self.starts, values, side="right") - 1
+        return (indexes >= 0) & (values < self.ends[np.maximum(indexes, 0)])
+
+    @property
+    def length(self):
+        # The number of integers in the set
+        return int((self.ends - self.starts).sum())
+
+    def min(self):
+        return int(self.starts[0])
+
+    def max(self):
+        # The last integer of the set, its intervals are half-open
+        return int(self.ends[-1]) - 1
+
+    def shift(self, offset):
+        shifted = IntervalSet()
+        shifted.starts, shifted.ends = self.starts + offset, self.ends + offset
+        return shifted
+
+    def _combine(self, other, keep):
+        # Split the integers at the bounds of both sets, keep the segments for which keep(in self, in other) is true
+        bounds = np.unique(np.concatenate((self.starts, self.ends, other.starts, other.ends)))
+        segments = bounds[:-1]
+        kept = keep(self.contains(segments), other.contains(segments))
+
+        return IntervalSet(segments[kept], bounds[1:][kept])
+
+    def __or__(self, other):
+        return self._combine(other, np.logical_or)
+
+    def __and__(self, other):
+        return self._combine(other, np.logical_and)
+
+    def __sub__(self, other):
+        return self._combine(other, lambda a, b: a & ~b)
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
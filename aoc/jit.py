@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Optional JIT compilation of the inner loops with numba
+#
+
+"""
+The innermost loops over the cells of a grid are pure Python code indexing NumPy arrays one scalar at a time. When
+numba is installed, such a loop is compiled to machine code and run on the typed arrays directly, as the jit engine of
+its step (see engines):
+
+  @dispatch
+  def pour_sand(grid, return_blocked=False):
+      ...
+
+  # Compiled as it is, pour_sand() only uses integers and an array
+  compile_reference(pour_sand)
+
+A step whose reference implementation uses Python objects (lists of tuples, attributes...) gets a wrapper calling a
+kernel written for numba instead:
+
+  @kernel
+  def walk(grid, x, y):
+      ...
+
+  @engine(move)
+  def move_jit(self):
+      self.x, self.y = walk(self.grid, self.x, self.y)
+
+python -m aoc run --engine jit runs the compiled kernels, and python -m aoc compare <year> <day> jit checks that both
+engines give the same answers. The jit engine is not the default one: the first call of a kernel in a process
+compiles it, or loads it from the cache, within the time of the part. Without numba, nothing is registered and the
+reference engine runs as before.
+
+The compiled code is cached on disk by numba (in the __pycache__ directory of the day), only the first run pays for the
+compilation, the next ones still pay for loading it.
+
+Importing numba takes several hundred milliseconds, more than most of the parts. Its presence is only detected when
+this module is imported (importlib.util.find_spec), numba itself is imported and a kernel compiled on the first call
+of the kernel: the days which don't run one, or run with the reference engine, never pay for it.
+"""
+
+import functools
+import importlib.util
+
+ENGINE = "jit"
+
+available = importlib.util.find_spec("numba") is not None
+
+
+def kernel(func):
+    # Compile a function in nopython mode on its first call, without numba it is returned as it is
+    if not available:
+        return func
+
+    compiled = None
+
+    @functools.wraps(func)
+    def call(*args, **kwargs):
+        nonlocal compiled
+        if compiled is None:
+            import numba
+            compiled = numba.njit(cache=True)(func)
+        return compiled(*args, **kwargs)
+
+    return call
+
+
+def engine(step):
+    # Decorator registering a function as the jit engine of a dispatched step, when numba is installed
+    def register(func):
+        if available:
+            step.engine(ENGINE)(func)
+        return func
+
+    return register
+
+
+def compile_reference(step):
+    # Register the reference implementation of a step, compiled as it is, as its jit engine
+    engine(step)(kernel(step.__wrapped__))
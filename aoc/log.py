@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# Level-gated logging for the day modules
+#
+
+"""
+The day modules report their debugging information through the standard logging module instead of print(), under the
+"aoc" logger:
+
+  log = get_logger(__name__)
+  log.debug("%s -> %s", seed, new_seed)
+
+A record below the current level is dropped before its message is formatted, so a disabled log.debug() in a hot loop
+only costs a method call. Its arguments are still evaluated though: whatever is expensive to build (rendering a grid,
+joining a list...) must be guarded:
+
+  if log.isEnabledFor(DEBUG):
+      log.debug("\n%s", render(grid))
+
+Only the warnings are shown by default. The level is read from the AOC_LOG_LEVEL environment variable (debug, info,
+warning...), which is also how python -m aoc run --log-level passes it on to the worker processes.
+
+The records are written to the standard output of the moment, which the runner captures along with the answer of the
+part (see runner).
+"""
+
+import logging
+import os
+import sys
+# Re-exported for the day modules
+from logging import DEBUG, INFO, WARNING
+
+ENV_LEVEL = "AOC_LOG_LEVEL"
+LEVELS = ("debug", "info", "warning", "error")
+
+root = logging.getLogger("aoc")
+
+
+class StdoutHandler(logging.Handler):
+    # Write to sys.stdout as it is when the record is emitted, not when the handler is created, so that the output
+    # redirected by the runner gets the records
+    def emit(self, record):
+        try:
+            sys.stdout.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+
+def configure(level=None):
+    # Set the level of all the aoc loggers, by default from the environment. The level is also stored in the
+    # environment, to be inherited by the child processes.
+    level = (level or os.environ.get(ENV_LEVEL) or "warning").lower()
+    os.environ[ENV_LEVEL] = level
+    root.setLevel(level.upper())
+
+
+def get_logger(name):
+    # Day modules are loaded as aoc_<year>_day<N> (see days.load_day), or as __main__ when run as a script
+    return root.getChild(name)
+
+
+handler = StdoutHandler()
+handler.setFormatter(logging.Formatter("%(message)s"))
+root.addHandler(handler)
+root.propagate = False
+configure()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# Measure the memory allocated by the parts with tracemalloc
+#
+
+"""
+tracemalloc gives the peak of the memory traced while a part runs, but a snapshot taken at the end of the part is
+useless to find where this peak comes from: the part has returned and its local data has been freed. So while the part
+runs, a background thread polls the traced memory and takes a new snapshot each time it grows past the last snapshot
+by more than GROWTH. The allocation sites reported are the ones of the largest snapshot, taken close to the peak.
+
+tracemalloc makes the Python allocations several times slower, so the wall times of a traced run are not meaningful.
+"""
+
+import threading
+import tracemalloc
+from collections import namedtuple
+from pathlib import Path
+
+from aoc import days
+
+# A snapshot is taken when the traced memory grows by 10% over the last snapshot
+GROWTH = 1.1
+# Polling interval of the traced memory (in seconds)
+INTERVAL = 0.01
+
+MemoryUsage = namedtuple("MemoryUsage", ["peak", "top"])
+
+# The allocations made by the tracing itself or by the import machinery are not reported
+IGNORED = [
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def site_name(frame):
+    # Show the files of the repository relative to its root (2022/day15/day15.py:42), the others by their name only
+    path = Path(frame.filename)
+    if path.is_relative_to(days.ROOT):
+        path = path.relative_to(days.ROOT)
+    else:
+        path = path.name
+
+    return f"{path}:{frame.lineno}"
+
+
+class MemoryTracer:
+    """
+    Context manager tracing the memory allocated inside its block:
+
+      with MemoryTracer() as tracer:
+          part1(data)
+      print(tracer.usage())
+    """
+
+    def __init__(self, top=5):
+        self.top = top
+        self.peak = 0
+        self.snapshot = None
+        self.snapshot_size = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        tracemalloc.start()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self._take_snapshot()
+        self.peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    def _take_snapshot(self):
+        current = tracemalloc.get_traced_memory()[0]
+        if current > self.snapshot_size:
+            self.snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED)
+            self.snapshot_size = current
+
+    def _poll(self):
+        while not self._stop.wait(INTERVAL):
+            if tracemalloc.get_traced_memory()[0] > self.snapshot_size * GROWTH:
+                self._take_snapshot()
+
+    def usage(self):
+        # Return the peak traced memory (in bytes) and the top allocation sites [(site, bytes, blocks), ...]
+        top = []
+        if self.snapshot is not None:
+            for stat in self.snapshot.statistics("lineno")[:self.top]:
+                top.append((site_name(stat.traceback[0]), stat.size, stat.count))
+
+        return MemoryUsage(self.peak, top)
+
+
+def format_size(size):
+    for unit in ["B", "KiB", "MiB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+
+    return f"{size:.1f} GiB"
+
+
+def format_usage(usage):
+    lines = [f"  peak traced memory: {format_size(usage.peak)}"]
+    for site, size, count in usage.top:
+        lines.append(f"  {format_size(size):>11} {count:>9} blocks  {site}")
+
+    return "\n".join(lines)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# Shared tokenizer for the inputs made of integers
+#
+
+"""
+Many puzzles give lines of integers mixed with some text. Instead of matching each line with a regular expression and
+converting every group with int(), the tokenizer views the whole input as a uint8 array and extracts all its integers
+in a few vectorised passes: the runs of digits are located, each digit is weighted by its power of 10 within its run and
+the weighted digits of each run are summed.
+
+A "-" right before a run of digits makes it negative, unless the "-" itself follows a digit: in "x=-2" the integer is
+-2, in "3-5" (a range) they are 3 and 5.
+
+With line_offsets, the offsets of the integers of each line are returned too, for the inputs whose lines don't all hold
+the same number of integers. For instance, with the following input:
+
+  Sensor at x=2, y=-18
+  1 2 3
+
+  7
+
+parse_ints(text) returns [2 -18 1 2 3 7], and parse_ints(text, line_offsets=True) returns the same array with the
+offsets [0 2 5 5 6]: the integers of the line i are values[offsets[i]:offsets[i + 1]], split_rows() and split_lists()
+split them into rows.
+"""
+
+import numpy as np
+
+# An int64 holds all the integers of up to 18 digits
+MAX_DIGITS = 18
+POWERS = 10 ** np.arange(MAX_DIGITS, dtype=np.int64)
+
+
+def parse_ints(data, line_offsets=False):
+    # Return the integers found in the content of a file (bytes or str) as an int64 array, and their offsets by line
+    # with line_offsets
+    if isinstance(data, str):
+        data = data.encode()
+    buffer = np.frombuffer(data, dtype=np.uint8)
+
+    # The runs of digits start where a digit follows a non-digit, and end where a non-digit follows a digit
+    is_digit = (buffer >= ord("0")) & (buffer <= ord("9"))
+    edges = np.diff(np.concatenate(([False], is_digit, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    lengths = ends - starts
+    if lengths.size and lengths.max() > MAX_DIGITS:
+        raise ValueError(f"integers of more than {MAX_DIGITS} digits don't fit in an int64")
+
+    if starts.size:
+        # Weight each digit by 10 to the power of the number of digits after it in its run, then sum each run
+        digits = buffer[is_digit].astype(np.int64) - ord("0")
+        weights = POWERS[np.repeat(ends, lengths) - np.flatnonzero(is_digit) - 1]
+        values = np.add.reduceat(digits * weights, np.cumsum(lengths) - lengths)
+
+        # A "-" before a run is a sign, unless it is a separator between 2 integers
+        signs = starts - 1
+        negative = (signs >= 0) & (buffer[signs] == ord("-"))
+        negative &= (signs == 0) | ~is_digit[np.maximum(signs - 1, 0)]
+        values[negative] = -values[negative]
+    else:
+        values = np.zeros(0, dtype=np.int64)
+
+    if not line_offsets:
+        return values
+
+    # Count the integers of each line, a last line without a newline is a line too
+    newlines = np.flatnonzero(buffer == ord("\n"))
+    nb_lines = len(newlines) + (1 if len(data) and data[-1:] != b"\n" else 0)
+    counts = np.bincount(np.searchsorted(newlines, starts), minlength=nb_lines)
+
+    return values, np.concatenate(([0], np.cumsum(counts)))
+
+
+def split_rows(values, offsets):
+    # Split the integers into a list of arrays, one for each line
+    # np.split always returns at least one array, an empty input has no line
+    return np.split(values, offsets[1:-1]) if len(offsets) > 1 else []
+
+
+def split_lists(values, offsets):
+    # Split the integers into a list of lists of Python integers, one for each line
+    values, offsets = values.tolist(), offsets.tolist()
+    return [values[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# Profile the parts with cProfile and export the results for the flamegraph tools
+#
+
+"""
+Each profiled part produces 2 files, named after the year, day and part (for instance 2022_day11_part1):
+
+- <name>.pstats: the raw cProfile statistics, to be read with pstats, snakeviz, gprof2dot...
+- <name>.collapsed: the collapsed stacks ("frame;frame;frame value" lines) read by flamegraph.pl, speedscope or
+  inferno, the values are in microseconds.
+
+cProfile doesn't record full stacks, only the time spent in each caller -> callee edge. So the stacks are rebuilt from
+the roots by splitting the time spent in a function between its callees in proportion to the time of each edge. This
+is the usual approximation (flameprof, gprof2dot do the same) and is exact as long as a function behaves the same
+whoever calls it. Recursive calls are folded into the outermost call.
+"""
+
+import pstats
+from collections import defaultdict
+from pathlib import Path
+
+from aoc import days
+
+PROFILE_DIR = days.ROOT / ".aoc" / "profiles"
+
+# Stacks with less time than this (in seconds) are dropped, this keeps the number of rebuilt stacks reasonable
+MIN_TIME = 1e-6
+
+
+def profile_name(year, day, part):
+    return f"{year}_day{day}_part{part}"
+
+
+def frame_label(func):
+    # func is a pstats key: (filename, line number, function name), built-in functions have no file
+    filename, lineno, name = func
+    if filename == "~":
+        return name
+
+    return f"{name} ({Path(filename).name}:{lineno})"
+
+
+def collapsed_stacks(stats):
+    # Rebuild the stacks from a pstats.Stats, return a dict {(frame, frame, ...): seconds}
+    entries = stats.stats
+    callees = defaultdict(dict)
+    for func, (cc, nc, tt, ct, callers) in entries.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge
+
+    stacks = defaultdict(float)
+
+    def walk(func, stack, on_stack, time):
+        cc, nc, tt, ct, callers = entries[func]
+        stack = stack + (frame_label(func),)
+        on_stack = on_stack | {func}
+        if ct <= 0:
+            stacks[stack] += time
+            return
+
+        stacks[stack] += time * tt / ct
+        for callee, edge in callees[func].items():
+            child_time = time * edge[3] / ct
+            if callee not in on_stack and child_time >= MIN_TIME:
+                walk(callee, stack, on_stack, child_time)
+
+    # The roots are the functions not called by any profiled function
+    for func, (cc, nc, tt, ct, callers) in entries.items():
+        if not any(caller in entries for caller in callers):
+            walk(func, (), frozenset(), ct)
+
+    return stacks
+
+
+def write_collapsed(stats, path):
+    with open(path, "w") as f:
+        for stack, time in sorted(collapsed_stacks(stats).items()):
+            value = round(time * 1e6)
+            if value > 0:
+                f.write(f"{';'.join(stack)} {value}\n")
+
+
+def save_profile(profiler, year, day, part, directory=PROFILE_DIR):
+    # Write the .pstats and .collapsed files of a part, return their paths
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    base = directory / profile_name(year, day, part)
+
+    pstats_path = base.with_suffix(".pstats")
+    profiler.dump_stats(pstats_path)
+
+    collapsed_path = base.with_suffix(".collapsed")
+    write_collapsed(pstats.Stats(profiler), collapsed_path)
+
+    return pstats_path, collapsed_path
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# Memory-mapped reading of the inputs, record by record
+#
+
+"""
+A parser given the text of its input needs the whole file in memory, decoded, before it starts, often followed by the
+list of its lines. mapped() maps the file in memory instead: its pages are read by the system when they are accessed,
+and released as needed, so a parser going through its input once runs in constant memory whatever the input size.
+
+The records of the mapped content are taken as memoryviews on it, no byte is copied:
+
+  - lines(data): the lines, without their line break
+  - blocks(data): the groups of lines separated by blank lines, with their inner line breaks
+  - tokens(data, delimiter): the tokens separated by a delimiter, or by whitespace by default
+
+For instance, with the following input:
+
+  1,2
+  3
+
+  4
+
+list(blocks(data)) gives the views on b"1,2\\n3" and b"4", and list(tokens(data, b",")) on b"1", b"2\\n3\\n\\n4". A
+view is converted when needed: bytes(view), or np.frombuffer(view, dtype=np.uint8) without a copy (see
+numbers.parse_ints, which takes a view as it is).
+
+The views are only valid in the with block of mapped(), they must not be kept after it: the parsed data is built from
+them inside the block. The record functions also take bytes, a day parses its text with the same code as its mapped
+file with parse_mapped(text.encode()).
+"""
+
+import mmap
+import os
+import re
+from contextlib import contextmanager
+
+WHITESPACE = b" \t\r\n\v\f"
+
+
+@contextmanager
+def mapped(file):
+    # Map the content of a file in memory, read-only
+    with open(file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # An empty file can't be mapped
+            yield b""
+            return
+
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield data
+        finally:
+            try:
+                data.close()
+            except BufferError:
+                # Some views on the content are still referenced, the map is closed when they are released
+                pass
+
+
+def _line_spans(data):
+    # Yield the (start, end) of each line of the data, without its line break ("\n" or "\r\n")
+    start, size = 0, len(data)
+    while start < size:
+        end = data.find(b"\n", start)
+        next_start = end + 1
+        if end < 0:
+            end = next_start = size
+        if end > start and data[end - 1:end] == b"\r":
+            end -= 1
+        yield start, end
+        start = next_start
+
+
+def lines(data):
+    # Yield the lines of the data, a last line without a line break is a line too
+    view = memoryview(data)
+    for start, end in _line_spans(data):
+        yield view[start:end]
+
+
+def blocks(data):
+    # Yield the blocks of lines separated by one or more blank lines
+    view = memoryview(data)
+    block_start = block_end = None
+    for start, end in _line_spans(data):
+        if start == end:
+            if block_start is not None:
+                yield view[block_start:block_end]
+                block_start = None
+        else:
+            if block_start is None:
+                block_start = start
+            block_end = end
+
+    if block_start is not None:
+        yield view[block_start:block_end]
+
+
+def tokens(data, delimiter=None):
+    # Yield the tokens separated by the delimiter (bytes), or by whitespace when no delimiter is given
+    # The whitespace around the tokens is ignored, and the empty tokens are skipped.
+    view = memoryview(data)
+    if delimiter is None:
+        for match in re.finditer(rb"\S+", data):
+            yield view[match.start():match.end()]
+        return
+
+    start, size = 0, len(data)
+    while start < size:
+        end = data.find(delimiter, start)
+        next_start = end + len(delimiter)
+        if end < 0:
+            end = next_start = size
+
+        # Strip the whitespace around the token
+        while start < end and data[start] in WHITESPACE:
+            start += 1
+        while end > start and data[end - 1] in WHITESPACE:
+            end -= 1
+        if end > start:
+            yield view[start:end]
+        start = next_start
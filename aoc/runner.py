@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+#
+# Run the parts of the day modules in the current process
+#
+
+"""
+The input of a day is read and parsed once, the parsed data is then given to each part. When both parts of a day are
+run one after the other, the second one reuses the data parsed for the first one, so the parse time is counted in the
+first part only.
+
+With a cache directory, the parsed data is also kept on disk from one run to the next (see cache), the parse time is
+then only paid by the first run on an input. The same goes for the arrays the days derive from their input with
+cache.cached_array().
+
+With a snapshot directory, the long simulations save their state periodically, and resume from it when asked to (see
+snapshot).
+
+The answer reported is the value returned by the part, converted with str() (a multi-line answer, like the screen of
+2022 day 10, is kept whole). Some parts print debugging information while they run, so we capture their standard
+output, it is kept in the output field of the result.
+"""
+
+import cProfile
+import io
+import time
+import traceback
+from collections import namedtuple
+from contextlib import nullcontext, redirect_stdout
+
+from aoc import cache, counters, days, engines, memory, profiling, snapshot
+
+# memory is a memory.MemoryUsage when the memory is traced, counters a dict of the work counters when they are enabled
+# (see counters), None otherwise
+Result = namedtuple("Result", ["year", "day", "part", "input", "answer", "output", "wall", "cpu", "error", "memory",
+                               "counters"], defaults=[None, None])
+
+
+def parse_input(year, day, file, inputs=None, cache_dir=None):
+    # Read and parse an input with the parse() function of its day module. The parsed data is stored in the optional
+    # inputs dict, later calls with the same dict reuse it. With a cache_dir, it goes through the on-disk cache.
+    key = (year, day, str(file))
+    if inputs is not None and key in inputs:
+        return inputs[key]
+
+    module = days.load_day(year, day)
+    if cache_dir is not None:
+        data = cache.cached_parse(module, file, cache_dir)
+    else:
+        data = days.parse_file(module, file)
+    if inputs is not None:
+        inputs[key] = data
+
+    return data
+
+
+def snapshot_key(module, part, file):
+    with open(file) as f:
+        return snapshot.part_key(module, part, f.read())
+
+
+def solve(year, day, part, file, inputs=None, cache_dir=None, engine=None, snapshot_dir=None, resume=False):
+    # Return the answer of the part, a part which isn't solved returns None
+    # The module is usually already loaded by the caller, outside of the timed section (see run_part)
+    module = days.load_day(year, day)
+    func = days.get_part(module, part)
+    key = snapshot_key(module, part, file) if snapshot_dir is not None else None
+    with cache.derived_cache(cache_dir), engines.use(engine), snapshot.snapshots(snapshot_dir, key, resume):
+        return func(parse_input(year, day, file, inputs, cache_dir))
+
+
+def run_part(year, day, part, file=None, profile_dir=None, trace_memory=0, inputs=None, cache_dir=None,
+             engine=None, count=False, snapshot_dir=None, resume=False):
+    # Run a single part and return a Result, errors are caught and reported in the result
+    # With a profile_dir, the part is run under cProfile and its profile is saved in this directory (see profiling)
+    # With trace_memory, the memory allocated by the part is traced and its peak is reported with the given number of
+    # top allocation sites (see memory)
+    # inputs is a dict of the parsed inputs shared between the calls, cache_dir the directory of the on-disk cache of
+    # the parsed inputs (see parse_input)
+    # engine is the name of the engine of the day to run, the reference one by default (see engines)
+    # With count, the work counters of the part are collected (see counters)
+    # With a snapshot_dir, the long simulations save snapshots of their state in this directory, and start from the
+    # last one saved with resume (see snapshot)
+    file = days.resolve_input(year, day, file)
+    buffer = io.StringIO()
+    answer = None
+    error = None
+    counts = None
+
+    # Load the module before starting the timers and the profiler, so that its import is not counted in the first part
+    # run. A module which fails to load is reported as the error of the part.
+    try:
+        days.load_day(year, day)
+    except Exception as e:
+        error = "".join(traceback.format_exception_only(type(e), e)).strip()
+        return Result(year, day, part, str(file), None, "", 0.0, 0.0, error)
+
+    profiler = cProfile.Profile() if profile_dir is not None else None
+    tracer = memory.MemoryTracer(trace_memory) if trace_memory else None
+    # The profiled part is traced too when both are requested
+    counting = counters.counting() if count else nullcontext()
+    tracing = tracer or nullcontext()
+    start = time.perf_counter()
+    start_cpu = time.process_time()
+
+    try:
+        with redirect_stdout(buffer), counting as counts, tracing:
+            if profiler:
+                answer = profiler.runcall(solve, year, day, part, file, inputs, cache_dir, engine, snapshot_dir, resume)
+            else:
+                answer = solve(year, day, part, file, inputs, cache_dir, engine, snapshot_dir, resume)
+    except Exception as e:
+        error = "".join(traceback.format_exception_only(type(e), e)).strip()
+
+    wall = time.perf_counter() - start
+    cpu = time.process_time() - start_cpu
+    output = buffer.getvalue()
+
+    if profiler:
+        profiling.save_profile(profiler, year, day, part, profile_dir)
+
+    return Result(year, day, part, str(file), str(answer) if answer is not None else None, output, wall, cpu, error,
+                  tracer.usage() if tracer else None, dict(counts) if counts is not None else None)
+
+
+def run(jobs, file=None, profile_dir=None, trace_memory=0, cache_dir=None, engine=None, count=False, snapshot_dir=None,
+        resume=False):
+    # Run a list of (year, day, part) jobs one after another, yielding a Result as soon as a part is done
+    # The parts of a day share its parsed input, it is dropped when moving on to another day
+    inputs = {}
+    for year, day, part in jobs:
+        if any(key[:2] != (year, day) for key in inputs):
+            inputs.clear()
+        yield run_part(year, day, part, file, profile_dir, trace_memory, inputs, cache_dir, engine, count, snapshot_dir,
+                       resume)
+
+
+def format_result(result):
+    label = f"{result.year} day{result.day:<2} part {result.part}"
+    if result.error:
+        text = f"{label}: ERROR {result.error} ({result.wall:.3f}s)"
+    else:
+        text = f"{label}: {result.answer} ({result.wall:.3f}s)"
+
+    if result.memory is not None:
+        text += "\n" + memory.format_usage(result.memory)
+    if result.counters is not None:
+        text += "\n" + counters.format_counts(result.counters)
+
+    return text
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+#
+# Run the parts of the day modules concurrently over a pool of processes
+#
+
+"""
+The (year, day, part) jobs are spread across a ProcessPoolExecutor. A handful of parts take most of the total time, so
+to get the shortest overall run we submit the slowest jobs first: a slow job started last would leave all the other
+workers idle while it finishes.
+
+The cost of a job is the wall time recorded the last time it was run (stored in .aoc/runtimes.json), or an estimate for
+the days known to be slow when nothing has been recorded yet.
+
+Each job may be given a timeout. A running job can't be cancelled from the parent process, so the timeout is enforced
+inside the worker with an interval timer that raises JobTimeout in the middle of the job.
+"""
+
+import json
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc import days, runner
+
+RUNTIMES_FILE = days.ROOT / ".aoc" / "runtimes.json"
+
+# Rough wall times (in seconds) of the slowest days, used until real runtimes have been recorded
+KNOWN_SLOW = {
+    (2022, 16): 3.0,
+    (2022, 19): 3.0,
+    (2022, 20): 2.0,
+    (2022, 24): 2.0,
+    (2023, 16): 1.0,
+}
+
+
+class JobTimeout(Exception):
+    pass
+
+
+def load_runtimes():
+    # Recorded runtimes are stored as {"<year>/<day>/<part>": seconds}
+    try:
+        with open(RUNTIMES_FILE) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_runtimes(results):
+    # Record the wall time of the successful jobs, keeping the ones of the jobs not run this time
+    runtimes = load_runtimes()
+    for result in results:
+        if result.error is None:
+            runtimes[f"{result.year}/{result.day}/{result.part}"] = round(result.wall, 6)
+
+    RUNTIMES_FILE.parent.mkdir(exist_ok=True)
+    with open(RUNTIMES_FILE, "w") as f:
+        json.dump(runtimes, f, indent=1, sort_keys=True)
+
+
+def estimated_cost(job, runtimes):
+    year, day, part = job
+    return runtimes.get(f"{year}/{day}/{part}", KNOWN_SLOW.get((year, day), 0.0))
+
+
+def _raise_timeout(signum, frame):
+    raise JobTimeout("timed out")
+
+
+def _run_job(year, day, part, file, timeout, profile_dir, trace_memory, cache_dir, engine, count, snapshot_dir, resume):
+    # Executed in a worker process
+    if timeout:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return runner.run_part(year, day, part, file, profile_dir, trace_memory, cache_dir=cache_dir, engine=engine,
+                               count=count, snapshot_dir=snapshot_dir, resume=resume)
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def run(jobs, file=None, workers=None, timeout=None, on_result=None, profile_dir=None, trace_memory=0,
+        cache_dir=None, engine=None, count=False, snapshot_dir=None, resume=False):
+    # Run the jobs in a pool of worker processes, the slowest first. Return all the results, sorted by (year, day, part)
+    # The optional on_result callback is called with each result as soon as it is available.
+    # profile_dir, trace_memory, cache_dir, engine, count, snapshot_dir and resume are passed to runner.run_part in the
+    # workers. A part interrupted by the timeout can be resumed from its last snapshot by the next run.
+    runtimes = load_runtimes()
+    ordered = sorted(jobs, key=lambda job: estimated_cost(job, runtimes), reverse=True)
+    results = []
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [executor.submit(_run_job, year, day, part, file, timeout, profile_dir, trace_memory, cache_dir,
+                                   engine, count, snapshot_dir, resume)
+                   for year, day, part in ordered]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+    save_runtimes(results)
+
+    return sorted(results, key=lambda r: (r.year, r.day, r.part))
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+#
+# Local solver service keeping the day modules loaded between requests
+#
+
+"""
+Starting an interpreter and importing numpy takes longer than solving most of the parts. The server pays this once: it
+starts a pool of worker processes which import numpy and all the day modules, then solves the requests it receives on
+a Unix socket.
+
+The protocol is made of JSON lines, a connection may send several requests and gets one response line per request:
+
+  -> {"year": 2022, "day": 5, "part": 1, "input": "    [D]    \\n[N] [C]    \\n..."}
+  <- {"answer": "CMZ", "output": "", "wall": 0.0001, "cpu": 0.0001, "error": null}
+
+The answer is the value returned by the part (see runner), the output is what the part printed while running.
+
+A worker keeps the data parsed from the last inputs it received (keyed by the SHA-256 of the input). The requests are
+sent to the workers according to this hash, all the requests on an input go to the same worker: the next requests on
+the same input, the other part for instance, skip the parsing.
+"""
+
+import hashlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+from aoc import days
+
+SOCKET_FILE = days.ROOT / ".aoc" / "server.sock"
+
+# Number of parsed inputs kept in memory by each worker
+MAX_PARSED = 32
+
+# Parsed inputs of the worker process, {(year, day, input hash): data} from the least to the most recently used
+_parsed = OrderedDict()
+
+
+def _init_worker():
+    # Import numpy and all the day modules up front, a module which fails to load reports its error when requested
+    try:
+        import numpy
+    except ImportError:
+        pass
+
+    for year, day, _ in days.select(part=1):
+        try:
+            days.load_day(year, day)
+        except Exception:
+            pass
+
+
+def input_digest(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def parse_text(year, day, text, digest=None):
+    key = (year, day, digest or input_digest(text))
+    if key in _parsed:
+        _parsed.move_to_end(key)
+        return _parsed[key]
+
+    data = days.load_day(year, day).parse(text)
+    _parsed[key] = data
+    if len(_parsed) > MAX_PARSED:
+        _parsed.popitem(last=False)
+
+    return data
+
+
+def solve(year, day, part, text, digest=None):
+    # Executed in a worker process, return the response to a request
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    start_cpu = time.process_time()
+    answer = None
+    error = None
+
+    try:
+        with redirect_stdout(buffer):
+            answer = days.get_part(days.load_day(year, day), part)(parse_text(year, day, text, digest))
+    except Exception as e:
+        error = "".join(traceback.format_exception_only(type(e), e)).strip()
+
+    output = buffer.getvalue()
+
+    return {
+        "answer": str(answer) if answer is not None else None,
+        "output": output,
+        "wall": time.perf_counter() - start,
+        "cpu": time.process_time() - start_cpu,
+        "error": error,
+    }
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                request = json.loads(line)
+                digest = input_digest(request["input"])
+                future = self.server.worker(digest).submit(solve, int(request["year"]), int(request["day"]),
+                                                           int(request["part"]), request["input"], digest)
+                response = future.result()
+            except Exception as e:
+                response = {"answer": None, "output": "", "wall": 0.0, "cpu": 0.0,
+                            "error": "".join(traceback.format_exception_only(type(e), e)).strip()}
+
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class SolverServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_file=SOCKET_FILE, workers=None):
+        self.socket_file = str(socket_file)
+        # A socket left by a server which didn't stop cleanly would prevent binding
+        if os.path.exists(self.socket_file):
+            os.unlink(self.socket_file)
+        os.makedirs(os.path.dirname(self.socket_file), exist_ok=True)
+
+        # A worker is a pool of a single process, so that the requests on an input can be sent to the worker which
+        # parsed it (see worker)
+        self.workers = [ProcessPoolExecutor(max_workers=1, initializer=_init_worker)
+                        for _ in range(workers or os.cpu_count())]
+        super().__init__(self.socket_file, RequestHandler)
+
+    def worker(self, digest):
+        # The worker of the requests on the input of this digest
+        return self.workers[int(digest[:16], 16) % len(self.workers)]
+
+    def server_close(self):
+        super().server_close()
+        for worker in self.workers:
+            worker.shutdown(cancel_futures=True)
+        if os.path.exists(self.socket_file):
+            os.unlink(self.socket_file)
+
+
+def _raise_exit(signum, frame):
+    raise SystemExit(0)
+
+
+def serve(socket_file=SOCKET_FILE, workers=None, on_ready=None):
+    # Serve until interrupted, SIGTERM stops the server as cleanly as Ctrl-C: the socket file is removed
+    signal.signal(signal.SIGTERM, _raise_exit)
+    with SolverServer(socket_file, workers) as server:
+        if on_ready:
+            on_ready(server)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+class Client:
+    """
+    Connection to a running server, sending one request at a time:
+
+      with Client() as client:
+          response = client.solve(2022, 5, 1, text)
+    """
+
+    def __init__(self, socket_file=SOCKET_FILE):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(str(socket_file))
+        self.file = self.sock.makefile("rwb")
+
+    def solve(self, year, day, part, text):
+        request = {"year": year, "day": day, "part": part, "input": text}
+        self.file.write(json.dumps(request).encode() + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("the server closed the connection")
+
+        return json.loads(line)
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+#
+# Periodic snapshots of the long simulations, to resume an interrupted run
+#
+
+"""
+Some parts simulate many rounds (10,000 rounds of monkeys, 10 rounds of mixing, cycles of tilts...). When one of them
+is interrupted (Ctrl-C, --timeout), the next run starts over from the first round. With the snapshots enabled, such a
+part saves its state every few seconds, and a run with --resume continues from the last state saved:
+
+  snapshot = Snapshot("rounds")
+  first_round = 0
+  if (state := snapshot.restore()) is not None:
+      first_round, items = int(state["round"]), state["items"].tolist()
+  for n in range(first_round, 10000):
+      ...
+      if snapshot.due():
+          snapshot.save(round=n + 1, items=items)
+  snapshot.discard()
+
+The state is saved as a set of NumPy arrays (np.savez), not as a pickle of the objects of the part: the part decides
+what its state is made of and how to rebuild its objects from it. A snapshot is keyed by the version of the day module
+(see cache.module_version), the part and its input, so a modified module or another input never resumes from it.
+
+The runner enables the snapshots while a part runs (python -m aoc run --snapshots / --resume, see snapshots()). They
+are disabled otherwise: Snapshot.due() is then always false and restore() returns None.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from aoc import cache, days
+
+SNAPSHOT_DIR = days.ROOT / ".aoc" / "snapshots"
+
+# Default time between 2 snapshots of a part, in seconds
+INTERVAL = 10.0
+
+# Snapshots of the running part: their directory (None when disabled), the key of the part, whether to resume from
+# them and the time between 2 snapshots
+snapshot_dir = None
+snapshot_key = None
+resume = False
+interval = INTERVAL
+
+
+def part_key(module, part, text):
+    digest = hashlib.sha256(cache.module_version(module).encode())
+    digest.update(f"part{part}".encode())
+    digest.update(text.encode())
+
+    return digest.hexdigest()
+
+
+@contextmanager
+def snapshots(directory, key, resume_from=False, every=None):
+    # Enable the snapshots in the block, stored in directory under the key of the part (None leaves them disabled)
+    # They are taken every INTERVAL seconds by default.
+    global snapshot_dir, snapshot_key, resume, interval
+    previous = snapshot_dir, snapshot_key, resume, interval
+    snapshot_dir, snapshot_key, resume, interval = directory, key, resume_from, INTERVAL if every is None else every
+    try:
+        yield
+    finally:
+        snapshot_dir, snapshot_key, resume, interval = previous
+
+
+class Snapshot:
+    def __init__(self, name, enabled=True):
+        # name identifies the snapshot among the ones of the part, a part whose state can't be saved this time (it
+        # doesn't fit in the arrays...) gives enabled=False
+        self.file = Path(snapshot_dir) / f"{snapshot_key}_{name}.npz" if snapshot_dir and enabled else None
+        self.resume = resume
+        self.interval = interval
+        self.last = time.monotonic()
+
+    def restore(self):
+        # Return the arrays saved by the last run as a dict, or None when there is nothing to resume from
+        if self.file is None or not self.resume:
+            return None
+
+        import numpy as np
+        try:
+            with np.load(self.file, allow_pickle=False) as f:
+                return {name: f[name] for name in f.files}
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self.file.unlink(missing_ok=True)
+            return None
+
+    def due(self):
+        # Whether the interval has elapsed since the last snapshot, always false when the snapshots are disabled
+        return self.file is not None and time.monotonic() - self.last >= self.interval
+
+    def save(self, **arrays):
+        # Save the state given as arrays (or values NumPy converts to arrays), replacing the previous snapshot
+        import numpy as np
+
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, an interruption during the write must not lose the previous snapshot
+        fd, tmp = tempfile.mkstemp(dir=self.file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, self.file)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.last = time.monotonic()
+
+    def discard(self):
+        # Remove the snapshot once the simulation is over
+        if self.file is not None:
+            self.file.unlink(missing_ok=True)
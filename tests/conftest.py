@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+#
+# Shared setup of the tests of the aoc package: python -m pytest tests
+#
+
+import sys
+from pathlib import Path
+
+# Make the shared aoc package importable whatever the directory pytest is run from
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# Tests of aoc.bfs, checked against a breadth-first search over Python dicts
+#
+
+import random
+
+import numpy as np
+import pytest
+
+from aoc.bfs import cells, distance_map, flood_fill, path_counts, spread_labels, to_mask
+
+SEEDS = range(200)
+
+
+def neighbours(cell, shape, axes=None):
+    # The orthogonal neighbours of a cell inside the grid, along the axes (all of them by default)
+    for axis in range(len(shape)) if axes is None else axes:
+        for delta in (-1, 1):
+            neighbour = list(cell)
+            neighbour[axis] += delta
+            if 0 <= neighbour[axis] < shape[axis]:
+                yield tuple(neighbour)
+
+
+def expected_search(sources, passable_at):
+    # The distance and the number of shortest paths of the cells reached from the sources, as dicts
+    shape = sources.shape
+    frontier = [tuple(cell) for cell in cells(sources).tolist()]
+    distances = {cell: 0 for cell in frontier}
+    counts = {cell: 1 for cell in frontier}
+    step = 0
+    while frontier:
+        step += 1
+        passable = passable_at(step)
+        reached = {}
+        for cell in frontier:
+            for neighbour in neighbours(cell, shape):
+                if passable[neighbour] and neighbour not in distances:
+                    reached[neighbour] = reached.get(neighbour, 0) + counts[cell]
+        distances.update((cell, step) for cell in reached)
+        counts.update(reached)
+        frontier = list(reached)
+
+    return distances, counts
+
+
+def random_grid(rng, ndim=2):
+    shape = tuple(rng.randint(1, 8) for _ in range(ndim))
+    np_rng = np.random.default_rng(rng.randrange(2 ** 32))
+    passable = np_rng.random(shape) < rng.uniform(0.3, 0.9)
+    sources = np_rng.random(shape) < 0.1
+
+    return sources, passable
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_searches(seed, ndim):
+    sources, passable = random_grid(random.Random(seed), ndim)
+    distances, counts = expected_search(sources, lambda step: passable)
+
+    expected_distances = np.full(sources.shape, -1)
+    expected_counts = np.zeros(sources.shape, dtype=np.int64)
+    for cell, distance in distances.items():
+        expected_distances[cell] = distance
+        expected_counts[cell] = counts[cell]
+
+    assert np.array_equal(distance_map(sources, passable), expected_distances)
+    assert np.array_equal(path_counts(sources, passable), expected_counts)
+    assert np.array_equal(flood_fill(sources, passable), expected_distances >= 0)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_path_counts_by_step(seed):
+    # The cells of height n can only be entered at the step n, like the trails of 2024 day 10
+    rng = random.Random(seed)
+    heights = np.random.default_rng(seed).integers(0, 4, size=(rng.randint(1, 8), rng.randint(1, 8)))
+    _, counts = expected_search(heights == 0, lambda step: heights == step)
+
+    expected = np.zeros(heights.shape, dtype=np.int64)
+    for cell, count in counts.items():
+        expected[cell] = count
+
+    assert np.array_equal(path_counts(heights == 0, lambda step: heights == step), expected)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_spread_labels(seed):
+    rng = random.Random(seed)
+    _, passable = random_grid(rng)
+    labels = np.array([rng.choice([0, 0, 1 << rng.randrange(64)]) for _ in range(passable.size)],
+                      dtype=np.uint64).reshape(passable.shape)
+
+    expected = np.zeros(labels.shape, dtype=np.uint64)
+    for cell in np.ndindex(labels.shape):
+        if passable[cell]:
+            for neighbour in neighbours(cell, labels.shape):
+                expected[cell] |= labels[neighbour]
+
+    assert np.array_equal(spread_labels(labels, passable), expected)
+    assert np.array_equal(spread_labels(labels), spread_labels(labels, np.ones(labels.shape, dtype=bool)))
+
+
+def test_spread_labels_along_axes():
+    # Each grid of a stack is spread on its own
+    labels = np.zeros((2, 3, 3), dtype=np.uint64)
+    labels[0, 1, 1] = 1
+    labels[1, 0, 0] = 2
+    reached = spread_labels(labels, axes=(1, 2))
+
+    assert cells(reached[0]).tolist() == [[0, 1], [1, 0], [1, 2], [2, 1]]
+    assert set(reached[0][reached[0] != 0].tolist()) == {1}
+    assert cells(reached[1]).tolist() == [[0, 1], [1, 0]]
+    assert set(reached[1][reached[1] != 0].tolist()) == {2}
+
+
+def test_to_mask():
+    mask = to_mask((3, 4), [(0, 1), (2, 3)])
+
+    assert mask.dtype == bool
+    assert cells(mask).tolist() == [[0, 1], [2, 3]]
+    assert not to_mask((2, 2), []).any()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# Tests of aoc.intervals, checked against plain Python sets of integers
+#
+
+import random
+
+import numpy as np
+import pytest
+
+from aoc.intervals import IntervalSet
+
+SEEDS = range(300)
+
+
+def random_intervals(rng):
+    # Random intervals [start, end) with negative bounds, empty, touching and overlapping intervals
+    starts = [rng.randint(-20, 20) for _ in range(rng.randint(0, 6))]
+    ends = [start + rng.randint(-2, 8) for start in starts]
+    return starts, ends
+
+
+def expected_set(starts, ends):
+    # The integers of the intervals, as a plain set
+    return {value for start, end in zip(starts, ends) for value in range(start, end)}
+
+
+def integers(intervals):
+    # The integers of an IntervalSet, as a plain set
+    return {value for start, end in intervals for value in range(start, end)}
+
+
+def check_canonical(intervals):
+    # The intervals are sorted, non-empty, and neither overlap nor touch
+    bounds = list(intervals)
+    assert all(start < end for start, end in bounds)
+    assert all(end < next_start for (_, end), (next_start, _) in zip(bounds, bounds[1:]))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_build(seed):
+    rng = random.Random(seed)
+    starts, ends = random_intervals(rng)
+    intervals = IntervalSet(starts, ends)
+
+    check_canonical(intervals)
+    assert integers(intervals) == expected_set(starts, ends)
+    assert intervals.length == len(expected_set(starts, ends))
+    assert bool(intervals) == bool(expected_set(starts, ends))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_operations(seed):
+    rng = random.Random(seed)
+    a, b = random_intervals(rng), random_intervals(rng)
+    set_a, set_b = expected_set(*a), expected_set(*b)
+    intervals_a, intervals_b = IntervalSet(*a), IntervalSet(*b)
+
+    for result, expected in [(intervals_a | intervals_b, set_a | set_b),
+                             (intervals_a & intervals_b, set_a & set_b),
+                             (intervals_a - intervals_b, set_a - set_b),
+                             (intervals_b - intervals_a, set_b - set_a)]:
+        check_canonical(result)
+        assert integers(result) == expected
+        assert result.length == len(expected)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_contains(seed):
+    rng = random.Random(seed)
+    starts, ends = random_intervals(rng)
+    expected = expected_set(starts, ends)
+    intervals = IntervalSet(starts, ends)
+    values = np.arange(-25, 35)
+
+    assert [value in intervals for value in values.tolist()] == [value in expected for value in values.tolist()]
+    assert intervals.contains(values).tolist() == [value in expected for value in values.tolist()]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_shift(seed):
+    rng = random.Random(seed)
+    starts, ends = random_intervals(rng)
+    offset = rng.randint(-30, 30)
+    shifted = IntervalSet(starts, ends).shift(offset)
+
+    check_canonical(shifted)
+    assert integers(shifted) == {value + offset for value in expected_set(starts, ends)}
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_from_inclusive(seed):
+    rng = random.Random(seed)
+    ranges = [(first, first + rng.randint(-1, 6)) for first in (rng.randint(-20, 20) for _ in range(rng.randint(0, 5)))]
+    intervals = IntervalSet.from_inclusive(ranges)
+
+    check_canonical(intervals)
+    assert integers(intervals) == {value for first, last in ranges for value in range(first, last + 1)}
+
+
+def test_touching_intervals_are_merged():
+    assert list(IntervalSet([0, 3, -5], [3, 5, 0])) == [(-5, 5)]
+    assert list(IntervalSet.from_inclusive([(1, 2), (3, 4)])) == [(1, 5)]
+    assert list(IntervalSet([0], [3]) | IntervalSet([3], [6])) == [(0, 6)]
+
+
+def test_empty():
+    empty = IntervalSet()
+    intervals = IntervalSet([2, 7], [2, 5])
+
+    assert not empty and len(empty) == 0 and empty.length == 0
+    assert intervals == empty
+    assert 0 not in empty
+    assert empty.contains([0, 1]).tolist() == [False, False]
+    assert empty | empty == empty and empty & IntervalSet([0], [5]) == empty
+    assert IntervalSet([0], [5]) - empty == IntervalSet([0], [5])
+
+
+def test_bounds():
+    intervals = IntervalSet([-10, 4], [-3, 9])
+
+    assert [value for value in range(-12, 12) if value in intervals] == list(range(-10, -3)) + list(range(4, 9))
+    assert intervals.min() == -10
+    assert intervals.max() == 8
+    assert intervals.length == 12
+    assert len(intervals) == 2
+
+
+def test_mismatched_bounds():
+    with pytest.raises(ValueError):
+        IntervalSet([0, 1], [2])
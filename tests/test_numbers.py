@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# Tests of aoc.numbers, checked against a regular expression run line by line
+#
+
+import random
+import re
+
+import pytest
+
+from aoc.numbers import MAX_DIGITS, parse_ints, split_lists, split_rows
+
+SEEDS = range(300)
+
+# An integer, with its "-" sign unless the "-" follows a digit
+INTEGER = re.compile(r"(?:(?<![0-9])-)?[0-9]+")
+
+
+def random_text(rng):
+    # Random lines of integers, signs, ranges and text, with blank lines and with or without a last line break
+    pieces = ["-", "--", ",", " ", "x=", "y=-", "..", "abc", "\n", "\n\n", "\r\n"]
+    text = ""
+    for _ in range(rng.randint(0, 20)):
+        # 2 integers are never next to each other, they would be read as a single one
+        if rng.random() < 0.5 and not text[-1:].isdigit():
+            text += str(rng.randint(0, 10 ** rng.randint(1, MAX_DIGITS) - 1))
+        else:
+            text += rng.choice(pieces)
+
+    return text
+
+
+def expected_lines(text):
+    # The integers of each line, a last line without a line break is a line too
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+
+    return [[int(match) for match in INTEGER.findall(line)] for line in lines]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_parse_ints(seed):
+    text = random_text(random.Random(seed))
+    expected = [value for line in expected_lines(text) for value in line]
+
+    assert parse_ints(text).tolist() == expected
+    assert parse_ints(text.encode()).tolist() == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_split_lines(seed):
+    text = random_text(random.Random(seed))
+    values, offsets = parse_ints(text, line_offsets=True)
+    expected = expected_lines(text)
+
+    assert split_lists(values, offsets) == expected
+    assert [row.tolist() for row in split_rows(values, offsets)] == expected
+
+
+def test_signs():
+    assert parse_ints("x=-2, y=3-5 --7 a-1 -").tolist() == [-2, 3, 5, -7, -1]
+    assert parse_ints("-12\n-3").tolist() == [-12, -3]
+
+
+def test_docstring_example():
+    values, offsets = parse_ints("Sensor at x=2, y=-18\n1 2 3\n\n7\n", line_offsets=True)
+
+    assert values.tolist() == [2, -18, 1, 2, 3, 7]
+    assert offsets.tolist() == [0, 2, 5, 5, 6]
+    assert split_lists(values, offsets) == [[2, -18], [1, 2, 3], [], [7]]
+
+
+def test_empty():
+    values, offsets = parse_ints("", line_offsets=True)
+
+    assert values.tolist() == [] and offsets.tolist() == [0]
+    assert split_lists(values, offsets) == []
+    assert split_lists(*parse_ints("no integer\n", line_offsets=True)) == [[]]
+
+
+def test_largest_integers():
+    largest = 10 ** MAX_DIGITS - 1
+    assert parse_ints(f"{largest} -{largest}").tolist() == [largest, -largest]
+    with pytest.raises(ValueError):
+        parse_ints(str(10 ** MAX_DIGITS))